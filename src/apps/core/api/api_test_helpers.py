@@ -2,6 +2,7 @@ import logging
 
 from core.factories import VerifiedUserFactory
 from core.models import User
+from django.core.cache import caches
 from django.test.testcases import TestCase
 from rest_framework import status
 from rest_framework.test import APIRequestFactory, APITestCase
@@ -19,6 +20,9 @@ class APITestBase(APITestCase):
 
     def setUp(self) -> None:
         logging.disable(logging.CRITICAL)
+        # Catalog versions are rows rolled back after every test, so cached
+        # responses would otherwise leak into the next test under them.
+        caches["catalog"].clear()
         self.user: User = VerifiedUserFactory(password="root1234")  # nosec
 
         refresh = RefreshToken.for_user(self.user)
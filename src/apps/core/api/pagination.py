@@ -0,0 +1,17 @@
+from core.helpers import build_localized_sort_key
+from modeltranslation.utils import get_language
+from rest_framework.pagination import CursorPagination
+
+
+class NameCursorPagination(CursorPagination):
+    ordering = ("sort_name", "pk")
+    page_size_query_param = "limit"
+    max_page_size = 100
+
+    # The cursor position is compared in SQL, so it runs over a non-null name
+    # in the request language rather than the nullable translated column.
+    def paginate_queryset(self, queryset, request, view=None):
+        queryset = queryset.annotate(
+            sort_name=build_localized_sort_key("name", get_language())
+        )
+        return super().paginate_queryset(queryset, request, view)
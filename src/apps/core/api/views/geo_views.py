@@ -1,10 +1,10 @@
 from core.api.serializers import CountrySerializer, RegionSerializer
+from core.helpers import CachedCatalogListAPIView
 from core.models import Country, Region
 from django.utils.translation import gettext_lazy as _
 from django_filters import rest_framework as filters
 from drf_spectacular.utils import OpenApiParameter, extend_schema
 from rest_framework.filters import SearchFilter
-from rest_framework.generics import ListAPIView
 from rest_framework.permissions import AllowAny
 
 
@@ -18,8 +18,9 @@ from rest_framework.permissions import AllowAny
         ),
     ],
 )
-class CountryListView(ListAPIView):
+class CountryListView(CachedCatalogListAPIView):
     permission_classes = [AllowAny]
+    catalog_cache_namespace = "countries"
     serializer_class = CountrySerializer
     queryset = Country.objects.all().order_by("name")
     filter_backends = [SearchFilter]
@@ -42,8 +43,10 @@ class CountryListView(ListAPIView):
         ),
     ],
 )
-class RegionListView(ListAPIView):
+class RegionListView(CachedCatalogListAPIView):
     permission_classes = [AllowAny]
+    catalog_cache_namespace = "regions"
+    catalog_cache_params = ("country_id",)
     serializer_class = RegionSerializer
     filter_backends = [filters.DjangoFilterBackend, SearchFilter]
     search_fields = ["name"]
@@ -1,4 +1,5 @@
 from .admin_helpers import get_admin_image, get_admin_path, get_admin_reference
 from .storage_helpers import handle_storage
 from .serializers import UUIDModelSerializerMixin
-from .views import UUIDDestroyAPIView, UUIDUpdateAPIView
+from .translation_helpers import build_localized_sort_key
+from .views import CachedCatalogListAPIView, UUIDDestroyAPIView, UUIDUpdateAPIView
@@ -0,0 +1,14 @@
+from django.conf import settings
+from django.db.models import CharField, F, Value
+from django.db.models.functions import Coalesce
+
+
+def build_localized_sort_key(field: str, language: str) -> Coalesce:
+    # Translations are optional, so rows without one sort by the default
+    # language and never by NULL.
+    return Coalesce(
+        F(f"{field}_{language}"),
+        F(f"{field}_{settings.MODELTRANSLATION_DEFAULT_LANGUAGE}"),
+        Value(""),
+        output_field=CharField(),
+    )
@@ -1,4 +1,11 @@
-from rest_framework.generics import DestroyAPIView, UpdateAPIView
+from typing import Set, Tuple
+
+from core.services.catalog_response_cache import CatalogResponseCache
+from django.http import HttpResponse
+from django.utils.cache import patch_vary_headers
+from rest_framework.filters import SearchFilter
+from rest_framework.generics import DestroyAPIView, ListAPIView, UpdateAPIView
+from rest_framework.renderers import JSONRenderer
 
 
 class UUIDUpdateAPIView(UpdateAPIView):
@@ -7,3 +14,51 @@ class UUIDUpdateAPIView(UpdateAPIView):
 
 class UUIDDestroyAPIView(DestroyAPIView):
     lookup_field = "uuid"
+
+
+class CachedCatalogListAPIView(ListAPIView):
+    catalog_cache_namespace: str = ""
+    # Query parameters read by the view itself, on top of the ones used by its
+    # filter backends and paginator.
+    catalog_cache_params: Tuple[str, ...] = ()
+    pagination_params = (
+        "cursor_query_param",
+        "page_query_param",
+        "page_size_query_param",
+        "limit_query_param",
+        "offset_query_param",
+    )
+
+    def get_catalog_cache_params(self) -> Set[str]:
+        params = set(self.catalog_cache_params)
+        for backend in self.filter_backends:
+            if issubclass(backend, SearchFilter):
+                params.add(backend.search_param)
+        filterset_class = getattr(self, "filterset_class", None)
+        if filterset_class is not None:
+            params.update(filterset_class.base_filters)
+        if self.paginator is not None:
+            params.update(
+                getattr(self.paginator, name)
+                for name in self.pagination_params
+                if getattr(self.paginator, name, None)
+            )
+        return params
+
+    def render_list(self, request, *args, **kwargs) -> bytes:
+        response = super().list(request, *args, **kwargs)
+        return JSONRenderer().render(response.data)
+
+    def list(self, request, *args, **kwargs):
+        if request.user.is_authenticated:
+            return super().list(request, *args, **kwargs)
+
+        content = CatalogResponseCache.get_or_build(
+            self.catalog_cache_namespace,
+            request,
+            self.get_catalog_cache_params(),
+            lambda: self.render_list(request, *args, **kwargs),
+        )
+        response = HttpResponse(content, content_type="application/json")
+        patch_vary_headers(response, ["Accept-Language"])
+        return response
@@ -0,0 +1,314 @@
+import json
+import random
+import statistics
+import time
+import tracemalloc
+import uuid
+from pathlib import Path
+from typing import Callable, Dict, List
+
+from core.models import User
+from core.services.affinity_calculator import AffinityCalculator
+from core.services.affinity_matrix_calculator import AffinityMatrixCalculator
+from core.services.vectorized_affinity_calculator import VectorizedAffinityCalculator
+from django.core.management.base import BaseCommand, CommandError
+from django.db import transaction
+from django.db.models import Max
+from ideology.api.serializers import AffinitySerializer
+from ideology.models import (
+    CompletedAnswer,
+    IdeologyAbstractionComplexity,
+    IdeologyAxis,
+    IdeologyConditioner,
+    IdeologySection,
+    IdeologySectionConditioner,
+    UserAxisAnswer,
+    UserConditionerAnswer,
+)
+from ideology.services.calculation_dto import CalculationItem
+from ideology.services.structure_index import StructureIndex
+
+CONDITIONER_VALUES = ["Option A", "Option B", "indifferent"]
+
+
+class Command(BaseCommand):
+    help = (
+        "Times the affinity pipeline (mapping, calculation and serialization) over a "
+        "synthetic hierarchy and compares the medians with a stored baseline."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--complexities", type=int, default=4)
+        parser.add_argument(
+            "--sections", type=int, default=5, help="Sections per complexity."
+        )
+        parser.add_argument("--axes", type=int, default=16, help="Axes per section.")
+        parser.add_argument(
+            "--conditioners", type=int, default=2, help="Conditioners per section."
+        )
+        parser.add_argument(
+            "--targets",
+            type=int,
+            default=50,
+            help="Targets scored by the matrix calculator.",
+        )
+        parser.add_argument("--repeat", type=int, default=20)
+        parser.add_argument("--seed", type=int, default=42)
+        parser.add_argument(
+            "--baseline", default=None, help="JSON file holding the stored baselines."
+        )
+        parser.add_argument(
+            "--save-baseline",
+            action="store_true",
+            help="Store the results as the new baseline instead of comparing.",
+        )
+        parser.add_argument(
+            "--threshold",
+            type=float,
+            default=0.2,
+            help="Allowed slowdown over the baseline before failing (0.2 = 20%%).",
+        )
+
+    def handle(self, *args, **options):
+        shape = "x".join(
+            str(options[dimension])
+            for dimension in ("complexities", "sections", "axes", "conditioners")
+        )
+        rng = random.Random(options["seed"])  # nosec B311
+
+        self.stdout.write(
+            f"Synthetic tree {shape} (complexities x sections x axes x conditioners), "
+            f"{options['targets']} targets, {options['repeat']} runs"
+        )
+
+        try:
+            with transaction.atomic():
+                tree = self._create_tree(options)
+                StructureIndex.invalidate()
+                results = self._run(rng, tree, options)
+                transaction.set_rollback(True)
+        finally:
+            StructureIndex.invalidate()
+
+        retained = results.pop("retained_kib")
+        for name, median in results.items():
+            self.stdout.write(f"{name:<30} {median:10.3f} ms")
+        self.stdout.write(f"{'mapped_answers_retained':<30} {retained:10.1f} KiB")
+
+        if options["baseline"]:
+            self._handle_baseline(
+                Path(options["baseline"]),
+                f"{shape}:{options['targets']}",
+                results,
+                options,
+            )
+
+    @staticmethod
+    def _create_tree(options) -> Dict[str, List]:
+        token = uuid.uuid4().hex[:8]
+        first_complexity = (
+            IdeologyAbstractionComplexity.objects.aggregate(Max("complexity"))[
+                "complexity__max"
+            ]
+            or 0
+        ) + 1
+
+        complexities = IdeologyAbstractionComplexity.objects.bulk_create(
+            IdeologyAbstractionComplexity(
+                name=f"Benchmark {token} {index}",
+                complexity=first_complexity + index,
+            )
+            for index in range(options["complexities"])
+        )
+        sections = IdeologySection.objects.bulk_create(
+            IdeologySection(
+                name=f"Benchmark {token} {complexity.complexity}.{index}",
+                abstraction_complexity=complexity,
+            )
+            for complexity in complexities
+            for index in range(options["sections"])
+        )
+        axes = IdeologyAxis.objects.bulk_create(
+            IdeologyAxis(name=f"Benchmark axis {index}", section=section)
+            for section in sections
+            for index in range(options["axes"])
+        )
+        conditioners = IdeologyConditioner.objects.bulk_create(
+            IdeologyConditioner(
+                name=f"Benchmark {token} {index}",
+                type=IdeologyConditioner.ConditionerType.CATEGORICAL,
+                accepted_values=CONDITIONER_VALUES[:2],
+            )
+            for index in range(len(sections) * options["conditioners"])
+        )
+        IdeologySectionConditioner.objects.bulk_create(
+            IdeologySectionConditioner(
+                section=sections[index // options["conditioners"]],
+                conditioner=conditioner,
+                name=f"Benchmark rule {index}",
+                condition_values=CONDITIONER_VALUES[:1],
+            )
+            for index, conditioner in enumerate(conditioners)
+        )
+        return {"axes": axes, "conditioners": conditioners}
+
+    @staticmethod
+    def _generate_answers(rng: random.Random, tree: Dict[str, List]) -> Dict:
+        axis_answers = []
+        for axis in tree["axes"]:
+            is_indifferent = rng.random() < 0.05
+            axis_answers.append(
+                {
+                    "uuid": axis.uuid.hex,
+                    "value": None if is_indifferent else rng.randint(-100, 100),
+                    "is_indifferent": is_indifferent,
+                    "margin_left": rng.randint(0, 30),
+                    "margin_right": rng.randint(0, 30),
+                }
+            )
+        return {
+            "axis": axis_answers,
+            "conditioners": [
+                {"uuid": conditioner.uuid.hex, "value": rng.choice(CONDITIONER_VALUES)}
+                for conditioner in tree["conditioners"]
+            ],
+        }
+
+    @staticmethod
+    def _create_user_answers(answers: Dict) -> User:
+        token = uuid.uuid4().hex[:12]
+        user = User.objects.create(
+            username=f"benchmark-{token}", email=f"benchmark-{token}@example.com"
+        )
+        axes = IdeologyAxis.objects.in_bulk(
+            [item["uuid"] for item in answers["axis"]], field_name="uuid"
+        )
+        conditioners = IdeologyConditioner.objects.in_bulk(
+            [item["uuid"] for item in answers["conditioners"]], field_name="uuid"
+        )
+        UserAxisAnswer.objects.bulk_create(
+            UserAxisAnswer(
+                user=user,
+                axis=axes[uuid.UUID(item["uuid"])],
+                value=item["value"],
+                is_indifferent=item["is_indifferent"],
+                margin_left=item["margin_left"],
+                margin_right=item["margin_right"],
+            )
+            for item in answers["axis"]
+        )
+        UserConditionerAnswer.objects.bulk_create(
+            UserConditionerAnswer(
+                user=user,
+                conditioner=conditioners[uuid.UUID(item["uuid"])],
+                answer=item["value"],
+            )
+            for item in answers["conditioners"]
+        )
+        return user
+
+    @staticmethod
+    def _median_ms(function: Callable, repeat: int) -> float:
+        timings = []
+        for _ in range(repeat):
+            start = time.perf_counter()
+            function()
+            timings.append((time.perf_counter() - start) * 1000)
+        return statistics.median(timings)
+
+    def _run(self, rng: random.Random, tree: Dict[str, List], options) -> Dict:
+        repeat = options["repeat"]
+        source_answer = CompletedAnswer(answers=self._generate_answers(rng, tree))
+        target_answers = [
+            CompletedAnswer(answers=self._generate_answers(rng, tree))
+            for _ in range(max(options["targets"], 1))
+        ]
+        user = self._create_user_answers(source_answer.answers)
+
+        structure_version = StructureIndex.get_version()
+        source = source_answer.get_mapped_for_calculation()
+        target = target_answers[0].get_mapped_for_calculation()
+        targets = {
+            index: answer.get_mapped_for_calculation()
+            for index, answer in enumerate(target_answers)
+        }
+        detailed = VectorizedAffinityCalculator(source, target).calculate_detailed()
+        item_fields = [item.as_dict() for item in source.values()]
+
+        tracemalloc.start()
+        retained_items = [
+            answer.get_mapped_for_calculation() for answer in target_answers
+        ]
+        retained, _ = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        del retained_items
+
+        benchmarks = {
+            "structure_index_load": lambda: StructureIndex(structure_version),
+            "build_calculation_items": lambda: [
+                CalculationItem(**fields) for fields in item_fields
+            ],
+            "map_completed_answer": source_answer.get_mapped_for_calculation,
+            "map_user_answers": lambda: {
+                **UserAxisAnswer.objects.get_mapped_for_calculation(user),
+                **UserConditionerAnswer.objects.get_mapped_for_calculation(user),
+            },
+            "calculate_detailed": lambda: AffinityCalculator(
+                source, target
+            ).calculate_detailed(),
+            "calculate_detailed_vectorized": lambda: VectorizedAffinityCalculator(
+                source, target
+            ).calculate_detailed(),
+            "calculate_summary_vectorized": lambda: VectorizedAffinityCalculator(
+                source, target
+            ).calculate_detailed(VectorizedAffinityCalculator.DETAIL_SUMMARY),
+            "matrix_totals": lambda: AffinityMatrixCalculator(source).calculate_totals(
+                targets
+            ),
+            "serialize_detailed": lambda: AffinitySerializer(
+                {
+                    "target_user": None,
+                    **VectorizedAffinityCalculator.hydrate_affinity_structure(detailed),
+                }
+            ).data,
+        }
+        return {
+            **{
+                name: self._median_ms(function, repeat)
+                for name, function in benchmarks.items()
+            },
+            "retained_kib": retained / 1024 / len(target_answers),
+        }
+
+    def _handle_baseline(
+        self, path: Path, key: str, results: Dict[str, float], options
+    ) -> None:
+        baselines = json.loads(path.read_text()) if path.exists() else {}
+
+        if options["save_baseline"]:
+            baselines[key] = results
+            path.parent.mkdir(parents=True, exist_ok=True)
+            path.write_text(json.dumps(baselines, indent=2, sort_keys=True) + "\n")
+            self.stdout.write(f"Baseline for {key} saved to {path}")
+            return
+
+        baseline = baselines.get(key)
+        if not baseline:
+            self.stdout.write(f"No baseline stored for {key}, skipping comparison")
+            return
+
+        regressions = []
+        for name, median in results.items():
+            reference = baseline.get(name)
+            if not reference:
+                continue
+            ratio = median / reference
+            self.stdout.write(f"{name:<30} x{ratio:.2f} of baseline")
+            if ratio > 1 + options["threshold"]:
+                regressions.append(f"{name} ({reference:.3f} -> {median:.3f} ms)")
+
+        if regressions:
+            raise CommandError(
+                f"Regressions above {options['threshold']:.0%}: "
+                + ", ".join(regressions)
+            )
@@ -0,0 +1,23 @@
+# Generated by Django 6.0.1 on 2026-10-18 20:19
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("auth", "0012_alter_user_first_name_max_length"),
+        ("core", "0001_initial"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="user",
+            index=models.Index(
+                condition=models.Q(("is_verified", False)),
+                fields=["created"],
+                include=("email", "uuid"),
+                name="user_unverified_created_idx",
+            ),
+        ),
+    ]
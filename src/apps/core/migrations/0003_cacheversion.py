@@ -0,0 +1,32 @@
+# Generated by Django 6.0.1 on 2026-10-18 20:41
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("core", "0002_user_unverified_created_index"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="CacheVersion",
+            fields=[
+                (
+                    "name",
+                    models.CharField(
+                        max_length=64,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="Name",
+                    ),
+                ),
+                ("version", models.CharField(max_length=32, verbose_name="Version")),
+            ],
+            options={
+                "verbose_name": "Cache Version",
+                "verbose_name_plural": "Cache Versions",
+            },
+        ),
+    ]
@@ -0,0 +1,27 @@
+# Generated by Django 6.0.1 on 2026-10-18 21:18
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("auth", "0012_alter_user_first_name_max_length"),
+        ("core", "0003_cacheversion"),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name="user",
+            name="user_unverified_created_idx",
+        ),
+        migrations.AddIndex(
+            model_name="user",
+            index=models.Index(
+                condition=models.Q(("is_verified", False)),
+                fields=["created", "id"],
+                include=("email", "uuid"),
+                name="user_unverified_created_idx",
+            ),
+        ),
+    ]
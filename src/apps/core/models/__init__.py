@@ -1,3 +1,4 @@
 from .abstract import TimeStampedUUIDModel, UUIDModel, VisibleMixin
 from .user import User
 from .geo import Country, Region
+from .cache_version import CacheVersion
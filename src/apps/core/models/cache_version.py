@@ -0,0 +1,17 @@
+from core.models.managers import CacheVersionManager
+from django.db import models
+from django.utils.translation import gettext_lazy as _
+
+
+class CacheVersion(models.Model):
+    name = models.CharField(max_length=64, primary_key=True, verbose_name=_("Name"))
+    version = models.CharField(max_length=32, verbose_name=_("Version"))
+
+    objects = CacheVersionManager()
+
+    class Meta:
+        verbose_name = _("Cache Version")
+        verbose_name_plural = _("Cache Versions")
+
+    def __str__(self):
+        return f"{self.name}:{self.version}"
@@ -1,2 +1,3 @@
 from .user_managers import CustomUserManager
 from .mixins import VisibleManagerMixin
+from .cache_version_manager import CacheVersionManager
@@ -0,0 +1,28 @@
+import uuid
+from typing import Dict, Iterable
+
+from django.db import models
+
+
+class CacheVersionManager(models.Manager):
+    def get_versions(self, names: Iterable[str]) -> Dict[str, str]:
+        names = list(names)
+        versions = dict(self.filter(name__in=names).values_list("name", "version"))
+        return {name: versions.get(name, "") for name in names}
+
+    def get_version(self, name: str) -> str:
+        return self.get_versions([name])[name]
+
+    # The new versions only become visible to other processes once the
+    # surrounding transaction commits, so nobody caches uncommitted data
+    # under them. Rows are locked in name order to avoid deadlocks.
+    def bump(self, names: Iterable[str]) -> None:
+        self.bulk_create(
+            [
+                self.model(name=name, version=uuid.uuid4().hex)
+                for name in sorted(set(names))
+            ],
+            update_conflicts=True,
+            unique_fields=["name"],
+            update_fields=["version"],
+        )
@@ -1,46 +1,70 @@
 import logging
 import uuid
-from typing import Any
+from typing import Any, Callable
 
-import requests
+from asgiref.sync import async_to_sync
 from core.exceptions.user_exceptions import UserDisabledException
-from django.conf import settings
+from core.services.google_token_verifier import GoogleTokenVerifier
 from django.contrib.auth.base_user import BaseUserManager
-from django.db import transaction
+from django.db import IntegrityError, transaction
 from django.shortcuts import get_object_or_404
 from django.utils.translation import get_language
 from django.utils.translation import gettext_lazy as _
-from google.auth.transport import requests as google_requests
-from google.oauth2 import id_token
 
 logger = logging.getLogger(__name__)
 
 
 class CustomUserManager(BaseUserManager):
-    def _generate_unique_username(self):
-        while True:
-            username = f"{uuid.uuid4().hex[:10]}"
-            if not self.model.objects.filter(username=username).exists():
-                return username
+    username_attempts = 5
+
+    @staticmethod
+    def _generate_username() -> str:
+        return uuid.uuid4().hex[:10]
+
+    # Usernames are inserted optimistically: the unique constraint detects the
+    # rare collision, so a registration costs the same queries under load.
+    def _save_with_generated_username(self, save: Callable[[str], Any]):
+        for attempt in range(1, self.username_attempts + 1):
+            username = self._generate_username()
+            try:
+                with transaction.atomic():
+                    return save(username)
+            except IntegrityError:
+                if (
+                    attempt == self.username_attempts
+                    or not self.filter(username=username).exists()
+                ):
+                    raise
+                logger.info("Generated username '%s' already taken", username)
 
     def get_or_create(self, defaults=None, **kwargs):
         defaults = defaults or {}
-        if not kwargs.get("username") and not defaults.get("username"):
-            defaults["username"] = self._generate_unique_username()
-        return self.get_queryset().get_or_create(defaults=defaults, **kwargs)
+        if kwargs.get("username") or defaults.get("username"):
+            return self.get_queryset().get_or_create(defaults=defaults, **kwargs)
+        return self._save_with_generated_username(
+            lambda username: self.get_queryset().get_or_create(
+                defaults={**defaults, "username": username}, **kwargs
+            )
+        )
 
     def create_user(self, email, password, username=None, **extra_fields):
         if not email:
             raise ValueError(_("The Email must be set"))
         email = self.normalize_email(email)
-        if not username:
-            username = self._generate_unique_username()
         if extra_fields.get("auth_provider") != "google":
             extra_fields.setdefault("verification_uuid", uuid.uuid4())
-        with transaction.atomic():
-            user = self.model(email=email, username=username, **extra_fields)
-            user.set_password(password)
+        user = self.model(email=email, username=username, **extra_fields)
+        user.set_password(password)
+
+        def save(generated_username):
+            user.username = generated_username
             user.save()
+
+        with transaction.atomic():
+            if username:
+                user.save()
+            else:
+                self._save_with_generated_username(save)
             logger.info("User with mail '%s' registered", email)
             return user
 
@@ -105,42 +129,7 @@ class CustomUserManager(BaseUserManager):
         return self._provision_google_user(user_data)
 
     def _fetch_google_user_data(self, token: str) -> dict[str, str]:
-        try:
-            return self._validate_google_id_token(token)
-        except ValueError:
-            return self._validate_google_access_token(token)
-
-    @staticmethod
-    def _validate_google_id_token(token: str) -> dict[str, str]:
-        id_info = id_token.verify_oauth2_token(
-            token, google_requests.Request(), settings.GOOGLE_CLIENT_ID
-        )
-        return {
-            "email": id_info.get("email"),
-            "given_name": id_info.get("given_name", ""),
-            "family_name": id_info.get("family_name", ""),
-        }
-
-    @staticmethod
-    def _validate_google_access_token(token: str) -> dict[str, str]:
-        try:
-            response = requests.get(
-                "https://www.googleapis.com/oauth2/v3/userinfo",
-                headers={"Authorization": f"Bearer {token}"},
-                timeout=5,
-            )
-            if not response.ok:
-                logger.warning("Google UserInfo failed: %s", response.text)
-                raise ValueError("Invalid Google Token.")
-            google_info = response.json()
-            return {
-                "email": google_info.get("email"),
-                "given_name": google_info.get("given_name", ""),
-                "family_name": google_info.get("family_name", ""),
-            }
-        except Exception as exc:
-            logger.error("Error verifying Access Token: %s", exc)
-            raise ValueError("Invalid Google Token.") from exc
+        return async_to_sync(GoogleTokenVerifier.verify)(token)
 
     def _provision_google_user(self, google_data: dict[str, Any]):
         email = google_data.get("email")
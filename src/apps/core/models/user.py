@@ -78,6 +78,14 @@ class User(AbstractUser, TimeStampedUUIDModel, PermissionsMixin):
     class Meta:
         verbose_name = _("User")
         verbose_name_plural = _("Users")
+        indexes = [
+            models.Index(
+                fields=["created", "id"],
+                condition=models.Q(is_verified=False),
+                include=["email", "uuid"],
+                name="user_unverified_created_idx",
+            )
+        ]
 
     def __str__(self):
         return self.username
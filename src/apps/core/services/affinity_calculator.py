@@ -1,6 +1,7 @@
 from typing import Any, Dict, List, Optional
 
 from ideology.services.calculation_dto import CalculationItem
+from ideology.services.structure_index import StructureIndex
 
 
 class AffinityCalculator:
@@ -16,42 +17,30 @@ class AffinityCalculator:
     MAX_COND_POSITIVE_CAP = 15.0
     MAX_COND_NEGATIVE_CAP = 20.0
 
+    DETAIL_SUMMARY = "summary"
+    DETAIL_SECTIONS = "sections"
+    DETAIL_FULL = "full"
+    DETAIL_LEVELS = (DETAIL_SUMMARY, DETAIL_SECTIONS, DETAIL_FULL)
+
     def __init__(
         self, data_a: Dict[str, CalculationItem], data_b: Dict[str, CalculationItem]
     ):
         self.data_a = data_a
         self.data_b = data_b
 
-    def calculate_detailed(self) -> Dict[str, Any]:
-        all_keys = set(self.data_a.keys()) | set(self.data_b.keys())
-
-        hierarchy: dict = {}
-
-        for key in all_keys:
-            item = self.data_a.get(key) or self.data_b.get(key)
-            if not item:
-                continue
-
-            complexity_uuid = item.complexity_uuid
-            if not complexity_uuid:
-                continue
-
-            if complexity_uuid not in hierarchy:
-                hierarchy[complexity_uuid] = {
-                    "axes": [],
-                    "conditioners": [],
-                    "sections": {},
-                }
-
-            if item.type == "conditioner":
-                hierarchy[complexity_uuid]["conditioners"].append(key)
-            else:
-                hierarchy[complexity_uuid]["axes"].append(key)
-                section_uuid = item.section_uuid
-                if section_uuid:
-                    if section_uuid not in hierarchy[complexity_uuid]["sections"]:
-                        hierarchy[complexity_uuid]["sections"][section_uuid] = []
-                    hierarchy[complexity_uuid]["sections"][section_uuid].append(key)
+    def calculate_detailed(self, detail: str = DETAIL_FULL) -> Dict[str, Any]:
+        include_sections = detail != self.DETAIL_SUMMARY
+        include_axes = detail == self.DETAIL_FULL
+
+        hierarchy = self._build_hierarchy()
+        axis_scores = self._score_axes(
+            [
+                axis_key
+                for data in hierarchy.values()
+                for axis_keys in data["sections"].values()
+                for axis_key in axis_keys
+            ]
+        )
 
         final_level_scores = []
         formatted_complexities = []
@@ -67,33 +56,36 @@ class AffinityCalculator:
                 formatted_axes = []
 
                 for axis_key in axis_keys:
-                    score = self._calculate_axis_score(axis_key)
+                    score = axis_scores[axis_key]
                     if score is not None:
                         sec_sum += score
                         sec_count += 1
                         complexity_axis_sum += score
                         complexity_axis_count += 1
 
-                    user_a_dump = self.data_a.get(axis_key)
-                    user_b_dump = self.data_b.get(axis_key)
-
-                    formatted_axes.append(
-                        {
-                            "axis_uuid": axis_key,
-                            "affinity": round(score, 2) if score is not None else None,
-                            "user_a": user_a_dump.model_dump() if user_a_dump else None,
-                            "user_b": user_b_dump.model_dump() if user_b_dump else None,
-                        }
-                    )
+                    if include_axes:
+                        formatted_axes.append(
+                            {
+                                "axis_uuid": axis_key,
+                                "affinity": (
+                                    round(score, 2) if score is not None else None
+                                ),
+                                "user_a": self._dump_item(self.data_a.get(axis_key)),
+                                "user_b": self._dump_item(self.data_b.get(axis_key)),
+                            }
+                        )
+
+                if not include_sections:
+                    continue
 
                 sec_avg = (sec_sum / sec_count) if sec_count > 0 else None
-                section_results.append(
-                    {
-                        "section_uuid": section_uuid,
-                        "affinity": round(sec_avg, 2) if sec_avg is not None else None,
-                        "axes": formatted_axes,
-                    }
-                )
+                section_result = {
+                    "section_uuid": section_uuid,
+                    "affinity": round(sec_avg, 2) if sec_avg is not None else None,
+                }
+                if include_axes:
+                    section_result["axes"] = formatted_axes
+                section_results.append(section_result)
 
             base_affinity = (
                 (complexity_axis_sum / complexity_axis_count)
@@ -113,19 +105,19 @@ class AffinityCalculator:
                 )
                 final_level_scores.append(final_score)
 
-            formatted_complexities.append(
-                {
-                    "complexity_uuid": complexity_uuid,
-                    "base_affinity": (
-                        round(base_affinity, 2) if base_affinity is not None else None
-                    ),
-                    "conditioner_modifier": round(modifier, 2),
-                    "affinity": (
-                        round(final_score, 2) if final_score is not None else None
-                    ),
-                    "sections": section_results,
-                }
-            )
+            formatted_complexity = {
+                "complexity_uuid": complexity_uuid,
+                "base_affinity": (
+                    round(base_affinity, 2) if base_affinity is not None else None
+                ),
+                "conditioner_modifier": round(modifier, 2),
+                "affinity": (
+                    round(final_score, 2) if final_score is not None else None
+                ),
+            }
+            if include_sections:
+                formatted_complexity["sections"] = section_results
+            formatted_complexities.append(formatted_complexity)
 
         total_affinity = None
         if final_level_scores:
@@ -134,6 +126,48 @@ class AffinityCalculator:
 
         return {"total": total_affinity, "complexities": formatted_complexities}
 
+    def _build_hierarchy(self) -> Dict[str, Dict[str, Any]]:
+        all_keys = set(self.data_a.keys()) | set(self.data_b.keys())
+
+        hierarchy: dict = {}
+
+        for key in all_keys:
+            item = self.data_a.get(key) or self.data_b.get(key)
+            if not item:
+                continue
+
+            complexity_uuid = item.complexity_uuid
+            if not complexity_uuid:
+                continue
+
+            if complexity_uuid not in hierarchy:
+                hierarchy[complexity_uuid] = {
+                    "axes": [],
+                    "conditioners": [],
+                    "sections": {},
+                }
+
+            if item.type == "conditioner":
+                hierarchy[complexity_uuid]["conditioners"].append(key)
+            else:
+                hierarchy[complexity_uuid]["axes"].append(key)
+                section_uuid = item.section_uuid
+                if section_uuid:
+                    if section_uuid not in hierarchy[complexity_uuid]["sections"]:
+                        hierarchy[complexity_uuid]["sections"][section_uuid] = []
+                    hierarchy[complexity_uuid]["sections"][section_uuid].append(key)
+
+        return hierarchy
+
+    @staticmethod
+    def _dump_item(item: Optional[CalculationItem]) -> Optional[Dict[str, Any]]:
+        return item.as_dict() if item else None
+
+    def _score_axes(self, axis_keys: List[str]) -> Dict[str, Optional[float]]:
+        return {
+            axis_key: self._calculate_axis_score(axis_key) for axis_key in axis_keys
+        }
+
     def _calculate_conditioner_modifier(self, conditioner_keys: List[str]) -> float:
         current_bonus = 0.0
         current_penalty = 0.0
@@ -223,42 +257,15 @@ class AffinityCalculator:
 
     @staticmethod
     def hydrate_affinity_structure(affinity_data: Dict[str, Any]) -> Dict[str, Any]:
-        from ideology.models import (
-            IdeologyAbstractionComplexity,
-            IdeologyAxis,
-            IdeologySection,
-        )
-
-        complexity_uuids = {
-            complexity["complexity_uuid"]
-            for complexity in affinity_data["complexities"]
-        }
-        section_uuids = set()
-        axis_uuids = set()
+        structure = StructureIndex.get()
 
         for complexity in affinity_data["complexities"]:
-            for section in complexity["sections"]:
-                section_uuids.add(section["section_uuid"])
-                for axis in section["axes"]:
-                    axis_uuids.add(axis["axis_uuid"])
-
-        complexities = {
-            o.uuid.hex: o
-            for o in IdeologyAbstractionComplexity.objects.filter(
-                uuid__in=complexity_uuids
+            complexity["complexity"] = structure.complexities.get(
+                complexity["complexity_uuid"]
             )
-        }
-        sections = {
-            o.uuid.hex: o
-            for o in IdeologySection.objects.filter(uuid__in=section_uuids)
-        }
-        axes = {o.uuid.hex: o for o in IdeologyAxis.objects.filter(uuid__in=axis_uuids)}
-
-        for complexity in affinity_data["complexities"]:
-            complexity["complexity"] = complexities.get(complexity["complexity_uuid"])
-            for section in complexity["sections"]:
-                section["section"] = sections.get(section["section_uuid"])
-                for axis in section["axes"]:
-                    axis["axis"] = axes.get(axis["axis_uuid"])
+            for section in complexity.get("sections", []):
+                section["section"] = structure.sections.get(section["section_uuid"])
+                for axis in section.get("axes", []):
+                    axis["axis"] = structure.axes.get(axis["axis_uuid"])
 
         return affinity_data
@@ -0,0 +1,164 @@
+from typing import Any, Dict, Hashable, List, Optional, Tuple
+
+import numpy as np
+from ideology.services.calculation_dto import CalculationItem
+
+from .vectorized_affinity_calculator import AxisArrays, VectorizedAffinityCalculator
+
+
+class AffinityMatrixCalculator:
+    def __init__(self, source_data: Dict[str, CalculationItem]):
+        self.source_data = source_data
+        self.complexity_uuids: List[str] = []
+        self.axis_keys: List[str] = []
+        self.conditioner_keys: List[str] = []
+
+        complexity_positions: Dict[str, int] = {}
+        axis_complexities = []
+        conditioner_complexities = []
+
+        for key, item in source_data.items():
+            if not item or not item.complexity_uuid:
+                continue
+            if item.type != "conditioner" and not item.section_uuid:
+                continue
+
+            if item.complexity_uuid not in complexity_positions:
+                complexity_positions[item.complexity_uuid] = len(self.complexity_uuids)
+                self.complexity_uuids.append(item.complexity_uuid)
+            position = complexity_positions[item.complexity_uuid]
+
+            if item.type == "conditioner":
+                self.conditioner_keys.append(key)
+                conditioner_complexities.append(position)
+            else:
+                self.axis_keys.append(key)
+                axis_complexities.append(position)
+
+        self.axis_membership = self._build_membership(axis_complexities)
+        self.conditioner_membership = self._build_membership(conditioner_complexities)
+        self.source_axes = AxisArrays.pack(source_data, self.axis_keys)
+        self.source_conditioners = self._pack_conditioners(
+            [source_data], self.conditioner_keys
+        )
+
+    def _build_membership(self, positions: List[int]) -> np.ndarray:
+        membership = np.zeros((len(positions), len(self.complexity_uuids)))
+        membership[np.arange(len(positions)), positions] = 1.0
+        return membership
+
+    @staticmethod
+    def _pack_conditioners(
+        targets: List[Dict[str, CalculationItem]], conditioner_keys: List[str]
+    ) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        present = []
+        indifferent = []
+        values = []
+
+        for target in targets:
+            for key in conditioner_keys:
+                item = target.get(key)
+                present.append(bool(item))
+                indifferent.append(bool(item) and item.is_indifferent)
+                values.append(str(item.value or "").strip().lower() if item else "")
+
+        shape = (len(targets), len(conditioner_keys))
+        return (
+            np.array(present, dtype=bool).reshape(shape),
+            np.array(indifferent, dtype=bool).reshape(shape),
+            np.array(values, dtype=object).reshape(shape),
+        )
+
+    def _pack_target_axes(
+        self, targets: List[Dict[str, CalculationItem]]
+    ) -> AxisArrays:
+        shape = (len(targets), len(self.axis_keys))
+        packed = [AxisArrays.pack(target, self.axis_keys) for target in targets]
+        return AxisArrays(
+            *(
+                np.concatenate([getattr(row, field) for row in packed]).reshape(shape)
+                for field in AxisArrays._fields
+            )
+        )
+
+    def _calculate_complexity_scores(
+        self, targets: List[Dict[str, CalculationItem]]
+    ) -> np.ndarray:
+        target_axes = self._pack_target_axes(targets)
+        scores = VectorizedAffinityCalculator.score_arrays(
+            self.source_axes, target_axes
+        )
+        matched = ~np.isnan(scores)
+        axis_sums = np.where(matched, scores, 0.0) @ self.axis_membership
+        axis_counts = matched.astype(np.float64) @ self.axis_membership
+
+        source_present, source_indifferent, source_values = self.source_conditioners
+        present, indifferent, values = self._pack_conditioners(
+            targets, self.conditioner_keys
+        )
+        compared = source_present & present
+        equal = compared & (values == source_values)
+        bonus = np.where(
+            source_indifferent | indifferent,
+            VectorizedAffinityCalculator.COND_INDIFFERENT_BONUS,
+            VectorizedAffinityCalculator.COND_MATCH_BONUS,
+        )
+        bonuses = np.where(equal, bonus, 0.0) @ self.conditioner_membership
+        penalties = (
+            np.where(
+                compared & ~equal,
+                VectorizedAffinityCalculator.COND_MISMATCH_PENALTY,
+                0.0,
+            )
+            @ self.conditioner_membership
+        )
+        modifiers = np.minimum(
+            bonuses, VectorizedAffinityCalculator.MAX_COND_POSITIVE_CAP
+        ) - np.minimum(penalties, VectorizedAffinityCalculator.MAX_COND_NEGATIVE_CAP)
+
+        with np.errstate(divide="ignore", invalid="ignore"):
+            base_affinity = axis_sums / axis_counts
+        final_scores = np.clip(
+            base_affinity + modifiers,
+            VectorizedAffinityCalculator.MIN_AFFINITY,
+            VectorizedAffinityCalculator.MAX_AFFINITY,
+        )
+        return np.where(axis_counts > 0, final_scores, np.nan)
+
+    def calculate_totals(
+        self, targets: Dict[Hashable, Dict[str, CalculationItem]]
+    ) -> Dict[Hashable, Optional[float]]:
+        return {
+            key: summary["total"]
+            for key, summary in self.calculate_summaries(targets).items()
+        }
+
+    def calculate_summaries(
+        self, targets: Dict[Hashable, Dict[str, CalculationItem]]
+    ) -> Dict[Hashable, Dict[str, Any]]:
+        if not targets:
+            return {}
+
+        keys = list(targets.keys())
+        complexity_scores = self._calculate_complexity_scores(
+            [targets[key] for key in keys]
+        )
+        scored_counts = (~np.isnan(complexity_scores)).sum(axis=1)
+        with np.errstate(invalid="ignore"):
+            totals = np.nansum(complexity_scores, axis=1) / scored_counts
+
+        summaries = {}
+        for key, row, total, count in zip(
+            keys, complexity_scores.tolist(), totals.tolist(), scored_counts.tolist()
+        ):
+            summaries[key] = {
+                "total": round(total, 2) if count else None,
+                "complexities": [
+                    {
+                        "complexity_uuid": complexity_uuid,
+                        "affinity": round(score, 2) if score == score else None,
+                    }
+                    for complexity_uuid, score in zip(self.complexity_uuids, row)
+                ],
+            }
+        return summaries
@@ -0,0 +1,78 @@
+import hashlib
+from typing import Callable, Dict, Iterable, Tuple
+
+from django.apps import apps
+from django.core.cache import caches
+from django.utils.http import urlencode
+from django.utils.translation import get_language
+
+
+class CatalogResponseCache:
+    key_prefix = "catalog"
+    # Model mapped to the catalog namespaces its changes invalidate, filled by
+    # the signals module of each app.
+    namespaces: Dict[type, Tuple[str, ...]] = {}
+
+    @classmethod
+    def register(cls, namespaces: Dict[type, Tuple[str, ...]]) -> None:
+        for model, model_namespaces in namespaces.items():
+            cls.namespaces[model] = tuple(
+                dict.fromkeys(cls.namespaces.get(model, ()) + model_namespaces)
+            )
+
+    @classmethod
+    def get_version_name(cls, namespace: str) -> str:
+        return f"{cls.key_prefix}:{namespace}"
+
+    @classmethod
+    def get_version(cls, namespace: str) -> str:
+        CacheVersion = apps.get_model("core", "CacheVersion")
+        return CacheVersion.objects.get_version(cls.get_version_name(namespace))
+
+    @classmethod
+    def get_key(cls, namespace: str, request, params: Iterable[str]) -> str:
+        # Only the parameters the view reads are part of the key, so unknown
+        # ones cannot multiply the entries. Pagination links are absolute, so
+        # the host is part of the key as well.
+        query = urlencode(
+            sorted(
+                (name, request.query_params.getlist(name))
+                for name in set(params)
+                if name in request.query_params
+            ),
+            doseq=True,
+        )
+        location = hashlib.sha256(
+            f"{request.build_absolute_uri(request.path)}?{query}".encode("utf-8")
+        ).hexdigest()
+        return (
+            f"{cls.key_prefix}:{namespace}:{cls.get_version(namespace)}:"
+            f"{get_language()}:{location}"
+        )
+
+    @classmethod
+    def get_or_build(
+        cls,
+        namespace: str,
+        request,
+        params: Iterable[str],
+        build: Callable[[], bytes],
+    ) -> bytes:
+        cache = caches["catalog"]
+        key = cls.get_key(namespace, request, params)
+        content = cache.get(key)
+        if content is None:
+            content = build()
+            cache.set(key, content)
+        return content
+
+    @classmethod
+    def invalidate(cls, namespaces: Iterable[str]) -> None:
+        CacheVersion = apps.get_model("core", "CacheVersion")
+        CacheVersion.objects.bump(
+            cls.get_version_name(namespace) for namespace in namespaces
+        )
+
+    @classmethod
+    def invalidate_model(cls, model: type) -> None:
+        cls.invalidate(cls.namespaces[model])
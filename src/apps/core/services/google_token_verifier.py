@@ -0,0 +1,171 @@
+import asyncio
+import hashlib
+import logging
+import re
+import time
+from contextlib import asynccontextmanager
+from typing import AsyncIterator, Dict, Optional
+
+import httpx
+import jwt
+from django.conf import settings
+from django.core.cache import cache
+
+logger = logging.getLogger(__name__)
+
+MAX_AGE_PATTERN = re.compile(r"(?:^|,)\s*max-age\s*=\s*\"?(\d+)\"?", re.IGNORECASE)
+
+
+class GoogleTokenVerifier:
+    issuers = ["accounts.google.com", "https://accounts.google.com"]
+    userinfo_key_prefix = "google_userinfo"
+    # Bounds how often an unknown `kid` may force a JWKS refetch, so forged
+    # headers cannot turn every login into a call to Google.
+    refresh_interval = 60
+
+    _keys: Dict[str, jwt.PyJWK] = {}
+    _keys_expire_at = 0.0
+    _keys_fetched_at: Optional[float] = None
+    _server_loop: Optional[asyncio.AbstractEventLoop] = None
+    _client: Optional[httpx.AsyncClient] = None
+
+    @classmethod
+    def reset(cls) -> None:
+        cls._keys = {}
+        cls._keys_expire_at = 0.0
+        cls._keys_fetched_at = None
+        cls._server_loop = None
+        cls._client = None
+
+    @classmethod
+    def bind_server_loop(cls) -> None:
+        loop = asyncio.get_running_loop()
+        if cls._server_loop is not loop:
+            cls._server_loop = loop
+            cls._client = None
+
+    @staticmethod
+    def build_client() -> httpx.AsyncClient:
+        return httpx.AsyncClient(
+            timeout=settings.GOOGLE_HTTP_TIMEOUT,
+            limits=httpx.Limits(
+                max_connections=settings.GOOGLE_HTTP_MAX_CONNECTIONS,
+                max_keepalive_connections=settings.GOOGLE_HTTP_MAX_CONNECTIONS,
+            ),
+        )
+
+    # httpx pools are bound to the loop that opened them. The ASGI server loop
+    # lives as long as the process, so its client is shared; anywhere else
+    # async_to_sync runs each call on a throwaway loop, so the client is
+    # opened and closed with the call.
+    @classmethod
+    @asynccontextmanager
+    async def get_client(cls) -> AsyncIterator[httpx.AsyncClient]:
+        if asyncio.get_running_loop() is cls._server_loop:
+            if cls._client is None:
+                cls._client = cls.build_client()
+            yield cls._client
+        else:
+            async with cls.build_client() as client:
+                yield client
+
+    @staticmethod
+    def get_max_age(response: httpx.Response) -> int:
+        cache_control = response.headers.get("Cache-Control", "")
+        if re.search(r"no-store|no-cache", cache_control, re.IGNORECASE):
+            return 0
+        match = MAX_AGE_PATTERN.search(cache_control)
+        if not match:
+            return 0
+        try:
+            age = int(response.headers.get("Age", 0))
+        except ValueError:
+            age = 0
+        return max(int(match.group(1)) - age, 0)
+
+    @classmethod
+    async def refresh_keys(cls) -> None:
+        async with cls.get_client() as client:
+            response = await client.get(settings.GOOGLE_JWKS_URL)
+        response.raise_for_status()
+        key_set = jwt.PyJWKSet.from_dict(response.json())
+
+        now = time.monotonic()
+        cls._keys = {key.key_id: key for key in key_set.keys if key.key_id}
+        cls._keys_fetched_at = now
+        cls._keys_expire_at = now + cls.get_max_age(response)
+
+    @classmethod
+    async def get_signing_key(cls, key_id: str) -> jwt.PyJWK:
+        now = time.monotonic()
+        if now >= cls._keys_expire_at or (
+            key_id not in cls._keys
+            and (
+                cls._keys_fetched_at is None
+                or now - cls._keys_fetched_at >= cls.refresh_interval
+            )
+        ):
+            await cls.refresh_keys()
+
+        key = cls._keys.get(key_id)
+        if key is None:
+            raise ValueError("Unknown Google signing key.")
+        return key
+
+    @classmethod
+    async def verify_id_token(cls, token: str) -> Dict[str, str]:
+        try:
+            key_id = jwt.get_unverified_header(token).get("kid")
+            if not key_id:
+                raise ValueError("Google token has no key id.")
+            key = await cls.get_signing_key(key_id)
+            return jwt.decode(
+                token,
+                key=key.key,
+                algorithms=["RS256"],
+                audience=settings.GOOGLE_CLIENT_ID,
+                issuer=cls.issuers,
+            )
+        except (jwt.PyJWTError, httpx.HTTPError) as exc:
+            raise ValueError(str(exc)) from exc
+
+    @classmethod
+    def get_userinfo_key(cls, token: str) -> str:
+        digest = hashlib.sha256(token.encode("utf-8")).hexdigest()
+        return f"{cls.userinfo_key_prefix}:{digest}"
+
+    @classmethod
+    async def fetch_userinfo(cls, token: str) -> Dict[str, str]:
+        key = cls.get_userinfo_key(token)
+        userinfo = await cache.aget(key)
+        if userinfo is not None:
+            return userinfo
+
+        try:
+            async with cls.get_client() as client:
+                response = await client.get(
+                    settings.GOOGLE_USERINFO_URL,
+                    headers={"Authorization": f"Bearer {token}"},
+                )
+            if not response.is_success:
+                logger.warning("Google UserInfo failed: %s", response.text)
+                raise ValueError("Invalid Google Token.")
+            userinfo = response.json()
+        except (httpx.HTTPError, ValueError) as exc:
+            logger.error("Error verifying Access Token: %s", exc)
+            raise ValueError("Invalid Google Token.") from exc
+
+        await cache.aset(key, userinfo, timeout=settings.GOOGLE_USERINFO_CACHE_TIMEOUT)
+        return userinfo
+
+    @classmethod
+    async def verify(cls, token: str) -> Dict[str, str]:
+        try:
+            google_info = await cls.verify_id_token(token)
+        except ValueError:
+            google_info = await cls.fetch_userinfo(token)
+        return {
+            "email": google_info.get("email"),
+            "given_name": google_info.get("given_name", ""),
+            "family_name": google_info.get("family_name", ""),
+        }
@@ -0,0 +1,110 @@
+from typing import Dict, List, NamedTuple, Optional
+
+import numpy as np
+from ideology.services.calculation_dto import CalculationItem
+
+from .affinity_calculator import AffinityCalculator
+
+
+class AxisArrays(NamedTuple):
+    present: np.ndarray
+    indifferent: np.ndarray
+    value: np.ndarray
+    margin_left: np.ndarray
+    margin_right: np.ndarray
+
+    @classmethod
+    def pack(
+        cls, data: Dict[str, CalculationItem], axis_keys: List[str]
+    ) -> "AxisArrays":
+        present = []
+        indifferent = []
+        values = []
+        margins_left = []
+        margins_right = []
+
+        for axis_key in axis_keys:
+            item = data.get(axis_key)
+            if not item:
+                present.append(False)
+                indifferent.append(False)
+                values.append(0.0)
+                margins_left.append(0.0)
+                margins_right.append(0.0)
+                continue
+
+            is_indifferent = item.is_indifferent or item.value is None
+            present.append(True)
+            indifferent.append(is_indifferent)
+            values.append(0.0 if is_indifferent else item.value)
+            margins_left.append(item.margin_left)
+            margins_right.append(item.margin_right)
+
+        return cls(
+            present=np.array(present, dtype=bool),
+            indifferent=np.array(indifferent, dtype=bool),
+            value=np.array(values, dtype=np.float64),
+            margin_left=np.array(margins_left, dtype=np.float64),
+            margin_right=np.array(margins_right, dtype=np.float64),
+        )
+
+
+class VectorizedAffinityCalculator(AffinityCalculator):
+    def _score_axes(self, axis_keys: List[str]) -> Dict[str, Optional[float]]:
+        if not axis_keys:
+            return {}
+
+        scores = self.score_arrays(
+            AxisArrays.pack(self.data_a, axis_keys),
+            AxisArrays.pack(self.data_b, axis_keys),
+        )
+
+        return {
+            axis_key: None if score != score else score
+            for axis_key, score in zip(axis_keys, scores.tolist())
+        }
+
+    @classmethod
+    def score_arrays(cls, side_a: AxisArrays, side_b: AxisArrays) -> np.ndarray:
+        min_a = side_a.value - side_a.margin_left
+        max_a = side_a.value + side_a.margin_right
+        min_b = side_b.value - side_b.margin_left
+        max_b = side_b.value + side_b.margin_right
+
+        gap = np.where(
+            min_a > max_b,
+            min_a - max_b,
+            np.where(min_b > max_a, min_b - max_a, 0.0),
+        )
+        gap_ratio = np.minimum(gap / cls.MAX_POSSIBLE_GAP, 1.0)
+        gap_scores = 50.0 * ((1.0 - gap_ratio) ** 2)
+
+        distance = np.abs(side_a.value - side_b.value)
+        contact_distance = np.where(
+            side_a.value < side_b.value,
+            side_a.margin_right + side_b.margin_left,
+            side_b.margin_right + side_a.margin_left,
+        )
+        with np.errstate(divide="ignore", invalid="ignore"):
+            contact_ratio = np.where(
+                contact_distance > 0,
+                np.minimum(distance / contact_distance, 1.0),
+                1.0,
+            )
+        contact_scores = 50.0 + (50.0 * ((1.0 - contact_ratio) ** 2))
+
+        scores = np.where(
+            gap > 0,
+            gap_scores,
+            np.where(distance == 0, cls.MAX_AFFINITY, contact_scores),
+        )
+        scores = np.where(
+            side_a.indifferent & side_b.indifferent,
+            cls.MAX_AFFINITY,
+            np.where(
+                side_a.indifferent | side_b.indifferent,
+                cls.PARTIAL_INDIFFERENCE_SCORE,
+                scores,
+            ),
+        )
+        return np.where(side_a.present & side_b.present, scores, np.nan)
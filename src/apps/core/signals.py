@@ -0,0 +1,34 @@
+from core.models import Country, Region
+from core.services.catalog_response_cache import CatalogResponseCache
+from core.services.google_token_verifier import GoogleTokenVerifier
+from django.core.handlers.asgi import ASGIHandler
+from django.core.signals import request_started
+from django.db.models.signals import m2m_changed, post_delete, post_save
+
+
+def refresh_catalog(sender, instance, **kwargs):
+    CatalogResponseCache.invalidate_model(sender)
+
+
+def refresh_catalog_relations(sender, instance, action, **kwargs):
+    if action.startswith("post_"):
+        CatalogResponseCache.invalidate_model(sender)
+
+
+def connect_catalog(namespaces, through_models=()):
+    CatalogResponseCache.register(namespaces)
+    for model in namespaces:
+        post_save.connect(refresh_catalog, sender=model)
+        post_delete.connect(refresh_catalog, sender=model)
+    for model in through_models:
+        m2m_changed.connect(refresh_catalog_relations, sender=model)
+
+
+connect_catalog({Country: ("countries",), Region: ("regions",)})
+
+
+async def bind_google_client(sender, **kwargs):
+    GoogleTokenVerifier.bind_server_loop()
+
+
+request_started.connect(bind_google_client, sender=ASGIHandler)
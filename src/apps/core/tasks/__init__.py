@@ -1,4 +1,9 @@
-from .notifications import send_email_notification
+from .notifications import (
+    enqueue_email_notifications,
+    send_email_notification,
+    send_email_notifications,
+)
 from .reminders import send_verification_reminders
 from .maintenance import delete_unverified_users
 from .security import clear_reset_password_token
+from .similarity import rebuild_answer_similarity_index
@@ -1,24 +1,53 @@
 from datetime import timedelta
+from functools import partial
 
 from celery import shared_task
 from core.models import User
-from core.tasks.notifications import send_email_notification
+from core.tasks.notifications import enqueue_email_notifications
 from django.db import transaction
 from django.utils import timezone
 
 
 @shared_task
-def delete_unverified_users():
+def delete_unverified_users(batch_size: int = 500) -> int:
     limit_date = timezone.now() - timedelta(days=31)
     users_to_delete = User.objects.filter(is_verified=False, created__lte=limit_date)
-    for user in users_to_delete:
+    deleted = 0
+    last_pk = 0
+
+    while True:
         with transaction.atomic():
-            user.delete()
+            batch = list(
+                users_to_delete.filter(pk__gt=last_pk)
+                .order_by("pk")
+                .select_for_update(skip_locked=True)
+                .values_list("pk", "email", "username", "preferred_language")[
+                    :batch_size
+                ]
+            )
+            if not batch:
+                break
+
+            # The answer tables have no dependants or delete signals, so the
+            # collector clears each of them with one DELETE for the whole batch.
+            User.objects.filter(pk__in=[pk for pk, *_ in batch]).delete()
+
             transaction.on_commit(
-                lambda: send_email_notification.delay(
-                    to_email=user.email,
-                    template_name="user_deleted_due_no_verification",
-                    language=user.preferred_language,
-                    context={"username": user.username},
+                partial(
+                    enqueue_email_notifications,
+                    [
+                        {
+                            "to_email": email,
+                            "template_name": "user_deleted_due_no_verification",
+                            "language": preferred_language,
+                            "context": {"username": username},
+                        }
+                        for _, email, username, preferred_language in batch
+                    ],
                 )
             )
+
+        deleted += len(batch)
+        last_pk = batch[-1][0]
+
+    return deleted
@@ -1,14 +1,118 @@
-from typing import Any, Optional
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Iterable, Optional
 
 import requests
 from celery import shared_task
+from celery.signals import worker_process_init
 from celery.utils.log import get_task_logger
 from django.conf import settings
+from requests.adapters import HTTPAdapter
 
 logger = get_task_logger(__name__)
 
+_session: Optional[requests.Session] = None
+_session_lock = threading.Lock()
 
-@shared_task(bind=True, max_retries=3)
+
+class NotificationRateLimiter:
+    def __init__(self, rate: float):
+        self.interval = 1 / rate if rate > 0 else 0
+        self.next_start = time.monotonic()
+        self.lock = threading.Lock()
+
+    # Each caller reserves the next free slot and sleeps outside the lock, so
+    # concurrent senders start at most `rate` requests per second between them.
+    def wait(self) -> None:
+        with self.lock:
+            now = time.monotonic()
+            start = max(now, self.next_start)
+            self.next_start = start + self.interval
+        if start > now:
+            time.sleep(start - now)
+
+
+# Celery applies rate_limit to every task of a worker node, across all of its
+# pool processes, so the cap holds however many batches run at once. Each
+# batch also paces its own requests to avoid bursts.
+def get_rate_limit(notifications_per_task: int) -> Optional[str]:
+    if settings.NOTIFICATIONS_RATE_LIMIT <= 0:
+        return None
+    return f"{settings.NOTIFICATIONS_RATE_LIMIT / notifications_per_task}/s"
+
+
+def get_session() -> requests.Session:
+    global _session
+    if _session is None:
+        with _session_lock:
+            if _session is None:
+                session = requests.Session()
+                adapter = HTTPAdapter(
+                    pool_connections=1,
+                    pool_maxsize=settings.NOTIFICATIONS_MAX_CONCURRENCY,
+                )
+                session.mount("http://", adapter)
+                session.mount("https://", adapter)
+                _session = session
+    return _session
+
+
+# Forked pool processes must not share the parent's sockets.
+@worker_process_init.connect
+def reset_session(**kwargs) -> None:
+    global _session
+    _session = None
+
+
+def post_notification(
+    to_email: str,
+    template_name: str,
+    context: Optional[dict[str, Any]] = None,
+    language: str = "es",
+) -> dict[str, Any]:
+    url = f"{settings.NOTIFICATIONS_SERVICE_URL}/notifications/send"
+    payload = {
+        "to_email": to_email,
+        "template_name": template_name,
+        "language": language,
+        "context": context or {},
+    }
+    logger.debug("Sending notification to %s with payload: %s", url, payload)
+    response = get_session().post(
+        url=url,
+        json=payload,
+        headers={"Authorization": "Bearer " + settings.NOTIFICATIONS_API_KEY},
+        timeout=5,
+    )
+    if not response.ok:
+        logger.error(
+            "Notification Service Error [%s]: %s",
+            response.status_code,
+            response.text,
+        )
+    response.raise_for_status()
+    logger.info("Notification sent successfully to %s", to_email)
+    return response.json()
+
+
+def enqueue_email_notifications(notifications: Iterable[dict[str, Any]]) -> int:
+    batch_size = max(settings.NOTIFICATIONS_BATCH_SIZE, 1)
+    batch = []
+    enqueued = 0
+    for notification in notifications:
+        batch.append(notification)
+        if len(batch) == batch_size:
+            send_email_notifications.delay(batch)
+            enqueued += 1
+            batch = []
+    if batch:
+        send_email_notifications.delay(batch)
+        enqueued += 1
+    return enqueued
+
+
+@shared_task(bind=True, max_retries=3, rate_limit=get_rate_limit(1))
 def send_email_notification(
     self,
     to_email: str,
@@ -17,29 +121,48 @@ def send_email_notification(
     language: str = "es",
 ) -> dict[str, Any]:
     try:
-        url = f"{settings.NOTIFICATIONS_SERVICE_URL}/notifications/send"
-        payload = {
-            "to_email": to_email,
-            "template_name": template_name,
-            "language": language,
-            "context": context or {},
-        }
-        logger.debug("Sending notification to %s with payload: %s", url, payload)
-        response = requests.post(
-            url=url,
-            json=payload,
-            headers={"Authorization": "Bearer " + settings.NOTIFICATIONS_API_KEY},
-            timeout=5,
-        )
-        if not response.ok:
-            logger.error(
-                "Notification Service Error [%s]: %s",
-                response.status_code,
-                response.text,
-            )
-        response.raise_for_status()
-        logger.info("Notification sent successfully to %s", to_email)
-        return response.json()
+        return post_notification(to_email, template_name, context, language)
     except requests.exceptions.RequestException as exc:
         logger.error("Network/Connection error sending to %s: %s", to_email, exc)
         raise self.retry(exc=exc, countdown=2**self.request.retries)
+
+
+@shared_task(
+    bind=True,
+    max_retries=3,
+    rate_limit=get_rate_limit(max(settings.NOTIFICATIONS_BATCH_SIZE, 1)),
+)
+def send_email_notifications(self, notifications: list[dict[str, Any]]) -> int:
+    rate_limiter = NotificationRateLimiter(settings.NOTIFICATIONS_RATE_LIMIT)
+
+    def send(notification: dict[str, Any]) -> Optional[Exception]:
+        rate_limiter.wait()
+        try:
+            post_notification(**notification)
+        except requests.exceptions.RequestException as exc:
+            logger.error(
+                "Network/Connection error sending to %s: %s",
+                notification["to_email"],
+                exc,
+            )
+            return exc
+        return None
+
+    with ThreadPoolExecutor(
+        max_workers=max(settings.NOTIFICATIONS_MAX_CONCURRENCY, 1)
+    ) as executor:
+        errors = list(executor.map(send, notifications))
+
+    # Only the notifications that failed are sent again on retry.
+    failed = [
+        notification
+        for notification, error in zip(notifications, errors)
+        if error is not None
+    ]
+    if failed:
+        raise self.retry(
+            exc=next(error for error in errors if error is not None),
+            args=(failed,),
+            countdown=2**self.request.retries,
+        )
+    return len(notifications)
@@ -1,26 +1,59 @@
-from datetime import timedelta
+from datetime import datetime, time, timedelta
+from typing import Iterator, Tuple
 
 from celery import shared_task
 from core.models import User
-from core.tasks.notifications import send_email_notification
+from core.tasks.notifications import enqueue_email_notifications
+from django.db.models import Q
 from django.utils import timezone
 
+REMINDER_TEMPLATES = {
+    3: "registration_reminder_3_days",
+    7: "registration_reminder_7_days",
+    30: "registration_reminder_30_days",
+}
+
+
+# Server side cursors are disabled for the connection pooler, so iterator()
+# would still buffer every row; keyset chunks keep memory bounded instead.
+# They follow (created, pk), the order of the partial index, so each chunk is
+# an index range scan rather than a sort of the whole day.
+def iter_unverified_users(
+    start: datetime, end: datetime, chunk_size: int
+) -> Iterator[Tuple[str, str]]:
+    users = User.objects.filter(
+        is_verified=False, created__gte=start, created__lt=end
+    ).order_by("created", "pk")
+    page = users
+    while True:
+        chunk = list(page.values_list("created", "pk", "email", "uuid")[:chunk_size])
+        if not chunk:
+            return
+        for _, _, email, user_uuid in chunk:
+            yield email, str(user_uuid)
+        last_created, last_pk = chunk[-1][:2]
+        page = users.filter(created__gte=last_created).filter(
+            Q(created__gt=last_created) | Q(pk__gt=last_pk)
+        )
+
 
 @shared_task
-def send_verification_reminders():
+def send_verification_reminders(chunk_size: int = 2000):
     today = timezone.now().date()
-    reminders_map = {
-        3: "registration_reminder_3_days",
-        7: "registration_reminder_7_days",
-        30: "registration_reminder_30_days",
-    }
-    for days_ago, template_name in reminders_map.items():
+    for days_ago, template_name in REMINDER_TEMPLATES.items():
         target_date = today - timedelta(days=days_ago)
-        users = User.objects.filter(is_verified=False, created__date=target_date)
-        for user in users:
-            send_email_notification.delay(
-                to_email=user.email,
-                template_name=template_name,
-                context={"user_uuid": str(user.uuid)},
-                language="es",
-            )
+        # Half-open bounds of the local day let the scan use the index on
+        # created instead of casting every row to a date.
+        start = timezone.make_aware(datetime.combine(target_date, time.min))
+        end = timezone.make_aware(
+            datetime.combine(target_date + timedelta(days=1), time.min)
+        )
+        enqueue_email_notifications(
+            {
+                "to_email": email,
+                "template_name": template_name,
+                "context": {"user_uuid": user_uuid},
+                "language": "es",
+            }
+            for email, user_uuid in iter_unverified_users(start, end, chunk_size)
+        )
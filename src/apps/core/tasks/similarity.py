@@ -0,0 +1,8 @@
+from celery import shared_task
+from ideology.services.answer_similarity_index import AnswerSimilarityIndex
+
+
+@shared_task
+def rebuild_answer_similarity_index(full=False):
+    index = AnswerSimilarityIndex.rebuild(full=full)
+    return len(index.answer_uuids)
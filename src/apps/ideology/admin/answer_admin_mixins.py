@@ -0,0 +1,16 @@
+from ideology.models import UserAnswerVector
+
+
+class UserAnswerVectorInvalidationMixin:
+    def save_model(self, request, obj, form, change):
+        super().save_model(request, obj, form, change)
+        UserAnswerVector.objects.invalidate([obj.user_id, form.initial.get("user")])
+
+    def delete_model(self, request, obj):
+        super().delete_model(request, obj)
+        UserAnswerVector.objects.invalidate([obj.user_id])
+
+    def delete_queryset(self, request, queryset):
+        user_ids = list(queryset.values_list("user_id", flat=True).distinct())
+        super().delete_queryset(request, queryset)
+        UserAnswerVector.objects.invalidate(user_ids)
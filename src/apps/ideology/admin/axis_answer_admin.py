@@ -1,10 +1,11 @@
 from django.contrib import admin
+from ideology.admin.answer_admin_mixins import UserAnswerVectorInvalidationMixin
 from ideology.models import UserAxisAnswer
 from unfold.admin import ModelAdmin
 
 
 @admin.register(UserAxisAnswer)
-class UserAxisAnswerAdmin(ModelAdmin):
+class UserAxisAnswerAdmin(UserAnswerVectorInvalidationMixin, ModelAdmin):
     show_full_result_count = False
     list_per_page = 20
     list_display = ["user", "axis", "value", "is_indifferent", "uuid", "created"]
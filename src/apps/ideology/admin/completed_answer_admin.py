@@ -1,10 +1,8 @@
 import json
 
 from django.contrib import admin
-from django.db.models import JSONField
 from django.utils.html import format_html
 from django.utils.translation import gettext_lazy as _
-from django_json_widget.widgets import JSONEditorWidget
 from ideology.models import CompletedAnswer
 from unfold.admin import ModelAdmin
 
@@ -25,11 +23,14 @@ class CompletedAnswerAdmin(ModelAdmin):
     ]
     autocomplete_fields = ["completed_by"]
     list_select_related = ["completed_by"]
-    readonly_fields = ["created", "modified", "uuid", "answer_hash", "answers_pretty"]
-
-    formfield_overrides = {
-        JSONField: {"widget": JSONEditorWidget},
-    }
+    readonly_fields = [
+        "created",
+        "modified",
+        "uuid",
+        "answer_hash",
+        "payload",
+        "answers_pretty",
+    ]
 
     def answers_pretty(self, obj):
         data = obj.answers
@@ -42,14 +43,11 @@ class CompletedAnswerAdmin(ModelAdmin):
         )
 
     fieldsets = (
-        (None, {"fields": ("completed_by", "uuid", "answer_hash")}),
+        (None, {"fields": ("completed_by", "uuid", "answer_hash", "payload")}),
         (
             _("Data"),
             {
-                "fields": (
-                    "answers",
-                    "answers_pretty",
-                ),
+                "fields": ("answers_pretty",),
                 "classes": ("tab-stacked",),
             },
         ),
@@ -1,10 +1,11 @@
 from django.contrib import admin
+from ideology.admin.answer_admin_mixins import UserAnswerVectorInvalidationMixin
 from ideology.models import UserConditionerAnswer
 from unfold.admin import ModelAdmin
 
 
 @admin.register(UserConditionerAnswer)
-class UserConditionerAnswerAdmin(ModelAdmin):
+class UserConditionerAnswerAdmin(UserAnswerVectorInvalidationMixin, ModelAdmin):
     show_full_result_count = False
     list_per_page = 20
     list_display = ["user", "conditioner", "answer", "uuid", "created"]
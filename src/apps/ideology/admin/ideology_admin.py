@@ -48,7 +48,14 @@ class IdeologyConditionerDefinitionInline(StackedInline):
 
 @admin.register(Ideology)
 class IdeologyAdmin(ModelAdmin, TabbedTranslationAdmin):
-    list_display = ["name", "uuid", "created", "modified", "get_association_count"]
+    list_display = [
+        "name",
+        "uuid",
+        "created",
+        "modified",
+        "definitions_count",
+        "get_association_count",
+    ]
     search_fields = ["name", "description_supporter", "uuid"]
     list_filter_submit = True
     list_filter = ["created"]
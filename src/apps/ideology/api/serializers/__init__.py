@@ -20,6 +20,11 @@ from .user_conditioner_answer_serializers import (
     ConditionerAnswerReadSerializer,
     ConditionerAnswerUpsertSerializer,
 )
+from .bulk_answer_serializers import (
+    AnswerUpsertCountsSerializer,
+    BulkAnswerUpsertResultSerializer,
+    BulkAnswerUpsertSerializer,
+)
 from .ideology_abstraction_complexity_serializers import (
     IdeologyAbstractionComplexitySerializer,
     SimpleComplexitySerializer,
@@ -40,6 +45,10 @@ from .ideology_section_serializers import (
     IdeologySectionSerializer,
     SimpleSectionSerializer,
 )
+from .structure_bundle_serializers import (
+    StructureBundleSectionSerializer,
+    StructureBundleSerializer,
+)
 from .tag_serializers import TagSerializer
 from .religion_serializers import ReligionSerializer
 from .ideology_serializers import (
@@ -53,5 +62,9 @@ from .affinity_serializers import (
     SectionAffinitySerializer,
     ComplexityAffinitySerializer,
     IdeologyAffinitySerializer,
+    IdeologyAffinityRankingSerializer,
     AffinitySerializer,
+    ComplexityAffinitySummarySerializer,
+    BatchAffinityRequestSerializer,
+    CompletedAnswerAffinitySummarySerializer,
 )
@@ -25,13 +25,19 @@ class AxisBreakdownSerializer(serializers.Serializer):
 class SectionAffinitySerializer(serializers.Serializer):
     section = SimpleSectionSerializer(allow_null=True)
     affinity = serializers.FloatField(min_value=0.0, max_value=100.0, allow_null=True)
-    axes = AxisBreakdownSerializer(many=True)
+    axes = AxisBreakdownSerializer(
+        many=True, required=False, help_text=_("Only included with detail=full.")
+    )
 
 
 class ComplexityAffinitySerializer(serializers.Serializer):
     complexity = SimpleComplexitySerializer(allow_null=True)
     affinity = serializers.FloatField(min_value=0.0, max_value=100.0, allow_null=True)
-    sections = SectionAffinitySerializer(many=True)
+    sections = SectionAffinitySerializer(
+        many=True,
+        required=False,
+        help_text=_("Omitted with detail=summary."),
+    )
 
 
 class IdeologyAffinitySerializer(serializers.Serializer):
@@ -60,3 +66,48 @@ class AffinitySerializer(serializers.Serializer):
     complexities = ComplexityAffinitySerializer(
         many=True, help_text=_("Affinity grouped by abstraction level.")
     )
+
+
+class IdeologyAffinityRankingSerializer(serializers.Serializer):
+    target_ideology = TargetIdeologySerializer(read_only=True)
+    total_affinity = serializers.FloatField(
+        min_value=0.0,
+        max_value=100.0,
+        source="total",
+        help_text=_("Overall affinity percentage."),
+    )
+
+
+class ComplexityAffinitySummarySerializer(serializers.Serializer):
+    complexity = SimpleComplexitySerializer(allow_null=True)
+    affinity = serializers.FloatField(min_value=0.0, max_value=100.0, allow_null=True)
+
+
+class BatchAffinityRequestSerializer(serializers.Serializer):
+    target_answer_uuids = serializers.ListField(
+        child=serializers.UUIDField(format="hex"),
+        allow_empty=False,
+        max_length=500,
+        help_text=_("UUIDs of the target CompletedAnswers (up to 500)."),
+    )
+    include_complexities = serializers.BooleanField(
+        default=False,
+        help_text=_("Include the affinity of each abstraction level."),
+    )
+
+
+class CompletedAnswerAffinitySummarySerializer(serializers.Serializer):
+    target_answer_uuid = serializers.UUIDField(format="hex")
+    target_user = PublicUserSerializer(read_only=True, allow_null=True)
+    total_affinity = serializers.FloatField(
+        min_value=0.0,
+        max_value=100.0,
+        allow_null=True,
+        source="total",
+        help_text=_("Overall affinity percentage. Null if no common axes."),
+    )
+    complexities = ComplexityAffinitySummarySerializer(
+        many=True,
+        required=False,
+        help_text=_("Affinity grouped by abstraction level, if requested."),
+    )
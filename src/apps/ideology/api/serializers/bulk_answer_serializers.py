@@ -0,0 +1,84 @@
+from django.db import transaction
+from django.utils.translation import gettext_lazy as _
+from ideology.api.serializers.base_serializers import BaseAxisAnswerUpsertSerializer
+from ideology.models import UserAxisAnswer, UserConditionerAnswer
+from rest_framework import serializers
+
+
+class BulkAxisAnswerItemSerializer(BaseAxisAnswerUpsertSerializer):
+    uuid = serializers.UUIDField(format="hex")
+
+    def validate(self, attrs):
+        if not attrs.get("is_indifferent") and attrs.get("value") is None:
+            raise serializers.ValidationError(
+                _("A non-indifferent answer must have a numeric value.")
+            )
+        return attrs
+
+
+class BulkConditionerAnswerItemSerializer(serializers.Serializer):
+    uuid = serializers.UUIDField(format="hex")
+    answer = serializers.CharField(max_length=255)
+
+
+class AnswerUpsertCountsSerializer(serializers.Serializer):
+    inserted = serializers.IntegerField()
+    updated = serializers.IntegerField()
+    skipped = serializers.IntegerField()
+
+
+class BulkAnswerUpsertResultSerializer(serializers.Serializer):
+    axis = AnswerUpsertCountsSerializer()
+    conditioners = AnswerUpsertCountsSerializer()
+
+
+class BulkAnswerUpsertSerializer(serializers.Serializer):
+    max_answers = 500
+
+    axis = BulkAxisAnswerItemSerializer(
+        many=True, required=False, max_length=max_answers
+    )
+    conditioners = BulkConditionerAnswerItemSerializer(
+        many=True, required=False, max_length=max_answers
+    )
+
+    @staticmethod
+    def _validate_unique(items):
+        uuids = [item["uuid"] for item in items]
+        if len(uuids) != len(set(uuids)):
+            raise serializers.ValidationError(_("Each UUID can only appear once."))
+        return items
+
+    def validate_axis(self, value):
+        return self._validate_unique(value)
+
+    def validate_conditioners(self, value):
+        return self._validate_unique(value)
+
+    def validate(self, attrs):
+        if not attrs.get("axis") and not attrs.get("conditioners"):
+            raise serializers.ValidationError(
+                _("Provide at least one axis or conditioner answer.")
+            )
+        return attrs
+
+    def create(self, validated_data):
+        user = self.context["request"].user
+
+        with transaction.atomic():
+            return {
+                "axis": UserAxisAnswer.objects.bulk_upsert(
+                    user,
+                    {item["uuid"].hex: item for item in validated_data.get("axis", [])},
+                ),
+                "conditioners": UserConditionerAnswer.objects.bulk_upsert(
+                    user,
+                    {
+                        item["uuid"].hex: item["answer"]
+                        for item in validated_data.get("conditioners", [])
+                    },
+                ),
+            }
+
+    def to_representation(self, instance):
+        return BulkAnswerUpsertResultSerializer(instance).data
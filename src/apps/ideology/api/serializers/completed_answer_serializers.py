@@ -2,7 +2,11 @@ from core.api.serializers.base_user_serializers import SimpleUserSerializer
 from core.helpers import UUIDModelSerializerMixin
 from django.db import transaction
 from django.utils.translation import gettext_lazy as _
+from ideology.api.serializers.bulk_answer_serializers import (
+    BulkAnswerUpsertResultSerializer,
+)
 from ideology.models import CompletedAnswer
+from ideology.services.mapping_helpers import extract_uuid
 from rest_framework import serializers
 
 
@@ -20,6 +24,7 @@ class ConditionerAnswerInputSerializer(serializers.Serializer):
 
 class CompletedAnswerSerializer(UUIDModelSerializerMixin):
     completed_by = SimpleUserSerializer(read_only=True)
+    answers = serializers.JSONField(read_only=True)
 
     axis = AxisAnswerInputSerializer(many=True, write_only=True, required=False)
     conditioners = ConditionerAnswerInputSerializer(
@@ -51,28 +56,40 @@ class CopyCompletedAnswerSerializer(serializers.Serializer):
     def create(self, validated_data):
         from ideology.models import UserAxisAnswer, UserConditionerAnswer
 
-        request = self.context["request"]
-        user = request.user
+        user = self.context["request"].user
         completed_answer = self.context["view"].get_object()
         answers = completed_answer.answers
+        if not isinstance(answers, dict):
+            answers = {}
+
+        raw_axes = answers.get("axis", [])
+        raw_conditioners = answers.get("conditioners", [])
+        axis_answers = {}
+        for axis_data in raw_axes:
+            axis_uuid = extract_uuid(axis_data)
+            if axis_uuid:
+                axis_answers[axis_uuid] = axis_data
+        conditioner_answers = {}
+        for conditioner_data in raw_conditioners:
+            conditioner_uuid = extract_uuid(conditioner_data)
+            if conditioner_uuid:
+                conditioner_answers[conditioner_uuid] = conditioner_data.get("value")
 
         with transaction.atomic():
-            for axis_data in answers.get("axis", []):
-                UserAxisAnswer.objects.upsert(
-                    user=user,
-                    axis_uuid=axis_data["uuid"],
-                    validated_data={
-                        "value": axis_data.get("value"),
-                        "margin_left": axis_data.get("margin_left"),
-                        "margin_right": axis_data.get("margin_right"),
-                        "is_indifferent": axis_data.get("is_indifferent", False),
-                    },
-                )
-
-            for cond_data in answers.get("conditioners", []):
-                UserConditionerAnswer.objects.upsert(
-                    user=user,
-                    conditioner_uuid=cond_data["uuid"],
-                    validated_data={"answer": cond_data.get("value")},
-                )
-        return completed_answer
+            counts = {
+                "axis": UserAxisAnswer.objects.bulk_upsert(user, axis_answers),
+                "conditioners": UserConditionerAnswer.objects.bulk_upsert(
+                    user, conditioner_answers
+                ),
+            }
+
+        # Entries without a valid UUID (or repeated ones) never reach the
+        # managers, so they are added to the skipped count here.
+        counts["axis"]["skipped"] += len(raw_axes) - len(axis_answers)
+        counts["conditioners"]["skipped"] += len(raw_conditioners) - len(
+            conditioner_answers
+        )
+        return counts
+
+    def to_representation(self, instance):
+        return BulkAnswerUpsertResultSerializer(instance).data
@@ -29,8 +29,14 @@ class IdeologyConditionerSerializer(UUIDModelSerializerMixin):
     def get_condition_rules(self, instance):
         from ideology.api.serializers import IdeologyConditionerConditionerSerializer
 
+        rules_map = self.context.get("condition_rules")
+        rules = (
+            rules_map.get(instance.pk, [])
+            if rules_map is not None
+            else instance.condition_rules.all()
+        )
         return IdeologyConditionerConditionerSerializer(
-            instance.condition_rules.all(), many=True, context=self.context
+            rules, many=True, context=self.context
         ).data
 
     def to_representation(self, instance):
@@ -0,0 +1,24 @@
+from ideology.api.serializers.ideology_abstraction_complexity_serializers import (
+    IdeologyAbstractionComplexitySerializer,
+)
+from ideology.api.serializers.ideology_axis_serializers import IdeologyAxisSerializer
+from ideology.api.serializers.ideology_conditioner_serializers import (
+    IdeologyConditionerSerializer,
+)
+from ideology.api.serializers.ideology_section_serializers import (
+    IdeologySectionSerializer,
+)
+from rest_framework import serializers
+
+
+class StructureBundleSectionSerializer(IdeologySectionSerializer):
+    axes = IdeologyAxisSerializer(many=True, read_only=True)
+
+    class Meta(IdeologySectionSerializer.Meta):
+        fields = IdeologySectionSerializer.Meta.fields + ["axes"]
+
+
+class StructureBundleSerializer(serializers.Serializer):
+    complexity = IdeologyAbstractionComplexitySerializer(read_only=True)
+    sections = StructureBundleSectionSerializer(many=True, read_only=True)
+    conditioners = IdeologyConditionerSerializer(many=True, read_only=True)
@@ -24,6 +24,11 @@ urlpatterns = [
         views.ConditionerListAggregatedByComplexityView.as_view(),
         name="conditioner-list-aggregated-by-complexity",
     ),
+    path(
+        "structure/bundle/<str:complexity_uuid>/",
+        views.StructureBundleView.as_view(),
+        name="structure-bundle",
+    ),
     path(
         "ideologies/",
         views.IdeologyListView.as_view(),
@@ -39,6 +44,11 @@ urlpatterns = [
         views.ReligionListView.as_view(),
         name="religion-list",
     ),
+    path(
+        "ideologies/affinity/",
+        views.IdeologyAffinityRankingView.as_view(),
+        name="ideology-affinity-ranking",
+    ),
     path(
         "ideologies/<str:uuid>/",
         views.IdeologyDetailView.as_view(),
@@ -79,6 +89,11 @@ urlpatterns = [
         views.DeleteIdeologyConditionerDefinitionView.as_view(),
         name="delete-ideology-conditioner-definition",
     ),
+    path(
+        "answers/bulk/",
+        views.BulkUpsertAnswersView.as_view(),
+        name="bulk-upsert-answers",
+    ),
     path(
         "answers/axis/<str:uuid>/",
         views.UpsertAxisAnswerView.as_view(),
@@ -119,6 +134,16 @@ urlpatterns = [
         views.GenerateCompletedAnswerView.as_view(),
         name="completed-answer-generate",
     ),
+    path(
+        "answers/completed/similar/",
+        views.SimilarCompletedAnswersView.as_view(),
+        name="completed-answer-similar",
+    ),
+    path(
+        "answers/completed/affinity/",
+        views.CompletedAnswerBatchAffinityView.as_view(),
+        name="completed-answer-affinity-batch",
+    ),
     path(
         "answers/completed/<str:uuid>/",
         views.RetrieveCompletedAnswerView.as_view(),
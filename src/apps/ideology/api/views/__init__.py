@@ -14,10 +14,12 @@ from .user_conditioner_answer_views import (
     UpsertConditionerAnswerView,
     UserConditionerAnswerListByComplexityView,
 )
+from .bulk_answer_views import BulkUpsertAnswersView
 from .ideology_abstraction_complexity_views import AbstractionComplexityListView
 from .ideology_axis_views import AxisListBySectionView
 from .ideology_conditioner_views import ConditionerListAggregatedByComplexityView
 from .ideology_section_views import SectionListByComplexityView
+from .structure_bundle_views import StructureBundleView
 from .ideology_views import IdeologyDetailView, IdeologyListView
 from .ideology_axis_definition_views import (
     IdeologyAxisDefinitionListByIdeologyView,
@@ -31,4 +33,10 @@ from .ideology_conditioner_definition_views import (
 )
 from .tag_views import TagListView
 from .religion_views import ReligionListView
-from .affinity_views import IdeologyAffinityView, CompletedAnswerAffinityView
+from .affinity_views import (
+    IdeologyAffinityView,
+    IdeologyAffinityRankingView,
+    CompletedAnswerAffinityView,
+    CompletedAnswerBatchAffinityView,
+    SimilarCompletedAnswersView,
+)
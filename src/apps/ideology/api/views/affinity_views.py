@@ -1,14 +1,21 @@
 from core.exceptions.api_exceptions import BadRequestException, NotFoundException
-from core.services.affinity_calculator import AffinityCalculator
+from core.services.affinity_matrix_calculator import AffinityMatrixCalculator
+from core.services.vectorized_affinity_calculator import VectorizedAffinityCalculator
+from django.conf import settings
 from django.utils.translation import gettext_lazy as _
 from drf_spectacular.utils import OpenApiParameter, extend_schema
-from ideology.api.serializers import AffinitySerializer, IdeologyAffinitySerializer
-from ideology.models import (
-    CompletedAnswer,
-    Ideology,
-    UserAxisAnswer,
-    UserConditionerAnswer,
+from ideology.api.serializers import (
+    AffinitySerializer,
+    BatchAffinityRequestSerializer,
+    CompletedAnswerAffinitySummarySerializer,
+    IdeologyAffinityRankingSerializer,
+    IdeologyAffinitySerializer,
 )
+from ideology.models import CompletedAnswer, Ideology, UserAnswerVector
+from ideology.services.affinity_result_cache import AffinityResultCache
+from ideology.services.answer_similarity_index import AnswerSimilarityIndex
+from ideology.services.ideology_vector_cache import IdeologyVectorCache
+from ideology.services.structure_index import StructureIndex
 from rest_framework import status
 from rest_framework.generics import GenericAPIView
 from rest_framework.permissions import AllowAny
@@ -17,25 +24,53 @@ from rest_framework.response import Response
 
 class BaseAffinityView(GenericAPIView):
     permission_classes = [AllowAny]
+    default_limit = 10
+    max_limit = 100
 
-    def get_source_data(self):
+    def get_limit(self) -> int:
+        raw_limit = self.request.query_params.get("limit")
+        if raw_limit is None:
+            return self.default_limit
+        try:
+            limit = int(raw_limit)
+        except ValueError:
+            raise BadRequestException(_("'limit' must be an integer."))
+        if not 1 <= limit <= self.max_limit:
+            raise BadRequestException(
+                _("'limit' must be between 1 and %(max)s.") % {"max": self.max_limit}
+            )
+        return limit
+
+    def get_detail(self) -> str:
+        detail = self.request.query_params.get(
+            "detail", VectorizedAffinityCalculator.DETAIL_FULL
+        )
+        if detail not in VectorizedAffinityCalculator.DETAIL_LEVELS:
+            raise BadRequestException(
+                _("'detail' must be one of: %(levels)s.")
+                % {"levels": ", ".join(VectorizedAffinityCalculator.DETAIL_LEVELS)}
+            )
+        return detail
+
+    def get_source_answer(self):
         source_uuid = self.request.query_params.get("source_answer_uuid")
+        if not source_uuid:
+            return None
+
+        try:
+            return CompletedAnswer.objects.get(uuid=source_uuid)
+        except CompletedAnswer.DoesNotExist:
+            raise NotFoundException(_("Source Completed Answer not found."))
 
-        if source_uuid:
-            try:
-                completed_answer = CompletedAnswer.objects.get(uuid=source_uuid)
-                return completed_answer.get_mapped_for_calculation()
-            except CompletedAnswer.DoesNotExist:
-                raise NotFoundException(_("Source Completed Answer not found."))
+    def get_source_data(self, source_answer=None):
+        source_answer = source_answer or self.get_source_answer()
+        if source_answer:
+            return source_answer.get_mapped_for_calculation()
 
         if self.request.user.is_authenticated:
-            axis_data = UserAxisAnswer.objects.get_mapped_for_calculation(
-                self.request.user
-            )
-            conditioner_data = UserConditionerAnswer.objects.get_mapped_for_calculation(
+            return UserAnswerVector.objects.get_mapped_for_calculation(
                 self.request.user
             )
-            return {**axis_data, **conditioner_data}
 
         raise BadRequestException(
             _(
@@ -44,17 +79,28 @@ class BaseAffinityView(GenericAPIView):
         )
 
     def process_affinity_request(
-        self, target_object, target_key, target_value=None, explicit_value=False
+        self,
+        target_object,
+        target_key,
+        target_value=None,
+        explicit_value=False,
+        target_version=None,
     ):
         final_target_value = (
             target_value if explicit_value or target_value else target_object
         )
 
-        source_data = self.get_source_data()
-        target_data = target_object.get_mapped_for_calculation()
-
-        calculation = AffinityCalculator(source_data, target_data).calculate_detailed()
-        hydrated = AffinityCalculator.hydrate_affinity_structure(calculation)
+        detail = self.get_detail()
+        source_answer = self.get_source_answer()
+        calculation = AffinityResultCache.get_or_calculate(
+            source_answer.answer_hash if source_answer else None,
+            f"{target_version}:{detail}" if target_version else None,
+            lambda: VectorizedAffinityCalculator(
+                self.get_source_data(source_answer),
+                target_object.get_mapped_for_calculation(),
+            ).calculate_detailed(detail),
+        )
+        hydrated = VectorizedAffinityCalculator.hydrate_affinity_structure(calculation)
 
         response_data = {
             target_key: final_target_value,
@@ -80,6 +126,16 @@ class BaseAffinityView(GenericAPIView):
             type=str,
             location=OpenApiParameter.QUERY,
         ),
+        OpenApiParameter(
+            name="detail",
+            description=_(
+                "Depth of the breakdown: 'summary' (per complexity), 'sections' or 'full' (default)."
+            ),
+            required=False,
+            type=str,
+            enum=VectorizedAffinityCalculator.DETAIL_LEVELS,
+            location=OpenApiParameter.QUERY,
+        ),
         OpenApiParameter(
             name="ideology_uuid",
             location=OpenApiParameter.PATH,
@@ -103,9 +159,62 @@ class IdeologyAffinityView(BaseAffinityView):
             target_key="target_ideology",
             target_value=target_ideology,
             explicit_value=True,
+            target_version=IdeologyVectorCache.get_key(target_ideology),
         )
 
 
+@extend_schema(
+    tags=["ideologies"],
+    summary=_("Rank all ideologies by affinity"),
+    description=_(
+        "Calculates the ideological affinity between a source (Authenticated User or CompletedAnswer UUID) "
+        "and every visible Ideology in a single request, returning the top results sorted by total affinity."
+    ),
+    parameters=[
+        OpenApiParameter(
+            name="source_answer_uuid",
+            description=_("UUID of the source CompletedAnswer (required if anonymous)"),
+            required=False,
+            type=str,
+            location=OpenApiParameter.QUERY,
+        ),
+        OpenApiParameter(
+            name="limit",
+            description=_("Number of ideologies to return (default 10, max 100)"),
+            required=False,
+            type=int,
+            location=OpenApiParameter.QUERY,
+        ),
+    ],
+    responses={200: IdeologyAffinityRankingSerializer(many=True)},
+)
+class IdeologyAffinityRankingView(BaseAffinityView):
+    serializer_class = IdeologyAffinityRankingSerializer
+    queryset = Ideology.objects.visible
+    pagination_class = None
+
+    def get(self, request, *args, **kwargs):
+        limit = self.get_limit()
+        source_data = self.get_source_data()
+
+        ideologies = {ideology.pk: ideology for ideology in self.get_queryset()}
+        totals = AffinityMatrixCalculator(source_data).calculate_totals(
+            IdeologyVectorCache.get_many(ideologies.values())
+        )
+
+        ranking = sorted(
+            (
+                {"target_ideology": ideologies[pk], "total": total}
+                for pk, total in totals.items()
+                if total is not None
+            ),
+            key=lambda entry: (-entry["total"], entry["target_ideology"].name),
+        )[:limit]
+
+        serializer = self.get_serializer(ranking, many=True)
+        return Response(serializer.data, status=status.HTTP_200_OK)
+
+
 @extend_schema(
     tags=["answers"],
     summary=_("Calculate affinity with a Completed Answer"),
@@ -121,6 +230,16 @@ class IdeologyAffinityView(BaseAffinityView):
             type=str,
             location=OpenApiParameter.QUERY,
         ),
+        OpenApiParameter(
+            name="detail",
+            description=_(
+                "Depth of the breakdown: 'summary' (per complexity), 'sections' or 'full' (default)."
+            ),
+            required=False,
+            type=str,
+            enum=VectorizedAffinityCalculator.DETAIL_LEVELS,
+            location=OpenApiParameter.QUERY,
+        ),
         OpenApiParameter(
             name="target_answer_uuid",
             location=OpenApiParameter.PATH,
@@ -144,4 +263,169 @@ class CompletedAnswerAffinityView(BaseAffinityView):
             target_key="target_user",
             target_value=target_answer.completed_by,
             explicit_value=True,
+            target_version=(
+                f"completed_answer:{target_answer.answer_hash}"
+                if target_answer.answer_hash
+                else None
+            ),
+        )
+
+
+@extend_schema(
+    tags=["answers"],
+    summary=_("Calculate affinity with several Completed Answers"),
+    description=_(
+        "Calculates the ideological affinity between a source (Authenticated User or CompletedAnswer UUID) "
+        "and up to 500 target CompletedAnswers in a single pass. Unknown targets are omitted."
+    ),
+    parameters=[
+        OpenApiParameter(
+            name="source_answer_uuid",
+            description=_("UUID of the source CompletedAnswer (required if anonymous)"),
+            required=False,
+            type=str,
+            location=OpenApiParameter.QUERY,
+        ),
+    ],
+    request=BatchAffinityRequestSerializer,
+    responses={200: CompletedAnswerAffinitySummarySerializer(many=True)},
+)
+class CompletedAnswerBatchAffinityView(BaseAffinityView):
+    serializer_class = BatchAffinityRequestSerializer
+    queryset = CompletedAnswer.objects.select_related("completed_by")
+
+    def post(self, request, *args, **kwargs):
+        serializer = self.get_serializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+        target_uuids = list(
+            dict.fromkeys(serializer.validated_data["target_answer_uuids"])
         )
+        include_complexities = serializer.validated_data["include_complexities"]
+
+        source_data = self.get_source_data()
+        target_answers = {
+            answer.uuid: answer
+            for answer in self.get_queryset().filter(uuid__in=target_uuids)
+        }
+        structure = StructureIndex.get()
+        summaries = AffinityMatrixCalculator(source_data).calculate_summaries(
+            {
+                target_uuid: answer.get_mapped_for_calculation(structure)
+                for target_uuid, answer in target_answers.items()
+            }
+        )
+
+        results = []
+        for target_uuid in target_uuids:
+            if target_uuid not in target_answers:
+                continue
+
+            summary = summaries[target_uuid]
+            result = {
+                "target_answer_uuid": target_uuid,
+                "target_user": target_answers[target_uuid].completed_by,
+                "total": summary["total"],
+            }
+            if include_complexities:
+                result["complexities"] = (
+                    VectorizedAffinityCalculator.hydrate_affinity_structure(summary)[
+                        "complexities"
+                    ]
+                )
+            results.append(result)
+
+        response_serializer = CompletedAnswerAffinitySummarySerializer(
+            results, many=True
+        )
+        return Response(response_serializer.data, status=status.HTTP_200_OK)
+
+
+@extend_schema(
+    tags=["answers"],
+    summary=_("Find the public users most similar to a source"),
+    description=_(
+        "Returns the public users whose latest CompletedAnswer has the highest affinity with the source "
+        "(Authenticated User or CompletedAnswer UUID). Candidates are preselected from a precomputed "
+        "answer index and then ranked with the exact affinity calculation."
+    ),
+    parameters=[
+        OpenApiParameter(
+            name="source_answer_uuid",
+            description=_("UUID of the source CompletedAnswer (required if anonymous)"),
+            required=False,
+            type=str,
+            location=OpenApiParameter.QUERY,
+        ),
+        OpenApiParameter(
+            name="limit",
+            description=_("Number of users to return (default 10, max 100)"),
+            required=False,
+            type=int,
+            location=OpenApiParameter.QUERY,
+        ),
+    ],
+    responses={200: CompletedAnswerAffinitySummarySerializer(many=True)},
+)
+class SimilarCompletedAnswersView(BaseAffinityView):
+    serializer_class = CompletedAnswerAffinitySummarySerializer
+    queryset = CompletedAnswer.objects.filter(
+        completed_by__is_public=True, completed_by__is_active=True
+    ).select_related("completed_by")
+    pagination_class = None
+
+    def get(self, request, *args, **kwargs):
+        limit = self.get_limit()
+        source_answer = self.get_source_answer()
+        source_data = self.get_source_data(source_answer)
+
+        exclude_user_ids = []
+        if request.user.is_authenticated:
+            exclude_user_ids.append(request.user.pk)
+        if source_answer and source_answer.completed_by_id:
+            exclude_user_ids.append(source_answer.completed_by_id)
+
+        candidate_uuids = AnswerSimilarityIndex.get().find_candidates(
+            source_data,
+            max(
+                limit * settings.SIMILARITY_INDEX_OVERSAMPLING,
+                settings.SIMILARITY_INDEX_MIN_CANDIDATES,
+            ),
+            exclude_user_ids=exclude_user_ids,
+            exclude_answer_uuids=[source_answer.uuid.hex] if source_answer else None,
+        )
+        candidates = {
+            answer.uuid.hex: answer
+            for answer in self.get_queryset()
+            .filter(uuid__in=candidate_uuids)
+            .exclude(completed_by_id__in=exclude_user_ids)
+        }
+        structure = StructureIndex.get()
+        totals = AffinityMatrixCalculator(source_data).calculate_totals(
+            {
+                answer_uuid: answer.get_mapped_for_calculation(structure)
+                for answer_uuid, answer in candidates.items()
+            }
+        )
+
+        prefilter_order = {
+            answer_uuid: position
+            for position, answer_uuid in enumerate(candidate_uuids)
+        }
+        ranking = sorted(
+            (
+                {
+                    "target_answer_uuid": candidates[answer_uuid].uuid,
+                    "target_user": candidates[answer_uuid].completed_by,
+                    "total": total,
+                }
+                for answer_uuid, total in totals.items()
+                if total is not None
+            ),
+            key=lambda entry: (
+                -entry["total"],
+                prefilter_order[entry["target_answer_uuid"].hex],
+            ),
+        )[:limit]
+
+        serializer = self.get_serializer(ranking, many=True)
+        return Response(serializer.data, status=status.HTTP_200_OK)
@@ -0,0 +1,33 @@
+from core.api.permissions import IsVerified
+from django.utils.translation import gettext_lazy as _
+from drf_spectacular.utils import extend_schema
+from ideology.api.serializers import (
+    BulkAnswerUpsertResultSerializer,
+    BulkAnswerUpsertSerializer,
+)
+from rest_framework import status
+from rest_framework.generics import CreateAPIView
+from rest_framework.permissions import IsAuthenticated
+from rest_framework.response import Response
+
+
+@extend_schema(
+    tags=["answers"],
+    summary=_("Bulk upsert axis and conditioner answers"),
+    description=_(
+        "Creates or updates up to 500 axis answers and 500 conditioner answers of the "
+        "authenticated user in a single request, e.g. a whole section of the test. "
+        "Answers for unknown axes or conditioners are skipped and reported in the counts."
+    ),
+    request=BulkAnswerUpsertSerializer,
+    responses={200: BulkAnswerUpsertResultSerializer},
+)
+class BulkUpsertAnswersView(CreateAPIView):
+    permission_classes = [IsAuthenticated, IsVerified]
+    serializer_class = BulkAnswerUpsertSerializer
+
+    def create(self, request, *args, **kwargs):
+        serializer = self.get_serializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+        serializer.save()
+        return Response(serializer.data, status=status.HTTP_200_OK)
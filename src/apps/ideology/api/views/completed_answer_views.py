@@ -3,6 +3,7 @@ from django.shortcuts import get_object_or_404
 from django.utils.translation import gettext_lazy as _
 from drf_spectacular.utils import OpenApiParameter, extend_schema
 from ideology.api.serializers import (
+    BulkAnswerUpsertResultSerializer,
     CompletedAnswerSerializer,
     CopyCompletedAnswerSerializer,
 )
@@ -62,10 +63,11 @@ class RetrieveCompletedAnswerView(RetrieveAPIView):
     tags=["answers"],
     summary=_("Copy answers from Completed Answer to Profile"),
     description=_(
-        "Copies all axis and conditioner answers from a specific Completed Answer to the authenticated user's active profile."
+        "Copies all axis and conditioner answers from a specific Completed Answer to the authenticated user's active profile. "
+        "Returns how many answers were inserted, updated or skipped (unknown or invalid entries)."
     ),
     request=None,
-    responses={201: None},
+    responses={201: BulkAnswerUpsertResultSerializer},
     parameters=[
         OpenApiParameter(
             name="uuid",
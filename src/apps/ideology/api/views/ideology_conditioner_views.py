@@ -4,6 +4,7 @@ from ideology.api.serializers import IdeologyConditionerSerializer
 from ideology.models import IdeologyConditioner
 from rest_framework.generics import ListAPIView
 from rest_framework.permissions import AllowAny
+from rest_framework.response import Response
 
 
 @extend_schema(
@@ -28,4 +29,25 @@ class ConditionerListAggregatedByComplexityView(ListAPIView):
 
     def get_queryset(self):
         complexity_uuid = self.kwargs.get("complexity_uuid")
-        return IdeologyConditioner.objects.get_by_complexity(complexity_uuid)
+        return IdeologyConditioner.objects.get_by_complexity(
+            complexity_uuid
+        ).select_related("source_axis")
+
+    def list(self, request, *args, **kwargs):
+        queryset = self.filter_queryset(self.get_queryset())
+        # Nested rules point at conditioners of the same closure, so a single
+        # query covers every level of the serialized tree.
+        context = {
+            **self.get_serializer_context(),
+            "condition_rules": IdeologyConditioner.objects.get_condition_rules_map(
+                queryset
+            ),
+        }
+
+        page = self.paginate_queryset(queryset)
+        if page is not None:
+            serializer = self.get_serializer(page, many=True, context=context)
+            return self.get_paginated_response(serializer.data)
+
+        serializer = self.get_serializer(queryset, many=True, context=context)
+        return Response(serializer.data)
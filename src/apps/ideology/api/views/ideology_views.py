@@ -1,35 +1,74 @@
-from django.db.models import Count
+from core.api.pagination import NameCursorPagination
+from core.helpers import CachedCatalogListAPIView
+from django.db.models import Exists, OuterRef
 from django.utils.translation import gettext_lazy as _
 from django_filters import rest_framework as filters
 from drf_spectacular.utils import OpenApiParameter, extend_schema
 from ideology.api.serializers import IdeologyDetailSerializer, IdeologyListSerializer
-from ideology.models import Ideology
+from ideology.models import Ideology, IdeologyAssociation, IdeologyTag
 from rest_framework.filters import SearchFilter
-from rest_framework.generics import ListAPIView, RetrieveAPIView
+from rest_framework.generics import RetrieveAPIView
 from rest_framework.permissions import AllowAny
 
 
 class IdeologyFilter(filters.FilterSet):
-    country = filters.NumberFilter(field_name="associated_countries__id")
-    region = filters.NumberFilter(field_name="associated_regions__id")
-    religion = filters.UUIDFilter(field_name="associated_religions__uuid")
-    tag = filters.UUIDFilter(field_name="tags__uuid")
+    country = filters.NumberFilter(method="filter_association")
+    region = filters.NumberFilter(method="filter_association")
+    religion = filters.UUIDFilter(method="filter_association")
+    tag = filters.UUIDFilter(method="filter_tag")
 
     class Meta:
         model = Ideology
         fields = ["country", "region", "religion", "tag"]
 
+    # EXISTS subqueries keep one row per ideology, so the list needs neither
+    # joins nor DISTINCT.
+    def filter_association(self, queryset, name, value):
+        lookup = "religion__uuid" if name == "religion" else f"{name}_id"
+        return queryset.filter(
+            Exists(
+                IdeologyAssociation.objects.filter(
+                    ideology=OuterRef("pk"), **{lookup: value}
+                )
+            )
+        )
+
+    def filter_tag(self, queryset, name, value):
+        return queryset.filter(
+            Exists(IdeologyTag.objects.filter(ideology=OuterRef("pk"), tag__uuid=value))
+        )
+
+
+class IdeologySearchFilter(SearchFilter):
+    def get_search_term(self, request) -> str:
+        return (
+            request.query_params.get(self.search_param, "").replace("\x00", "").strip()
+        )
+
+    def filter_queryset(self, request, queryset, view):
+        search_term = self.get_search_term(request)
+        if not search_term:
+            return queryset
+        return Ideology.objects.search(queryset, search_term)
+
+    # The cursor pagination takes its ordering from here, so matches are paged
+    # by relevance while plain listings stay ordered by name.
+    def get_ordering(self, request, queryset, view):
+        if self.get_search_term(request):
+            return ["-search_rank", "pk"]
+        return ["sort_name", "pk"]
+
 
 @extend_schema(
     tags=["ideologies"],
     summary=_("List all ideologies"),
     description=_(
-        "Returns a paginated list of ideologies with at least 15 axis definitions. Supports filtering by related entities and text search."
+        "Returns a cursor paginated list of ideologies with at least 15 axis definitions, ordered by name. Supports filtering by related entities and a full text search that tolerates typos in names; search results are ordered by relevance."
     ),
     parameters=[
         OpenApiParameter(
             name="search",
-            description=_("Search by name or descriptions"),
+            description=_("Search by name or descriptions in the request language"),
             required=False,
             type=str,
         ),
@@ -56,33 +95,20 @@ class IdeologyFilter(filters.FilterSet):
         ),
     ],
 )
-class IdeologyListView(ListAPIView):
+class IdeologyListView(CachedCatalogListAPIView):
     permission_classes = [AllowAny]
+    catalog_cache_namespace = "ideologies"
     serializer_class = IdeologyListSerializer
-    filter_backends = [filters.DjangoFilterBackend, SearchFilter]
+    filter_backends = [filters.DjangoFilterBackend, IdeologySearchFilter]
     filterset_class = IdeologyFilter
-    search_fields = [
-        "name",
-        "description_supporter",
-        "description_detractor",
-        "description_neutral",
-    ]
+    pagination_class = NameCursorPagination
 
     def get_queryset(self):
-        return (
-            Ideology.objects.visible.annotate(
-                definitions_count=Count("axis_definitions")
-            )
-            .filter(definitions_count__gte=15)
-            .select_related()
-            .prefetch_related(
-                "tags",
-                "associated_countries",
-                "associated_regions",
-                "associated_religions",
-            )
-            .order_by("name")
-            .distinct()
+        return Ideology.objects.publishable.prefetch_related(
+            "tags",
+            "associated_countries",
+            "associated_regions",
+            "associated_religions",
         )
 
 
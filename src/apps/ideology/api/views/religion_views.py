@@ -1,9 +1,9 @@
+from core.helpers import CachedCatalogListAPIView
 from django.utils.translation import gettext_lazy as _
 from drf_spectacular.utils import OpenApiParameter, extend_schema
 from ideology.api.serializers import ReligionSerializer
 from ideology.models import Religion
 from rest_framework.filters import SearchFilter
-from rest_framework.generics import ListAPIView
 from rest_framework.permissions import AllowAny
 
 
@@ -17,8 +17,9 @@ from rest_framework.permissions import AllowAny
         ),
     ],
 )
-class ReligionListView(ListAPIView):
+class ReligionListView(CachedCatalogListAPIView):
     permission_classes = [AllowAny]
+    catalog_cache_namespace = "religions"
     serializer_class = ReligionSerializer
     queryset = Religion.objects.all().order_by("name")
     filter_backends = [SearchFilter]
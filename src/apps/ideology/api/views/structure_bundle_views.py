@@ -0,0 +1,132 @@
+import uuid
+
+from django.db.models import Prefetch
+from django.http import Http404, HttpResponse, HttpResponseNotModified
+from django.utils.cache import patch_vary_headers
+from django.utils.http import parse_etags
+from django.utils.translation import gettext_lazy as _
+from drf_spectacular.utils import OpenApiParameter, OpenApiResponse, extend_schema
+from ideology.api.serializers import StructureBundleSerializer
+from ideology.models import (
+    IdeologyAbstractionComplexity,
+    IdeologyAxis,
+    IdeologyAxisConditioner,
+    IdeologyConditioner,
+    IdeologySection,
+    IdeologySectionConditioner,
+)
+from ideology.services.structure_bundle_cache import StructureBundleCache
+from rest_framework.generics import GenericAPIView
+from rest_framework.permissions import AllowAny
+from rest_framework.renderers import JSONRenderer
+
+
+@extend_schema(
+    tags=["structure"],
+    summary=_("Get the full test structure of a complexity"),
+    description=_(
+        "Returns the complexity with its sections, their axes and every relevant conditioner in a single response, "
+        "translated to the request language. The response carries a strong ETag; send it back in If-None-Match "
+        "to get a 304 while the structure is unchanged."
+    ),
+    parameters=[
+        OpenApiParameter(
+            name="complexity_uuid",
+            location=OpenApiParameter.PATH,
+            description="UUID of the Abstraction Complexity",
+            required=True,
+            type=str,
+        ),
+        OpenApiParameter(
+            name="If-None-Match",
+            location=OpenApiParameter.HEADER,
+            description="ETag of a previously fetched bundle",
+            required=False,
+            type=str,
+        ),
+    ],
+    responses={
+        200: StructureBundleSerializer,
+        304: OpenApiResponse(description=_("The bundle has not changed.")),
+    },
+)
+class StructureBundleView(GenericAPIView):
+    permission_classes = [AllowAny]
+    serializer_class = StructureBundleSerializer
+
+    def get_complexity(self):
+        queryset = (
+            IdeologyAbstractionComplexity.objects.all()
+            if self.request.user.is_staff
+            else IdeologyAbstractionComplexity.objects.visible
+        )
+        try:
+            complexity_uuid = uuid.UUID(self.kwargs.get("complexity_uuid"))
+        except (TypeError, ValueError):
+            raise Http404
+        complexity = queryset.filter(uuid=complexity_uuid).first()
+        if complexity is None:
+            raise Http404
+        return complexity
+
+    def build_bundle(self, complexity) -> bytes:
+        sections = (
+            IdeologySection.objects.filter(abstraction_complexity=complexity)
+            .prefetch_related(
+                Prefetch(
+                    "condition_rules",
+                    queryset=IdeologySectionConditioner.objects.select_related(
+                        "conditioner__source_axis"
+                    ),
+                ),
+                Prefetch(
+                    "axes",
+                    queryset=IdeologyAxis.objects.order_by("created").prefetch_related(
+                        Prefetch(
+                            "condition_rules",
+                            queryset=IdeologyAxisConditioner.objects.select_related(
+                                "conditioner__source_axis"
+                            ),
+                        )
+                    ),
+                ),
+            )
+            .order_by("created")
+        )
+        conditioners = IdeologyConditioner.objects.get_by_complexity(
+            complexity.uuid
+        ).select_related("source_axis")
+
+        serializer = self.get_serializer(
+            {
+                "complexity": complexity,
+                "sections": sections,
+                "conditioners": conditioners,
+            },
+            context={
+                **self.get_serializer_context(),
+                "condition_rules": IdeologyConditioner.objects.get_condition_rules_map(
+                    conditioners
+                ),
+            },
+        )
+        return JSONRenderer().render(serializer.data)
+
+    def get(self, request, *args, **kwargs):
+        complexity = self.get_complexity()
+        content, etag = StructureBundleCache.get_or_build(
+            complexity.uuid.hex, lambda: self.build_bundle(complexity)
+        )
+
+        if_none_match = request.headers.get("If-None-Match")
+        if if_none_match and (
+            etag in parse_etags(if_none_match) or if_none_match.strip() == "*"
+        ):
+            response = HttpResponseNotModified()
+        else:
+            response = HttpResponse(content, content_type="application/json")
+
+        response["ETag"] = etag
+        response["Cache-Control"] = "no-cache"
+        patch_vary_headers(response, ["Accept-Language"])
+        return response
@@ -58,7 +58,9 @@ class DeleteAxisAnswerView(UUIDDestroyAPIView):
     def get_object(self):
         axis_uuid = self.kwargs.get(self.lookup_field)
         return get_object_or_404(
-            UserAxisAnswer, user=self.request.user, axis__uuid=axis_uuid
+            UserAxisAnswer.objects.select_related("axis"),
+            user=self.request.user,
+            axis__uuid=axis_uuid,
         )
 
 
@@ -58,7 +58,7 @@ class DeleteConditionerAnswerView(UUIDDestroyAPIView):
     def get_object(self):
         conditioner_uuid = self.kwargs.get(self.lookup_field)
         return get_object_or_404(
-            UserConditionerAnswer,
+            UserConditionerAnswer.objects.select_related("conditioner"),
             user=self.request.user,
             conditioner__uuid=conditioner_uuid,
         )
@@ -9,3 +9,5 @@ class IdeologyConfig(AppConfig):
         from django.contrib.admin import ModelAdmin
 
         ModelAdmin.list_per_page = 15
+
+        from . import signals  # noqa
@@ -0,0 +1,55 @@
+from django.core.management.base import BaseCommand
+from django.db import transaction
+from ideology.models import CompletedAnswer, CompletedAnswerPayload
+
+
+class Command(BaseCommand):
+    help = (
+        "Moves Completed Answers still stored as plain JSON into shared packed "
+        "payloads and optionally removes payloads no snapshot references anymore."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--batch-size", type=int, default=500)
+        parser.add_argument(
+            "--purge-orphans",
+            action="store_true",
+            help="Delete payloads that are no longer referenced by any snapshot.",
+        )
+
+    def handle(self, *args, **options):
+        batch_size = max(options["batch_size"], 1)
+        compacted = 0
+        kept = 0
+        last_pk = 0
+
+        while True:
+            with transaction.atomic():
+                batch = list(
+                    CompletedAnswer.objects.select_for_update(of=("self",))
+                    .filter(payload__isnull=True, pk__gt=last_pk)
+                    .order_by("pk")[:batch_size]
+                )
+                if not batch:
+                    break
+
+                for completed_answer in batch:
+                    completed_answer.answers = completed_answer.raw_answers
+                    completed_answer.save(update_fields=["raw_answers", "payload"])
+                    if completed_answer.payload_id:
+                        compacted += 1
+                    else:
+                        kept += 1
+            last_pk = batch[-1].pk
+
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"Compacted {compacted} snapshots, {kept} kept as plain JSON."
+            )
+        )
+
+        if options["purge_orphans"]:
+            purged, _ = CompletedAnswerPayload.objects.filter(
+                completed_answers__isnull=True
+            ).delete()
+            self.stdout.write(self.style.SUCCESS(f"Purged {purged} orphan payloads."))
@@ -0,0 +1,70 @@
+# Generated by Django 6.0.1 on 2026-10-18 18:51
+
+import django.db.models.deletion
+import django.utils.timezone
+import model_utils.fields
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("core", "0001_initial"),
+        ("ideology", "0001_initial"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="UserAnswerVector",
+            fields=[
+                (
+                    "created",
+                    model_utils.fields.AutoCreatedField(
+                        default=django.utils.timezone.now,
+                        editable=False,
+                        verbose_name="created",
+                    ),
+                ),
+                (
+                    "modified",
+                    model_utils.fields.AutoLastModifiedField(
+                        default=django.utils.timezone.now,
+                        editable=False,
+                        verbose_name="modified",
+                    ),
+                ),
+                (
+                    "user",
+                    models.OneToOneField(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        primary_key=True,
+                        related_name="answer_vector",
+                        serialize=False,
+                        to=settings.AUTH_USER_MODEL,
+                        verbose_name="User",
+                    ),
+                ),
+                (
+                    "axes",
+                    models.JSONField(
+                        default=dict,
+                        help_text="Axis UUID mapped to [value, is_indifferent, margin_left, margin_right].",
+                        verbose_name="Axis Answers",
+                    ),
+                ),
+                (
+                    "conditioners",
+                    models.JSONField(
+                        default=dict,
+                        help_text="Conditioner UUID mapped to the raw answer.",
+                        verbose_name="Conditioner Answers",
+                    ),
+                ),
+            ],
+            options={
+                "verbose_name": "User Answer Vector",
+                "verbose_name_plural": "User Answer Vectors",
+            },
+        ),
+    ]
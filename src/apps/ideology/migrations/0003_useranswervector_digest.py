@@ -0,0 +1,24 @@
+# Generated by Django 6.0.1 on 2026-10-18 19:15
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("ideology", "0002_useranswervector"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="useranswervector",
+            name="digest",
+            field=models.CharField(
+                blank=True,
+                editable=False,
+                help_text="Order-independent hash of the answers, used as the hash of the user's snapshots.",
+                max_length=64,
+                verbose_name="Answer Digest",
+            ),
+        ),
+    ]
@@ -0,0 +1,130 @@
+# Generated by Django 6.0.1 on 2026-10-18 19:25
+
+import django.contrib.postgres.fields
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("ideology", "0003_useranswervector_digest"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="AnswerKey",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                (
+                    "uuid",
+                    models.UUIDField(
+                        editable=False,
+                        help_text="UUID of the axis or conditioner this key stands for.",
+                        unique=True,
+                        verbose_name="UUID",
+                    ),
+                ),
+            ],
+            options={
+                "verbose_name": "Answer Key",
+                "verbose_name_plural": "Answer Keys",
+            },
+        ),
+        migrations.CreateModel(
+            name="CompletedAnswerPayload",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                (
+                    "answer_hash",
+                    models.CharField(
+                        editable=False,
+                        max_length=64,
+                        unique=True,
+                        verbose_name="Answer Hash",
+                    ),
+                ),
+                (
+                    "axes",
+                    django.contrib.postgres.fields.ArrayField(
+                        base_field=models.IntegerField(null=True),
+                        default=list,
+                        help_text="Flat array of (answer key, value, margin_left, margin_right) per axis.",
+                        verbose_name="Axis Answers",
+                    ),
+                ),
+                (
+                    "conditioner_keys",
+                    django.contrib.postgres.fields.ArrayField(
+                        base_field=models.IntegerField(),
+                        default=list,
+                        verbose_name="Conditioner Keys",
+                    ),
+                ),
+                (
+                    "conditioner_values",
+                    django.contrib.postgres.fields.ArrayField(
+                        base_field=models.TextField(),
+                        default=list,
+                        verbose_name="Conditioner Answers",
+                    ),
+                ),
+            ],
+            options={
+                "verbose_name": "Completed Answer Payload",
+                "verbose_name_plural": "Completed Answer Payloads",
+            },
+        ),
+        # The JSON column keeps its name; only the model field is renamed so the
+        # decoded answers can be exposed through CompletedAnswer.answers.
+        migrations.SeparateDatabaseAndState(
+            state_operations=[
+                migrations.RenameField(
+                    model_name="completedanswer",
+                    old_name="answers",
+                    new_name="raw_answers",
+                ),
+                migrations.AlterField(
+                    model_name="completedanswer",
+                    name="raw_answers",
+                    field=models.JSONField(
+                        blank=True,
+                        db_column="answers",
+                        default=dict,
+                        help_text="Answers kept as plain JSON because they could not be packed into a shared payload.",
+                        verbose_name="Raw Answers Data",
+                    ),
+                ),
+            ],
+        ),
+        migrations.AddField(
+            model_name="completedanswer",
+            name="payload",
+            field=models.ForeignKey(
+                blank=True,
+                editable=False,
+                help_text="Packed answers shared by every snapshot with the same hash.",
+                null=True,
+                on_delete=django.db.models.deletion.PROTECT,
+                related_name="completed_answers",
+                to="ideology.completedanswerpayload",
+                verbose_name="Answers Payload",
+            ),
+        ),
+    ]
@@ -0,0 +1,56 @@
+# Generated by Django 6.0.1 on 2026-10-18 19:49
+
+from django.db import migrations, models
+from django.db.models import Count, OuterRef, Subquery
+from django.db.models.functions import Coalesce
+
+
+def fill_definitions_count(apps, schema_editor):
+    Ideology = apps.get_model("ideology", "Ideology")
+    IdeologyAxisDefinition = apps.get_model("ideology", "IdeologyAxisDefinition")
+    definitions_count = (
+        IdeologyAxisDefinition.objects.filter(ideology_id=OuterRef("pk"))
+        .order_by()
+        .values("ideology_id")
+        .annotate(total=Count("pk"))
+        .values("total")
+    )
+    Ideology.objects.update(definitions_count=Coalesce(Subquery(definitions_count), 0))
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("core", "0001_initial"),
+        ("ideology", "0004_completed_answer_payloads"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="ideology",
+            name="definitions_count",
+            field=models.PositiveIntegerField(
+                default=0,
+                editable=False,
+                help_text="Number of axis definitions, kept in sync by the definitions.",
+                verbose_name="Definitions count",
+            ),
+        ),
+        migrations.RunPython(fill_definitions_count, migrations.RunPython.noop),
+        migrations.AddIndex(
+            model_name="ideology",
+            index=models.Index(
+                condition=models.Q(("definitions_count__gte", 15), ("visible", True)),
+                fields=["name_es"],
+                name="ideology_publishable_name_es",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="ideology",
+            index=models.Index(
+                condition=models.Q(("definitions_count__gte", 15), ("visible", True)),
+                fields=["name_en"],
+                name="ideology_publishable_name_en",
+            ),
+        ),
+    ]
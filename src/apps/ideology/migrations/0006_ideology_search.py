@@ -0,0 +1,92 @@
+# Generated by Django 6.0.1 on 2026-10-18 19:58
+
+import django.contrib.postgres.indexes
+import django.contrib.postgres.search
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("core", "0001_initial"),
+        ("ideology", "0005_ideology_definitions_count"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="ideology",
+            name="search_vector_en",
+            field=models.GeneratedField(
+                db_persist=True,
+                expression=django.contrib.postgres.search.CombinedSearchVector(
+                    django.contrib.postgres.search.CombinedSearchVector(
+                        django.contrib.postgres.search.CombinedSearchVector(
+                            django.contrib.postgres.search.SearchVector(
+                                "name_en", config="english", weight="A"
+                            ),
+                            "||",
+                            django.contrib.postgres.search.SearchVector(
+                                "description_neutral_en", config="english", weight="B"
+                            ),
+                            django.contrib.postgres.search.SearchConfig("english"),
+                        ),
+                        "||",
+                        django.contrib.postgres.search.SearchVector(
+                            "description_supporter_en", config="english", weight="C"
+                        ),
+                        django.contrib.postgres.search.SearchConfig("english"),
+                    ),
+                    "||",
+                    django.contrib.postgres.search.SearchVector(
+                        "description_detractor_en", config="english", weight="C"
+                    ),
+                    django.contrib.postgres.search.SearchConfig("english"),
+                ),
+                output_field=django.contrib.postgres.search.SearchVectorField(),
+            ),
+        ),
+        migrations.AddField(
+            model_name="ideology",
+            name="search_vector_es",
+            field=models.GeneratedField(
+                db_persist=True,
+                expression=django.contrib.postgres.search.CombinedSearchVector(
+                    django.contrib.postgres.search.CombinedSearchVector(
+                        django.contrib.postgres.search.CombinedSearchVector(
+                            django.contrib.postgres.search.SearchVector(
+                                "name_es", config="spanish", weight="A"
+                            ),
+                            "||",
+                            django.contrib.postgres.search.SearchVector(
+                                "description_neutral_es", config="spanish", weight="B"
+                            ),
+                            django.contrib.postgres.search.SearchConfig("spanish"),
+                        ),
+                        "||",
+                        django.contrib.postgres.search.SearchVector(
+                            "description_supporter_es", config="spanish", weight="C"
+                        ),
+                        django.contrib.postgres.search.SearchConfig("spanish"),
+                    ),
+                    "||",
+                    django.contrib.postgres.search.SearchVector(
+                        "description_detractor_es", config="spanish", weight="C"
+                    ),
+                    django.contrib.postgres.search.SearchConfig("spanish"),
+                ),
+                output_field=django.contrib.postgres.search.SearchVectorField(),
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="ideology",
+            index=django.contrib.postgres.indexes.GinIndex(
+                fields=["search_vector_es"], name="ideology_search_es"
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="ideology",
+            index=django.contrib.postgres.indexes.GinIndex(
+                fields=["search_vector_en"], name="ideology_search_en"
+            ),
+        ),
+    ]
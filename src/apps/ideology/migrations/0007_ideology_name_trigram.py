@@ -0,0 +1,32 @@
+# Generated by Django 6.0.1 on 2026-10-18 19:58
+
+import django.contrib.postgres.indexes
+from django.contrib.postgres.operations import TrigramExtension
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("ideology", "0006_ideology_search"),
+    ]
+
+    operations = [
+        TrigramExtension(),
+        migrations.AddIndex(
+            model_name="ideology",
+            index=django.contrib.postgres.indexes.GinIndex(
+                fields=["name_es"],
+                name="ideology_name_trgm_es",
+                opclasses=["gin_trgm_ops"],
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="ideology",
+            index=django.contrib.postgres.indexes.GinIndex(
+                fields=["name_en"],
+                name="ideology_name_trgm_en",
+                opclasses=["gin_trgm_ops"],
+            ),
+        ),
+    ]
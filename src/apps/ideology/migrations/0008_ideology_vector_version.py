@@ -0,0 +1,25 @@
+# Generated by Django 6.0.1 on 2026-10-18 20:41
+
+import uuid
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("ideology", "0007_ideology_name_trigram"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="ideology",
+            name="vector_version",
+            field=models.UUIDField(
+                default=uuid.uuid4,
+                editable=False,
+                help_text="Changes whenever the definitions of the ideology change.",
+                verbose_name="Vector version",
+            ),
+        ),
+    ]
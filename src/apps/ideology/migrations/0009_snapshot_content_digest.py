@@ -0,0 +1,31 @@
+# Generated by Django 6.0.1 on 2026-10-18 21:20
+
+from django.db import migrations, models
+
+
+def clear_answer_digests(apps, schema_editor):
+    UserAnswerVector = apps.get_model("ideology", "UserAnswerVector")
+    UserAnswerVector.objects.update(digest="")
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("ideology", "0008_ideology_vector_version"),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name="completedanswer",
+            name="answer_hash",
+            field=models.CharField(
+                blank=True,
+                db_index=True,
+                editable=False,
+                help_text="Order-independent digest of the answers for fast deduplication.",
+                max_length=64,
+                verbose_name="Answer Hash",
+            ),
+        ),
+        migrations.RunPython(clear_answer_digests, migrations.RunPython.noop),
+    ]
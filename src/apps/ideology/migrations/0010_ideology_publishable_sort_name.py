@@ -0,0 +1,51 @@
+# Generated by Django 6.0.1 on 2026-10-18 21:14
+
+import django.db.models.functions.comparison
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("core", "0003_cacheversion"),
+        ("ideology", "0009_snapshot_content_digest"),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name="ideology",
+            name="ideology_publishable_name_es",
+        ),
+        migrations.RemoveIndex(
+            model_name="ideology",
+            name="ideology_publishable_name_en",
+        ),
+        migrations.AddIndex(
+            model_name="ideology",
+            index=models.Index(
+                django.db.models.functions.comparison.Coalesce(
+                    models.F("name_es"),
+                    models.F("name_es"),
+                    models.Value(""),
+                    output_field=models.CharField(),
+                ),
+                models.F("id"),
+                condition=models.Q(("definitions_count__gte", 15), ("visible", True)),
+                name="ideology_publishable_name_es",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="ideology",
+            index=models.Index(
+                django.db.models.functions.comparison.Coalesce(
+                    models.F("name_en"),
+                    models.F("name_es"),
+                    models.Value(""),
+                    output_field=models.CharField(),
+                ),
+                models.F("id"),
+                condition=models.Q(("definitions_count__gte", 15), ("visible", True)),
+                name="ideology_publishable_name_en",
+            ),
+        ),
+    ]
@@ -0,0 +1,113 @@
+# Generated by Django 6.0.1 on 2026-10-18 21:42
+
+import hashlib
+import json
+
+from django.db import migrations, models
+
+AXIS_PAYLOAD_FIELDS = ("uuid", "value", "margin_left", "margin_right")
+BATCH_SIZE = 500
+
+
+def unpack_payload(payload, uuids):
+    stride = len(AXIS_PAYLOAD_FIELDS)
+    return {
+        "conditioners": [
+            {"uuid": uuids[key], "value": value}
+            for key, value in zip(payload.conditioner_keys, payload.conditioner_values)
+        ],
+        "axis": [
+            dict(
+                zip(
+                    AXIS_PAYLOAD_FIELDS,
+                    [
+                        uuids[payload.axes[start]],
+                        *payload.axes[start + 1 : start + stride],
+                    ],
+                )
+            )
+            for start in range(0, len(payload.axes), stride)
+        ],
+    }
+
+
+def rehash_completed_answers(apps, schema_editor):
+    AnswerKey = apps.get_model("ideology", "AnswerKey")
+    CompletedAnswer = apps.get_model("ideology", "CompletedAnswer")
+
+    uuids = {
+        key_id: key_uuid.hex
+        for key_id, key_uuid in AnswerKey.objects.values_list("id", "uuid")
+    }
+    batch = []
+    for answer in CompletedAnswer.objects.select_related("payload").iterator(
+        chunk_size=BATCH_SIZE
+    ):
+        answers = (
+            unpack_payload(answer.payload, uuids)
+            if answer.payload_id
+            else answer.raw_answers
+        )
+        json_string = json.dumps(answers, sort_keys=True)
+        answer.answer_hash = hashlib.sha256(json_string.encode("utf-8")).hexdigest()
+        batch.append(answer)
+        if len(batch) >= BATCH_SIZE:
+            CompletedAnswer.objects.bulk_update(batch, ["answer_hash"])
+            batch = []
+    CompletedAnswer.objects.bulk_update(batch, ["answer_hash"])
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("ideology", "0010_ideology_publishable_sort_name"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="useranswervector",
+            name="snapshot_digest",
+            field=models.CharField(
+                blank=True,
+                editable=False,
+                help_text="Answer digest the snapshot hash was computed for.",
+                max_length=64,
+                verbose_name="Snapshot Digest",
+            ),
+        ),
+        migrations.AddField(
+            model_name="useranswervector",
+            name="snapshot_hash",
+            field=models.CharField(
+                blank=True,
+                editable=False,
+                help_text="Hash of the last snapshot built from these answers.",
+                max_length=64,
+                verbose_name="Snapshot Hash",
+            ),
+        ),
+        migrations.AlterField(
+            model_name="completedanswer",
+            name="answer_hash",
+            field=models.CharField(
+                blank=True,
+                db_index=True,
+                editable=False,
+                help_text="SHA-256 hash of the normalized answers for fast deduplication.",
+                max_length=64,
+                verbose_name="Answer Hash",
+            ),
+        ),
+        migrations.AlterField(
+            model_name="useranswervector",
+            name="digest",
+            field=models.CharField(
+                blank=True,
+                editable=False,
+                help_text="Order-independent hash of the answers, used to detect changes between snapshots.",
+                max_length=64,
+                verbose_name="Answer Digest",
+            ),
+        ),
+        migrations.RunPython(rehash_completed_answers, migrations.RunPython.noop),
+    ]
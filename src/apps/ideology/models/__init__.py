@@ -9,8 +9,11 @@ from .ideology_section import IdeologySection
 from .ideology_axis import IdeologyAxis
 from .user_axis_answer import UserAxisAnswer
 from .user_conditioner_answer import UserConditionerAnswer
+from .user_answer_vector import UserAnswerVector
 from .ideology_axis_definition import IdeologyAxisDefinition
 from .ideology_conditioner_definition import IdeologyConditionerDefinition
+from .answer_key import AnswerKey
+from .completed_answer_payload import CompletedAnswerPayload
 from .completed_answer import CompletedAnswer
 from .ideology_association import IdeologyAssociation
 from .abstract_condition_rule import BaseConditionRule
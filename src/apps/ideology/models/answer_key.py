@@ -0,0 +1,21 @@
+from django.db import models
+from django.utils.translation import gettext_lazy as _
+from ideology.models.managers import AnswerKeyManager
+
+
+class AnswerKey(models.Model):
+    uuid = models.UUIDField(
+        unique=True,
+        editable=False,
+        verbose_name=_("UUID"),
+        help_text=_("UUID of the axis or conditioner this key stands for."),
+    )
+
+    objects = AnswerKeyManager()
+
+    class Meta:
+        verbose_name = _("Answer Key")
+        verbose_name_plural = _("Answer Keys")
+
+    def __str__(self):
+        return f"{self.pk}: {self.uuid.hex}"
@@ -1,20 +1,14 @@
-import uuid
-from typing import Any, Dict, List
+import copy
+from typing import Dict, List, Optional
 
 from core.models import TimeStampedUUIDModel, User
-from django.db import models
+from django.db import models, transaction
 from django.utils.translation import gettext_lazy as _
-from ideology.models import (
-    IdeologyAxis,
-    IdeologyConditioner,
-    IdeologyConditionerDefinition,
-)
+from ideology.models import CompletedAnswerPayload, IdeologyConditionerDefinition
 from ideology.models.managers import CompletedAnswerManager
 from ideology.services.calculation_dto import CalculationItem
-from ideology.services.mapping_helpers import (
-    format_mapped_item,
-    get_conditioner_complexity_annotation,
-)
+from ideology.services.mapping_helpers import extract_uuid, format_mapped_item
+from ideology.services.structure_index import StructureIndex
 
 
 class CompletedAnswer(TimeStampedUUIDModel):
@@ -26,13 +20,25 @@ class CompletedAnswer(TimeStampedUUIDModel):
         verbose_name=_("Completed By"),
         help_text=_("The user who submitted this set of answers."),
     )
-    answers = models.JSONField(
+    raw_answers = models.JSONField(
         default=dict,
-        verbose_name=_("Answers Data"),
+        blank=True,
+        db_column="answers",
+        verbose_name=_("Raw Answers Data"),
         help_text=_(
-            "Structured JSON containing the full set of answers provided by the user."
+            "Answers kept as plain JSON because they could not be packed into a shared payload."
         ),
     )
+    payload = models.ForeignKey(
+        "ideology.CompletedAnswerPayload",
+        null=True,
+        blank=True,
+        editable=False,
+        on_delete=models.PROTECT,
+        related_name="completed_answers",
+        verbose_name=_("Answers Payload"),
+        help_text=_("Packed answers shared by every snapshot with the same hash."),
+    )
     answer_hash = models.CharField(
         max_length=64,
         db_index=True,
@@ -53,19 +59,63 @@ class CompletedAnswer(TimeStampedUUIDModel):
         username = self.completed_by.username if self.completed_by else _("Anonymous")
         return f"Answers by {username} ({self.created.strftime('%Y-%m-%d')})"
 
-    def get_mapped_for_calculation(self) -> Dict[str, CalculationItem]:
-        return {**self._map_axes(), **self._map_conditioners()}
+    @property
+    def answers(self):
+        if "_answers" not in self.__dict__:
+            self._answers = (
+                self.payload.unpack() if self.payload_id else self.raw_answers
+            )
+            self._stored_answers = copy.deepcopy(self._answers)
+        return self._answers
+
+    @answers.setter
+    def answers(self, value):
+        self._answers = value
+
+    def save(self, *args, **kwargs):
+        with transaction.atomic():
+            if self._answers_changed():
+                self._pack_answers()
+            super().save(*args, **kwargs)
+
+    def refresh_from_db(self, *args, **kwargs):
+        self.__dict__.pop("_answers", None)
+        self.__dict__.pop("_stored_answers", None)
+        super().refresh_from_db(*args, **kwargs)
+
+    # Reading .answers keeps a copy of what was loaded, so saving an instance
+    # whose answers were only read does not pack them again.
+    def _answers_changed(self) -> bool:
+        if "_answers" not in self.__dict__:
+            return False
+        return (
+            "_stored_answers" not in self.__dict__
+            or self._answers != self._stored_answers
+        )
+
+    def _pack_answers(self) -> None:
+        answers = self._answers
+        payload = CompletedAnswerPayload.objects.store(answers)
+        self.payload = payload
+        self.raw_answers = {} if payload else answers
+        self._stored_answers = copy.deepcopy(answers)
 
-    def _map_axes(self) -> Dict[str, CalculationItem]:
+    def get_mapped_for_calculation(
+        self, structure: Optional[StructureIndex] = None
+    ) -> Dict[str, CalculationItem]:
+        structure = structure or StructureIndex.get()
+        return {**self._map_axes(structure), **self._map_conditioners(structure)}
+
+    def _map_axes(self, structure: StructureIndex) -> Dict[str, CalculationItem]:
         raw_axes = self.answers.get("axis", [])
         if not raw_axes:
             return {}
 
-        hierarchy_map = self._build_axis_hierarchy_map(raw_axes)
+        hierarchy_map = self._build_axis_hierarchy_map(raw_axes, structure)
         mapped_axes = {}
 
         for axis in raw_axes:
-            clean_uuid = self._extract_uuid(axis)
+            clean_uuid = extract_uuid(axis)
             if not clean_uuid or clean_uuid not in hierarchy_map:
                 continue
 
@@ -75,21 +125,25 @@ class CompletedAnswer(TimeStampedUUIDModel):
                 complexity_uuid=hierarchy_map[clean_uuid]["complexity_uuid"],
                 is_indifferent=axis.get("is_indifferent", False),
                 section_uuid=hierarchy_map[clean_uuid]["section_uuid"],
-                margin_left=axis.get("margin_left", 0),
-                margin_right=axis.get("margin_right", 0),
+                margin_left=axis.get("margin_left") or 0,
+                margin_right=axis.get("margin_right") or 0,
             )
         return mapped_axes
 
-    def _map_conditioners(self) -> Dict[str, CalculationItem]:
+    def _map_conditioners(
+        self, structure: StructureIndex
+    ) -> Dict[str, CalculationItem]:
         raw_conditioners = self.answers.get("conditioners", [])
         if not raw_conditioners:
             return {}
 
-        complexity_map = self._build_conditioner_complexity_map(raw_conditioners)
+        complexity_map = self._build_conditioner_complexity_map(
+            raw_conditioners, structure
+        )
         mapped_conditioners = {}
 
         for item in raw_conditioners:
-            clean_uuid = self._extract_uuid(item)
+            clean_uuid = extract_uuid(item)
             if not clean_uuid:
                 continue
 
@@ -104,64 +158,32 @@ class CompletedAnswer(TimeStampedUUIDModel):
             )
         return mapped_conditioners
 
-    @staticmethod
-    def _build_axis_hierarchy_map(raw_axes: List[Dict]) -> Dict[str, Dict[str, str]]:
-        axis_uuids = []
+    @classmethod
+    def _build_axis_hierarchy_map(
+        cls, raw_axes: List[Dict], structure: StructureIndex
+    ) -> Dict[str, Dict[str, str]]:
+        hierarchy_map = {}
         for item in raw_axes:
-            try:
-                axis_uuids.append(uuid.UUID(item["uuid"]))
-            except (ValueError, TypeError, KeyError, AttributeError):
-                continue
-
-        if not axis_uuids:
-            return {}
+            axis_uuid = extract_uuid(item)
+            hierarchy = structure.get_axis_hierarchy(axis_uuid) if axis_uuid else None
+            if hierarchy:
+                hierarchy_map[axis_uuid] = hierarchy
+        return hierarchy_map
 
-        ideology_axis_queryset = IdeologyAxis.objects.filter(
-            uuid__in=axis_uuids
-        ).values("uuid", "section__uuid", "section__abstraction_complexity__uuid")
-
-        return {
-            axis["uuid"].hex: {
-                "section_uuid": axis["section__uuid"].hex,
-                "complexity_uuid": axis["section__abstraction_complexity__uuid"].hex,
-            }
-            for axis in ideology_axis_queryset
-        }
-
-    @staticmethod
+    @classmethod
     def _build_conditioner_complexity_map(
+        cls,
         raw_conditioners: List[Dict],
+        structure: StructureIndex,
     ) -> Dict[str, str]:
-        cond_uuids = []
+        complexity_map = {}
         for item in raw_conditioners:
-            try:
-                cond_uuids.append(uuid.UUID(item["uuid"]))
-            except (ValueError, TypeError, KeyError, AttributeError):
-                continue
-
-        if not cond_uuids:
-            return {}
-
-        ideology_conditioner_queryset = (
-            IdeologyConditioner.objects.filter(uuid__in=cond_uuids)
-            .annotate(
-                inferred_complexity=get_conditioner_complexity_annotation(prefix="")
+            conditioner_uuid = extract_uuid(item)
+            complexity_uuid = (
+                structure.get_conditioner_complexity(conditioner_uuid)
+                if conditioner_uuid
+                else None
             )
-            .values("uuid", "inferred_complexity")
-        )
-
-        return {
-            conditioner["uuid"].hex: conditioner["inferred_complexity"].hex
-            for conditioner in ideology_conditioner_queryset
-            if conditioner["inferred_complexity"]
-        }
-
-    @staticmethod
-    def _extract_uuid(item: Dict[str, Any]) -> str | None:
-        try:
-            raw_uuid = item.get("uuid")
-            if isinstance(raw_uuid, str):
-                return uuid.UUID(raw_uuid).hex
-        except (AttributeError, ValueError, TypeError):
-            pass
-        return None
+            if complexity_uuid:
+                complexity_map[conditioner_uuid] = complexity_uuid
+        return complexity_map
@@ -0,0 +1,70 @@
+from typing import Dict, List
+
+from django.contrib.postgres.fields import ArrayField
+from django.db import models
+from django.utils.translation import gettext_lazy as _
+from ideology.models.answer_key import AnswerKey
+from ideology.models.managers import CompletedAnswerPayloadManager
+from ideology.models.managers.completed_answer_payload_manager import (
+    AXIS_PAYLOAD_FIELDS,
+)
+
+
+class CompletedAnswerPayload(models.Model):
+    answer_hash = models.CharField(
+        max_length=64,
+        unique=True,
+        editable=False,
+        verbose_name=_("Answer Hash"),
+    )
+    axes = ArrayField(
+        models.IntegerField(null=True),
+        default=list,
+        verbose_name=_("Axis Answers"),
+        help_text=_(
+            "Flat array of (answer key, value, margin_left, margin_right) per axis."
+        ),
+    )
+    conditioner_keys = ArrayField(
+        models.IntegerField(),
+        default=list,
+        verbose_name=_("Conditioner Keys"),
+    )
+    conditioner_values = ArrayField(
+        models.TextField(),
+        default=list,
+        verbose_name=_("Conditioner Answers"),
+    )
+
+    objects = CompletedAnswerPayloadManager()
+
+    class Meta:
+        verbose_name = _("Completed Answer Payload")
+        verbose_name_plural = _("Completed Answer Payloads")
+
+    def __str__(self):
+        return self.answer_hash
+
+    def unpack(self) -> Dict[str, List[Dict]]:
+        stride = len(AXIS_PAYLOAD_FIELDS)
+        uuids = AnswerKey.objects.get_uuids(
+            [*self.axes[::stride], *self.conditioner_keys]
+        )
+        return {
+            "conditioners": [
+                {"uuid": uuids[key], "value": value}
+                for key, value in zip(self.conditioner_keys, self.conditioner_values)
+            ],
+            "axis": [
+                dict(
+                    zip(
+                        AXIS_PAYLOAD_FIELDS,
+                        [
+                            uuids[self.axes[start]],
+                            *self.axes[start + 1 : start + stride],
+                        ],
+                    )
+                )
+                for start in range(0, len(self.axes), stride)
+            ],
+        }
@@ -1,15 +1,22 @@
+import uuid
 from typing import Dict
 
-from core.helpers import handle_storage
+from core.helpers import build_localized_sort_key, handle_storage
 from core.models import TimeStampedUUIDModel, VisibleMixin
+from django.conf import settings
+from django.contrib.postgres.indexes import GinIndex
+from django.contrib.postgres.search import SearchVectorField
 from django.db import models
 from django.utils.translation import gettext_lazy as _
 from ideology.models.managers import IdeologyManager
-from ideology.services.calculation_dto import CalculationItem
-from ideology.services.mapping_helpers import (
-    format_mapped_item,
-    get_conditioner_complexity_annotation,
+from ideology.models.managers.ideology_manager import (
+    PUBLISHABLE_DEFINITIONS_COUNT,
+    build_search_vector,
 )
+from ideology.services.calculation_dto import CalculationItem
+from ideology.services.ideology_vector_cache import IdeologyVectorCache
+from ideology.services.mapping_helpers import format_mapped_item
+from ideology.services.structure_index import StructureIndex
 
 
 class Ideology(VisibleMixin, TimeStampedUUIDModel):
@@ -91,51 +98,102 @@ class Ideology(VisibleMixin, TimeStampedUUIDModel):
         verbose_name=_("Tags"),
         help_text=_("Tags associated with this ideology."),
     )
+    definitions_count = models.PositiveIntegerField(
+        default=0,
+        editable=False,
+        verbose_name=_("Definitions count"),
+        help_text=_("Number of axis definitions, kept in sync by the definitions."),
+    )
+    vector_version = models.UUIDField(
+        default=uuid.uuid4,
+        editable=False,
+        verbose_name=_("Vector version"),
+        help_text=_("Changes whenever the definitions of the ideology change."),
+    )
+    search_vector_es = models.GeneratedField(
+        expression=build_search_vector("es"),
+        output_field=SearchVectorField(),
+        db_persist=True,
+    )
+    search_vector_en = models.GeneratedField(
+        expression=build_search_vector("en"),
+        output_field=SearchVectorField(),
+        db_persist=True,
+    )
 
     objects = IdeologyManager()
 
     class Meta:
         verbose_name = _("Ideology")
         verbose_name_plural = _("Ideologies")
+        indexes = [
+            models.Index(
+                build_localized_sort_key("name", language),
+                "id",
+                condition=models.Q(
+                    visible=True,
+                    definitions_count__gte=PUBLISHABLE_DEFINITIONS_COUNT,
+                ),
+                name=f"ideology_publishable_name_{language}",
+            )
+            for language in settings.MODELTRANSLATION_LANGUAGES
+        ] + [
+            index
+            for language in settings.MODELTRANSLATION_LANGUAGES
+            for index in (
+                GinIndex(
+                    fields=[f"search_vector_{language}"],
+                    name=f"ideology_search_{language}",
+                ),
+                GinIndex(
+                    fields=[f"name_{language}"],
+                    opclasses=["gin_trgm_ops"],
+                    name=f"ideology_name_trgm_{language}",
+                ),
+            )
+        ]
 
-    def get_mapped_for_calculation(self) -> Dict[str, CalculationItem]:
-        return {**self._map_axis_definitions(), **self._map_conditioner_definitions()}
-
-    def _map_axis_definitions(self) -> Dict[str, CalculationItem]:
-        definitions = self.axis_definitions.select_related(
-            "axis", "axis__section", "axis__section__abstraction_complexity"
-        ).all()
+    def save(self, *args, **kwargs):
+        # The counter and the vector version are written by the definitions; a
+        # stale instance must not overwrite them when the rest of the ideology
+        # is saved.
+        if not self._state.adding and kwargs.get("update_fields") is None:
+            kwargs["update_fields"] = [
+                field.name
+                for field in self._meta.concrete_fields
+                if not field.primary_key
+                and not field.generated
+                and field.name not in ("definitions_count", "vector_version")
+            ]
+        super().save(*args, **kwargs)
 
-        return {
-            definition.axis.uuid.hex: format_mapped_item(
-                item_type="axis",
-                value=definition.value,
-                complexity_uuid=definition.axis.section.abstraction_complexity.uuid.hex,
-                is_indifferent=definition.is_indifferent,
-                section_uuid=definition.axis.section.uuid.hex,
-                margin_left=definition.margin_left or 0,
-                margin_right=definition.margin_right or 0,
-            )
-            for definition in definitions
-        }
+    def get_mapped_for_calculation(self) -> Dict[str, CalculationItem]:
+        return IdeologyVectorCache.get(self)
 
-    def _map_conditioner_definitions(self) -> Dict[str, CalculationItem]:
-        definitions = self.conditioner_definitions.select_related(
-            "conditioner"
-        ).annotate(
-            inferred_complexity=get_conditioner_complexity_annotation("conditioner")
+    @staticmethod
+    def format_axis_definition(
+        definition, structure: StructureIndex
+    ) -> CalculationItem:
+        hierarchy = structure.resolve_axis_hierarchy(definition.axis)
+        return format_mapped_item(
+            item_type="axis",
+            value=definition.value,
+            complexity_uuid=hierarchy["complexity_uuid"],
+            is_indifferent=definition.is_indifferent,
+            section_uuid=hierarchy["section_uuid"],
+            margin_left=definition.margin_left or 0,
+            margin_right=definition.margin_right or 0,
         )
 
-        return {
-            definition.conditioner.uuid.hex: format_mapped_item(
-                item_type="conditioner",
-                value=definition.answer,
-                complexity_uuid=(
-                    definition.inferred_complexity.hex
-                    if definition.inferred_complexity
-                    else None
-                ),
-                is_indifferent=definition.is_indifferent_answer,
-            )
-            for definition in definitions
-        }
+    @staticmethod
+    def format_conditioner_definition(
+        definition, structure: StructureIndex
+    ) -> CalculationItem:
+        return format_mapped_item(
+            item_type="conditioner",
+            value=definition.answer,
+            complexity_uuid=structure.get_conditioner_complexity(
+                definition.conditioner.uuid.hex
+            ),
+            is_indifferent=definition.is_indifferent_answer,
+        )
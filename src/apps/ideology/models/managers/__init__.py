@@ -1,6 +1,9 @@
 from .user_axis_answer_manager import UserAxisAnswerManager
 from .user_conditioner_answer_manager import UserConditionerAnswerManager
+from .user_answer_vector_manager import UserAnswerVectorManager
 from .ideology_conditioner_managers import IdeologyConditionerManager
+from .answer_key_manager import AnswerKeyManager
+from .completed_answer_payload_manager import CompletedAnswerPayloadManager
 from .completed_answer_manager import CompletedAnswerManager
 from .ideology_abstraction_complexity_managers import (
     IdeologyAbstractionComplexityManager,
@@ -0,0 +1,62 @@
+from typing import Dict, Iterable, Optional
+
+from django.apps import apps
+from django.db import models
+
+
+class AnswerKeyManager(models.Manager):
+    # Keys are never updated or deleted, so the reverse mapping is safe to keep
+    # for the whole life of the process.
+    uuid_cache: Dict[int, str] = {}
+
+    def _fetch_ids(self, uuids: Iterable[str]) -> Dict[str, int]:
+        ids = {
+            key_uuid.hex: pk
+            for pk, key_uuid in self.filter(uuid__in=list(uuids))
+            .order_by()
+            .values_list("pk", "uuid")
+        }
+        self.uuid_cache.update({pk: key_uuid for key_uuid, pk in ids.items()})
+        return ids
+
+    def get_ids(self, uuids: Iterable[str]) -> Optional[Dict[str, int]]:
+        IdeologyAxis = apps.get_model("ideology", "IdeologyAxis")
+        IdeologyConditioner = apps.get_model("ideology", "IdeologyConditioner")
+
+        uuids = set(uuids)
+        ids = self._fetch_ids(uuids)
+        missing = uuids - ids.keys()
+        if not missing:
+            return ids
+
+        # Only UUIDs of existing axes and conditioners become keys, so arbitrary
+        # anonymous input cannot grow the table.
+        known = {
+            key_uuid.hex
+            for model in (IdeologyAxis, IdeologyConditioner)
+            for key_uuid in model.objects.filter(uuid__in=list(missing))
+            .order_by()
+            .values_list("uuid", flat=True)
+        }
+        if known != missing:
+            return None
+
+        self.bulk_create(
+            [self.model(uuid=key_uuid) for key_uuid in missing],
+            ignore_conflicts=True,
+        )
+        ids.update(self._fetch_ids(missing))
+        return ids
+
+    def get_uuids(self, ids: Iterable[int]) -> Dict[int, str]:
+        missing = set(ids) - self.uuid_cache.keys()
+        if missing:
+            self.uuid_cache.update(
+                {
+                    pk: key_uuid.hex
+                    for pk, key_uuid in self.filter(pk__in=missing).values_list(
+                        "pk", "uuid"
+                    )
+                }
+            )
+        return self.uuid_cache
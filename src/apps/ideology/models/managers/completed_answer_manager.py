@@ -2,10 +2,14 @@ import hashlib
 import json
 from typing import Any
 
+from django.apps import apps
 from django.db import models
 
 
 class CompletedAnswerManager(models.Manager):
+    def get_queryset(self):
+        return super().get_queryset().select_related("payload")
+
     def generate_snapshot(self, user=None, input_data=None):
         final_data: dict[str, list[dict[str, Any]]] = {
             "conditioners": [],
@@ -14,12 +18,12 @@ class CompletedAnswerManager(models.Manager):
         user_object = user if user and user.is_authenticated else None
 
         if user_object:
-            final_data = self._build_from_db(user_object)
-        elif input_data:
+            return self._generate_user_snapshot(user_object)
+        if input_data:
             processed_input = self._process_anonymous_input_data(input_data)
             final_data = self._normalize_data(processed_input)
 
-        data_hash = self._calculate_hash(final_data)
+        data_hash = self.calculate_hash(final_data)
 
         existing_answer = self.filter(
             completed_by=user_object, answer_hash=data_hash
@@ -34,6 +38,34 @@ class CompletedAnswerManager(models.Manager):
             answer_hash=data_hash,
         )
 
+    def _generate_user_snapshot(self, user):
+        UserAnswerVector = apps.get_model("ideology", "UserAnswerVector")
+        vector = UserAnswerVector.objects.get_vector(user)
+        # The vector remembers the hash of the last snapshot built from it, so
+        # while its digest is unchanged the JSON does not need to be rebuilt.
+        if vector.snapshot_hash and vector.snapshot_digest == vector.digest:
+            existing_answer = self.filter(
+                completed_by=user, answer_hash=vector.snapshot_hash
+            ).first()
+            if existing_answer:
+                return existing_answer
+
+        final_data = UserAnswerVector.objects.build_snapshot(
+            vector.axes, vector.conditioners
+        )
+        data_hash = self.calculate_hash(final_data)
+        UserAnswerVector.objects.remember_snapshot(vector, data_hash)
+
+        existing_answer = self.filter(completed_by=user, answer_hash=data_hash).first()
+        if existing_answer:
+            return existing_answer
+
+        return self.create(
+            completed_by=user,
+            answers=final_data,
+            answer_hash=data_hash,
+        )
+
     @staticmethod
     def _process_anonymous_input_data(input_data: dict[str, Any]) -> dict[str, Any]:
         axis_data = [
@@ -49,44 +81,10 @@ class CompletedAnswerManager(models.Manager):
         }
 
     @staticmethod
-    def _calculate_hash(data: dict) -> str:
+    def calculate_hash(data: dict) -> str:
         json_string = json.dumps(data, sort_keys=True)
         return hashlib.sha256(json_string.encode("utf-8")).hexdigest()
 
-    @staticmethod
-    def _build_from_db(user):
-        from ideology.models import UserAxisAnswer, UserConditionerAnswer
-
-        user_axis_answers = (
-            UserAxisAnswer.objects.filter(user=user)
-            .select_related("axis")
-            .order_by("axis__uuid")
-        )
-        user_conditioner_answers = (
-            UserConditionerAnswer.objects.filter(user=user)
-            .select_related("conditioner")
-            .order_by("conditioner__uuid")
-        )
-
-        return {
-            "conditioners": [
-                {
-                    "uuid": user_conditioner_answer.conditioner.uuid.hex,
-                    "value": user_conditioner_answer.answer,
-                }
-                for user_conditioner_answer in user_conditioner_answers
-            ],
-            "axis": [
-                {
-                    "uuid": user_axis_answer.axis.uuid.hex,
-                    "value": user_axis_answer.value,
-                    "margin_left": user_axis_answer.margin_left,
-                    "margin_right": user_axis_answer.margin_right,
-                }
-                for user_axis_answer in user_axis_answers
-            ],
-        }
-
     @staticmethod
     def _normalize_data(data: dict) -> dict:
         normalized_data = {
@@ -0,0 +1,100 @@
+import hashlib
+import json
+from typing import Any, Dict, List, Optional
+
+from django.apps import apps
+from django.db import models
+from ideology.services.mapping_helpers import extract_uuid
+
+AXIS_PAYLOAD_FIELDS = ("uuid", "value", "margin_left", "margin_right")
+CONDITIONER_PAYLOAD_FIELDS = ("uuid", "value")
+
+
+class CompletedAnswerPayloadManager(models.Manager):
+    @staticmethod
+    def _is_packable_integer(value: Any) -> bool:
+        if value is None:
+            return True
+        return (
+            isinstance(value, int)
+            and not isinstance(value, bool)
+            and -(2**31) <= value < 2**31
+        )
+
+    @classmethod
+    def is_packable(cls, answers: Any) -> bool:
+        if not isinstance(answers, dict) or set(answers) != {"axis", "conditioners"}:
+            return False
+        if not isinstance(answers["axis"], list) or not isinstance(
+            answers["conditioners"], list
+        ):
+            return False
+
+        for item in answers["axis"]:
+            if (
+                not isinstance(item, dict)
+                or set(item) != set(AXIS_PAYLOAD_FIELDS)
+                or extract_uuid(item) != item["uuid"]
+                or not all(
+                    cls._is_packable_integer(item[field])
+                    for field in AXIS_PAYLOAD_FIELDS[1:]
+                )
+            ):
+                return False
+        for item in answers["conditioners"]:
+            if (
+                not isinstance(item, dict)
+                or set(item) != set(CONDITIONER_PAYLOAD_FIELDS)
+                or extract_uuid(item) != item["uuid"]
+                or not isinstance(item["value"], str)
+            ):
+                return False
+        return True
+
+    @staticmethod
+    def calculate_hash(
+        axes: List[Optional[int]],
+        conditioner_keys: List[int],
+        conditioner_values: List[str],
+    ) -> str:
+        packed = json.dumps(
+            [axes, conditioner_keys, conditioner_values], separators=(",", ":")
+        )
+        return hashlib.sha256(packed.encode("utf-8")).hexdigest()
+
+    def store(self, answers: Dict) -> Optional[models.Model]:
+        AnswerKey = apps.get_model("ideology", "AnswerKey")
+
+        if not self.is_packable(answers):
+            return None
+
+        key_ids = AnswerKey.objects.get_ids(
+            item["uuid"] for item in answers["axis"] + answers["conditioners"]
+        )
+        if key_ids is None:
+            return None
+
+        axes = []
+        for item in answers["axis"]:
+            axes.extend(
+                [
+                    key_ids[item["uuid"]],
+                    item["value"],
+                    item["margin_left"],
+                    item["margin_right"],
+                ]
+            )
+        conditioner_keys = [key_ids[item["uuid"]] for item in answers["conditioners"]]
+        conditioner_values = [item["value"] for item in answers["conditioners"]]
+
+        # Payloads are keyed by the hash of what they hold, so a payload is
+        # only ever shared by snapshots with exactly the same answers.
+        payload, _ = self.get_or_create(
+            answer_hash=self.calculate_hash(axes, conditioner_keys, conditioner_values),
+            defaults={
+                "axes": axes,
+                "conditioner_keys": conditioner_keys,
+                "conditioner_values": conditioner_values,
+            },
+        )
+        return payload
@@ -1,12 +1,16 @@
+from collections import defaultdict
+from typing import Dict, List
+
 from django.db import models
 from django.db.models import Q
+from django.db.models.expressions import RawSQL
 
 
 class IdeologyConditionerManager(models.Manager):
     def get_by_complexity(self, complexity_uuid: str):
         from ideology.models import IdeologyConditionerConditioner
 
-        relevant_ids = set(
+        seed_sql, seed_params = (
             self.filter(
                 Q(
                     ideologysectionconditioner_rules__section__abstraction_complexity__uuid=complexity_uuid
@@ -15,29 +19,44 @@ class IdeologyConditionerManager(models.Manager):
                     ideologyaxisconditioner_rules__axis__section__abstraction_complexity__uuid=complexity_uuid
                 )
                 | Q(source_axis__section__abstraction_complexity__uuid=complexity_uuid)
-            ).values_list("id", flat=True)
+            )
+            .order_by()
+            .values("id")
+            .query.sql_with_params()
         )
+        rules_table = IdeologyConditionerConditioner._meta.db_table
+
+        # Dependencies are followed in both directions until no new conditioner
+        # shows up; UNION drops repeated rows, so cycles terminate. Only the
+        # ORM-compiled seed query and the table name from _meta are formatted
+        # into the SQL; every value is passed as a bound parameter.
+        closure_sql = f"""
+            WITH RECURSIVE closure(id) AS (
+                {seed_sql}
+                UNION
+                SELECT CASE
+                    WHEN rule.conditioner_id = closure.id
+                    THEN rule.target_conditioner_id
+                    ELSE rule.conditioner_id
+                END
+                FROM {rules_table} rule
+                JOIN closure
+                    ON closure.id IN (rule.conditioner_id, rule.target_conditioner_id)
+            )
+            SELECT id FROM closure
+        """  # nosec B608
+
+        return self.filter(
+            id__in=RawSQL(closure_sql, seed_params)  # nosec B611
+        ).order_by("created")
+
+    @staticmethod
+    def get_condition_rules_map(conditioners) -> Dict[int, List]:
+        from ideology.models import IdeologyConditionerConditioner
 
-        current_pool = list(relevant_ids)
-
-        while current_pool:
-            new_ids = set()
-
-            parents = IdeologyConditionerConditioner.objects.filter(
-                target_conditioner__id__in=current_pool
-            ).values_list("conditioner_id", flat=True)
-
-            children = IdeologyConditionerConditioner.objects.filter(
-                conditioner__id__in=current_pool
-            ).values_list("target_conditioner_id", flat=True)
-
-            potential_new = set(parents) | set(children)
-            new_ids = potential_new - relevant_ids
-
-            if not new_ids:
-                break
-
-            relevant_ids.update(new_ids)
-            current_pool = list(new_ids)
-
-        return self.filter(id__in=relevant_ids).order_by("created")
+        rules_map = defaultdict(list)
+        for rule in IdeologyConditionerConditioner.objects.filter(
+            target_conditioner__in=conditioners.order_by().values("id")
+        ).select_related("conditioner__source_axis", "target_conditioner"):
+            rules_map[rule.target_conditioner_id].append(rule)
+        return rules_map
@@ -1,6 +1,110 @@
+from typing import Dict, Iterable
+
 from core.models.managers import VisibleManagerMixin
+from django.apps import apps
+from django.contrib.postgres.search import (
+    SearchQuery,
+    SearchRank,
+    SearchVector,
+    TrigramWordSimilarity,
+)
 from django.db import models
+from django.db.models import Count, F, OuterRef, Q, Subquery
+from django.db.models.functions import Coalesce
+from ideology.services.calculation_dto import CalculationItem
+from ideology.services.structure_index import StructureIndex
+from modeltranslation.utils import get_language
+
+PUBLISHABLE_DEFINITIONS_COUNT = 15
+SEARCH_CONFIGS = {"es": "spanish", "en": "english"}
+SEARCH_WEIGHTS = {
+    "name": "A",
+    "description_neutral": "B",
+    "description_supporter": "C",
+    "description_detractor": "C",
+}
+
+
+def build_search_vector(language: str) -> SearchVector:
+    vectors = [
+        SearchVector(
+            f"{field}_{language}", weight=weight, config=SEARCH_CONFIGS[language]
+        )
+        for field, weight in SEARCH_WEIGHTS.items()
+    ]
+    search_vector = vectors[0]
+    for vector in vectors[1:]:
+        search_vector = search_vector + vector
+    return search_vector
 
 
 class IdeologyManager(VisibleManagerMixin, models.Manager):
-    pass
+    @property
+    def publishable(self):
+        return self.visible.filter(definitions_count__gte=PUBLISHABLE_DEFINITIONS_COUNT)
+
+    @staticmethod
+    def search(queryset, term: str):
+        language = get_language()
+        query = SearchQuery(
+            term, config=SEARCH_CONFIGS[language], search_type="websearch"
+        )
+        name_field = f"name_{language}"
+        # Full text covers every description; the trigram match on the name
+        # keeps typos findable.
+        return queryset.annotate(
+            search_rank=SearchRank(F(f"search_vector_{language}"), query)
+            + TrigramWordSimilarity(term, name_field)
+        ).filter(
+            Q(**{f"search_vector_{language}": query})
+            | Q(**{f"{name_field}__trigram_word_similar": term})
+        )
+
+    def refresh_definitions_count(self, ideology_ids: Iterable[int]) -> int:
+        IdeologyAxisDefinition = apps.get_model("ideology", "IdeologyAxisDefinition")
+        definitions_count = (
+            IdeologyAxisDefinition.objects.filter(ideology_id=OuterRef("pk"))
+            .order_by()
+            .values("ideology_id")
+            .annotate(total=Count("pk"))
+            .values("total")
+        )
+        return (
+            self.get_queryset()
+            .filter(pk__in=list(ideology_ids))
+            .update(definitions_count=Coalesce(Subquery(definitions_count), 0))
+        )
+
+    def get_mapped_for_calculation(
+        self, ideologies: Iterable
+    ) -> Dict[int, Dict[str, CalculationItem]]:
+        IdeologyAxisDefinition = apps.get_model("ideology", "IdeologyAxisDefinition")
+        IdeologyConditionerDefinition = apps.get_model(
+            "ideology", "IdeologyConditionerDefinition"
+        )
+
+        mapped: Dict[int, Dict[str, CalculationItem]] = {
+            ideology.pk: {} for ideology in ideologies
+        }
+        if not mapped:
+            return mapped
+
+        structure = StructureIndex.get()
+
+        axis_definitions = IdeologyAxisDefinition.objects.filter(
+            ideology_id__in=mapped.keys()
+        ).select_related("axis")
+        for definition in axis_definitions:
+            mapped[definition.ideology_id][definition.axis.uuid.hex] = (
+                self.model.format_axis_definition(definition, structure)
+            )
+
+        conditioner_definitions = IdeologyConditionerDefinition.objects.filter(
+            ideology_id__in=mapped.keys()
+        ).select_related("conditioner")
+        for definition in conditioner_definitions:
+            mapped[definition.ideology_id][definition.conditioner.uuid.hex] = (
+                self.model.format_conditioner_definition(definition, structure)
+            )
+
+        return mapped
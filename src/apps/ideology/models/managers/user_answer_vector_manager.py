@@ -0,0 +1,156 @@
+from typing import Any, Dict, Iterable, List, Optional
+
+from django.apps import apps
+from django.db import models, transaction
+from ideology.services.answer_digest import AnswerDigest
+from ideology.services.calculation_dto import CalculationItem
+
+
+class UserAnswerVectorManager(models.Manager):
+    @staticmethod
+    def pack_axis_answer(answer) -> List:
+        return [
+            answer.value,
+            answer.is_indifferent,
+            answer.margin_left,
+            answer.margin_right,
+        ]
+
+    @staticmethod
+    def get_snapshot_item(kind: str, answer_uuid: str, stored: Any) -> Dict:
+        if kind == "axis":
+            value, _, margin_left, margin_right = stored
+            return {
+                "uuid": answer_uuid,
+                "value": value,
+                "margin_left": margin_left,
+                "margin_right": margin_right,
+            }
+        return {"uuid": answer_uuid, "value": stored}
+
+    def build_snapshot(
+        self, axes: Dict[str, List], conditioners: Dict[str, str]
+    ) -> Dict[str, List[Dict]]:
+        return {
+            "conditioners": [
+                self.get_snapshot_item("conditioner", answer_uuid, answer)
+                for answer_uuid, answer in sorted(conditioners.items())
+            ],
+            "axis": [
+                self.get_snapshot_item("axis", answer_uuid, packed)
+                for answer_uuid, packed in sorted(axes.items())
+            ],
+        }
+
+    def rebuild(self, user):
+        UserAxisAnswer = apps.get_model("ideology", "UserAxisAnswer")
+        UserConditionerAnswer = apps.get_model("ideology", "UserConditionerAnswer")
+
+        axes = {
+            axis_uuid.hex: [value, is_indifferent, margin_left, margin_right]
+            for axis_uuid, value, is_indifferent, margin_left, margin_right in (
+                UserAxisAnswer.objects.filter(user=user).values_list(
+                    "axis__uuid",
+                    "value",
+                    "is_indifferent",
+                    "margin_left",
+                    "margin_right",
+                )
+            )
+        }
+        conditioners = {
+            conditioner_uuid.hex: answer
+            for conditioner_uuid, answer in UserConditionerAnswer.objects.filter(
+                user=user
+            ).values_list("conditioner__uuid", "answer")
+        }
+        vector, _ = self.update_or_create(
+            user=user,
+            defaults={
+                "axes": axes,
+                "conditioners": conditioners,
+                "digest": AnswerDigest.from_snapshot(
+                    self.build_snapshot(axes, conditioners)
+                ).hexdigest(),
+            },
+        )
+        return vector
+
+    def apply_changes(
+        self,
+        user,
+        axes: Optional[Dict[str, List]] = None,
+        conditioners: Optional[Dict[str, str]] = None,
+        removed_axes: Iterable[str] = (),
+        removed_conditioners: Iterable[str] = (),
+    ):
+        with transaction.atomic():
+            vector = self.select_for_update().filter(pk=user.pk).first()
+            if vector is None:
+                # The rebuild reads the answer tables inside the same
+                # transaction, so it already sees the pending change.
+                return self.rebuild(user)
+
+            if not vector.digest:
+                return self.rebuild(user)
+
+            digest = AnswerDigest(vector.digest)
+            for kind, stored, changes, removed in (
+                ("axis", vector.axes, axes or {}, removed_axes),
+                (
+                    "conditioner",
+                    vector.conditioners,
+                    conditioners or {},
+                    removed_conditioners,
+                ),
+            ):
+                for answer_uuid, value in changes.items():
+                    if answer_uuid in stored:
+                        digest.remove(
+                            kind,
+                            self.get_snapshot_item(
+                                kind, answer_uuid, stored[answer_uuid]
+                            ),
+                        )
+                    digest.add(kind, self.get_snapshot_item(kind, answer_uuid, value))
+                    stored[answer_uuid] = value
+                for answer_uuid in removed:
+                    if answer_uuid in stored:
+                        digest.remove(
+                            kind,
+                            self.get_snapshot_item(
+                                kind, answer_uuid, stored.pop(answer_uuid)
+                            ),
+                        )
+
+            vector.digest = digest.hexdigest()
+            vector.save(update_fields=["axes", "conditioners", "digest", "modified"])
+        return vector
+
+    def get_vector(self, user):
+        vector = self.filter(pk=user.pk).first()
+        if vector is None or not vector.digest:
+            return self.rebuild(user)
+        return vector
+
+    # The digest only detects changes; the snapshot hash is recorded against
+    # the digest it was computed for, unless the answers changed meanwhile.
+    def remember_snapshot(self, vector, answer_hash: str) -> None:
+        self.filter(pk=vector.pk, digest=vector.digest).update(
+            snapshot_digest=vector.digest, snapshot_hash=answer_hash
+        )
+        vector.snapshot_digest = vector.digest
+        vector.snapshot_hash = answer_hash
+
+    def invalidate(self, user_ids: Iterable[int]) -> None:
+        self.filter(pk__in=[user_id for user_id in user_ids if user_id]).delete()
+
+    # Answers removed by a cascade from their axis or conditioner never go
+    # through apply_changes, so the vectors holding them are dropped instead.
+    def invalidate_answered(self, kind: str, answer_uuid: str) -> None:
+        field = "axes" if kind == "axis" else "conditioners"
+        self.filter(**{f"{field}__has_key": answer_uuid}).delete()
+
+    def get_mapped_for_calculation(self, user) -> Dict[str, CalculationItem]:
+        vector = self.filter(pk=user.pk).first() or self.rebuild(user)
+        return vector.get_mapped_for_calculation()
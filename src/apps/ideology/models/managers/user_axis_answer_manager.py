@@ -1,12 +1,14 @@
-from typing import Dict
+from typing import Any, Dict
 
 from core.exceptions.api_exceptions import NotFoundException
 from django.apps import apps
+from django.core.exceptions import ValidationError
 from django.db import models, transaction
 from django.db.models import Q
 from django.utils.translation import gettext_lazy as _
 from ideology.services.calculation_dto import CalculationItem
 from ideology.services.mapping_helpers import format_mapped_item
+from ideology.services.structure_index import StructureIndex
 
 
 class UserAxisAnswerManager(models.Manager):
@@ -30,24 +32,93 @@ class UserAxisAnswerManager(models.Manager):
             )
         return user_axis_answer, created
 
+    def bulk_upsert(self, user, answers: Dict[str, Dict[str, Any]]) -> Dict[str, int]:
+        IdeologyAxis = apps.get_model("ideology", "IdeologyAxis")
+        UserAnswerVector = apps.get_model("ideology", "UserAnswerVector")
+
+        axis_pks = {
+            axis_uuid.hex: pk
+            for axis_uuid, pk in IdeologyAxis.objects.filter(uuid__in=list(answers))
+            .order_by()
+            .values_list("uuid", "pk")
+        }
+
+        rows = {}
+        for axis_uuid, data in answers.items():
+            if axis_uuid not in axis_pks:
+                continue
+            is_indifferent = bool(data.get("is_indifferent", False))
+            row = self.model(
+                user=user,
+                axis_id=axis_pks[axis_uuid],
+                is_indifferent=is_indifferent,
+                value=None if is_indifferent else data.get("value"),
+                margin_left=None if is_indifferent else data.get("margin_left"),
+                margin_right=None if is_indifferent else data.get("margin_right"),
+            )
+            # bulk_create skips BaseAxisAnswer.save, so out-of-range or
+            # incomplete answers are validated (and skipped) here.
+            try:
+                row.full_clean(
+                    exclude=["user", "axis"],
+                    validate_unique=False,
+                    validate_constraints=False,
+                )
+            except ValidationError:
+                continue
+            rows[axis_uuid] = row
+
+        if not rows:
+            return {"inserted": 0, "updated": 0, "skipped": len(answers)}
+
+        with transaction.atomic():
+            existing = self.filter(
+                user=user, axis_id__in=[row.axis_id for row in rows.values()]
+            ).count()
+            self.bulk_create(
+                rows.values(),
+                update_conflicts=True,
+                unique_fields=["user", "axis"],
+                update_fields=[
+                    "value",
+                    "margin_left",
+                    "margin_right",
+                    "is_indifferent",
+                    "modified",
+                ],
+            )
+            UserAnswerVector.objects.apply_changes(
+                user,
+                axes={
+                    axis_uuid: UserAnswerVector.objects.pack_axis_answer(row)
+                    for axis_uuid, row in rows.items()
+                },
+            )
+
+        return {
+            "inserted": len(rows) - existing,
+            "updated": existing,
+            "skipped": len(answers) - len(rows),
+        }
+
     def get_mapped_for_calculation(self, user) -> Dict[str, CalculationItem]:
         queryset = (
             self.filter(user=user)
             .filter(Q(value__isnull=False) | Q(is_indifferent=True))
-            .select_related(
-                "axis", "axis__section", "axis__section__abstraction_complexity"
-            )
+            .select_related("axis")
         )
+        structure = StructureIndex.get()
 
-        return {
-            answer.axis.uuid.hex: format_mapped_item(
+        mapped = {}
+        for answer in queryset:
+            hierarchy = structure.resolve_axis_hierarchy(answer.axis)
+            mapped[answer.axis.uuid.hex] = format_mapped_item(
                 item_type="axis",
                 value=answer.value,
-                complexity_uuid=answer.axis.section.abstraction_complexity.uuid.hex,
+                complexity_uuid=hierarchy["complexity_uuid"],
                 is_indifferent=answer.is_indifferent,
-                section_uuid=answer.axis.section.uuid.hex,
+                section_uuid=hierarchy["section_uuid"],
                 margin_left=answer.margin_left or 0,
                 margin_right=answer.margin_right or 0,
             )
-            for answer in queryset
-        }
+        return mapped
@@ -1,13 +1,12 @@
-from typing import Dict
+from typing import Dict, Optional
 
 from core.exceptions.api_exceptions import NotFoundException
+from django.core.exceptions import ValidationError
 from django.db import models, transaction
 from django.utils.translation import gettext_lazy as _
 from ideology.services.calculation_dto import CalculationItem
-from ideology.services.mapping_helpers import (
-    format_mapped_item,
-    get_conditioner_complexity_annotation,
-)
+from ideology.services.mapping_helpers import format_mapped_item
+from ideology.services.structure_index import StructureIndex
 
 
 class UserConditionerAnswerManager(models.Manager):
@@ -29,23 +28,74 @@ class UserConditionerAnswerManager(models.Manager):
             )
         return user_conditioner_answer, created
 
-    def get_mapped_for_calculation(self, user) -> Dict[str, CalculationItem]:
-        queryset = (
-            self.filter(user=user)
-            .select_related("conditioner")
-            .annotate(
-                inferred_complexity=get_conditioner_complexity_annotation("conditioner")
+    def bulk_upsert(self, user, answers: Dict[str, Optional[str]]) -> Dict[str, int]:
+        from ideology.models import IdeologyConditioner, UserAnswerVector
+
+        conditioner_pks = {
+            conditioner_uuid.hex: pk
+            for conditioner_uuid, pk in IdeologyConditioner.objects.filter(
+                uuid__in=list(answers)
+            )
+            .order_by()
+            .values_list("uuid", "pk")
+        }
+        rows = {}
+        for conditioner_uuid, answer in answers.items():
+            if conditioner_uuid not in conditioner_pks:
+                continue
+            row = self.model(
+                user=user,
+                conditioner_id=conditioner_pks[conditioner_uuid],
+                answer=answer,
+            )
+            try:
+                row.full_clean(
+                    exclude=["user", "conditioner"],
+                    validate_unique=False,
+                    validate_constraints=False,
+                )
+            except ValidationError:
+                continue
+            rows[conditioner_uuid] = row
+
+        if not rows:
+            return {"inserted": 0, "updated": 0, "skipped": len(answers)}
+
+        with transaction.atomic():
+            existing = self.filter(
+                user=user,
+                conditioner_id__in=[row.conditioner_id for row in rows.values()],
+            ).count()
+            self.bulk_create(
+                rows.values(),
+                update_conflicts=True,
+                unique_fields=["user", "conditioner"],
+                update_fields=["answer", "modified"],
+            )
+            UserAnswerVector.objects.apply_changes(
+                user,
+                conditioners={
+                    conditioner_uuid: row.answer
+                    for conditioner_uuid, row in rows.items()
+                },
             )
-        )
+
+        return {
+            "inserted": len(rows) - existing,
+            "updated": existing,
+            "skipped": len(answers) - len(rows),
+        }
+
+    def get_mapped_for_calculation(self, user) -> Dict[str, CalculationItem]:
+        queryset = self.filter(user=user).select_related("conditioner")
+        structure = StructureIndex.get()
 
         return {
             answer.conditioner.uuid.hex: format_mapped_item(
                 item_type="conditioner",
                 value=answer.answer,
-                complexity_uuid=(
-                    answer.inferred_complexity.hex
-                    if answer.inferred_complexity
-                    else None
+                complexity_uuid=structure.get_conditioner_complexity(
+                    answer.conditioner.uuid.hex
                 ),
                 is_indifferent=answer.is_indifferent_answer,
             )
@@ -0,0 +1,99 @@
+from typing import Dict
+
+from core.models import User
+from django.db import models
+from django.utils.translation import gettext_lazy as _
+from ideology.models.managers import UserAnswerVectorManager
+from ideology.services.calculation_dto import CalculationItem
+from ideology.services.mapping_helpers import format_mapped_item
+from ideology.services.structure_index import StructureIndex
+from model_utils.models import TimeStampedModel
+
+from .abstract_answers import BaseConditionerAnswer
+
+
+class UserAnswerVector(TimeStampedModel):
+    user = models.OneToOneField(
+        User,
+        primary_key=True,
+        on_delete=models.CASCADE,
+        related_name="answer_vector",
+        verbose_name=_("User"),
+    )
+    axes = models.JSONField(
+        default=dict,
+        verbose_name=_("Axis Answers"),
+        help_text=_(
+            "Axis UUID mapped to [value, is_indifferent, margin_left, margin_right]."
+        ),
+    )
+    conditioners = models.JSONField(
+        default=dict,
+        verbose_name=_("Conditioner Answers"),
+        help_text=_("Conditioner UUID mapped to the raw answer."),
+    )
+    digest = models.CharField(
+        max_length=64,
+        blank=True,
+        editable=False,
+        verbose_name=_("Answer Digest"),
+        help_text=_(
+            "Order-independent hash of the answers, used to detect changes between snapshots."
+        ),
+    )
+    snapshot_digest = models.CharField(
+        max_length=64,
+        blank=True,
+        editable=False,
+        verbose_name=_("Snapshot Digest"),
+        help_text=_("Answer digest the snapshot hash was computed for."),
+    )
+    snapshot_hash = models.CharField(
+        max_length=64,
+        blank=True,
+        editable=False,
+        verbose_name=_("Snapshot Hash"),
+        help_text=_("Hash of the last snapshot built from these answers."),
+    )
+
+    objects = UserAnswerVectorManager()
+
+    class Meta:
+        verbose_name = _("User Answer Vector")
+        verbose_name_plural = _("User Answer Vectors")
+
+    def __str__(self):
+        return f"{self.user.username} ({len(self.axes)} axes, {len(self.conditioners)} conditioners)"
+
+    def get_mapped_for_calculation(self) -> Dict[str, CalculationItem]:
+        structure = StructureIndex.get()
+        mapped = {}
+
+        for axis_uuid, (
+            value,
+            is_indifferent,
+            margin_left,
+            margin_right,
+        ) in self.axes.items():
+            hierarchy = structure.get_axis_hierarchy(axis_uuid)
+            if not hierarchy or (value is None and not is_indifferent):
+                continue
+            mapped[axis_uuid] = format_mapped_item(
+                item_type="axis",
+                value=value,
+                complexity_uuid=hierarchy["complexity_uuid"],
+                is_indifferent=is_indifferent,
+                section_uuid=hierarchy["section_uuid"],
+                margin_left=margin_left or 0,
+                margin_right=margin_right or 0,
+            )
+
+        for conditioner_uuid, answer in self.conditioners.items():
+            mapped[conditioner_uuid] = format_mapped_item(
+                item_type="conditioner",
+                value=answer,
+                complexity_uuid=structure.get_conditioner_complexity(conditioner_uuid),
+                is_indifferent=bool(answer)
+                and answer.strip().lower() in BaseConditionerAnswer.INDIFFERENT_TERMS,
+            )
+        return mapped
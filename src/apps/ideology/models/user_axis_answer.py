@@ -1,5 +1,6 @@
 from core.models import User
-from django.db import models
+from django.apps import apps
+from django.db import models, transaction
 from django.utils.translation import gettext_lazy as _
 from ideology.models.managers import UserAxisAnswerManager
 
@@ -24,3 +25,23 @@ class UserAxisAnswer(BaseAxisAnswer):
     def __str__(self):
         val = "Indifferent" if self.is_indifferent else str(self.value)
         return f"{self.user.username} - {self.axis.name}: {val}"
+
+    def save(self, *args, **kwargs):
+        UserAnswerVector = apps.get_model("ideology", "UserAnswerVector")
+        with transaction.atomic():
+            super().save(*args, **kwargs)
+            UserAnswerVector.objects.apply_changes(
+                self.user,
+                axes={
+                    self.axis.uuid.hex: UserAnswerVector.objects.pack_axis_answer(self)
+                },
+            )
+
+    def delete(self, *args, **kwargs):
+        UserAnswerVector = apps.get_model("ideology", "UserAnswerVector")
+        with transaction.atomic():
+            result = super().delete(*args, **kwargs)
+            UserAnswerVector.objects.apply_changes(
+                self.user, removed_axes=[self.axis.uuid.hex]
+            )
+        return result
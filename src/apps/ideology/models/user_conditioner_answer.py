@@ -1,5 +1,6 @@
 from core.models import User
-from django.db import models
+from django.apps import apps
+from django.db import models, transaction
 from django.utils.translation import gettext_lazy as _
 from ideology.models.managers import UserConditionerAnswerManager
 
@@ -23,3 +24,20 @@ class UserConditionerAnswer(BaseConditionerAnswer):
 
     def __str__(self):
         return f"{self.user.username} - {self.conditioner.name}: {self.answer}"
+
+    def save(self, *args, **kwargs):
+        UserAnswerVector = apps.get_model("ideology", "UserAnswerVector")
+        with transaction.atomic():
+            super().save(*args, **kwargs)
+            UserAnswerVector.objects.apply_changes(
+                self.user, conditioners={self.conditioner.uuid.hex: self.answer}
+            )
+
+    def delete(self, *args, **kwargs):
+        UserAnswerVector = apps.get_model("ideology", "UserAnswerVector")
+        with transaction.atomic():
+            result = super().delete(*args, **kwargs)
+            UserAnswerVector.objects.apply_changes(
+                self.user, removed_conditioners=[self.conditioner.uuid.hex]
+            )
+        return result
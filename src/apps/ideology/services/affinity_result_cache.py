@@ -0,0 +1,38 @@
+from typing import Any, Callable, Dict, Optional
+
+from django.core.cache import caches
+from ideology.services.ideology_vector_cache import IdeologyVectorCache
+
+
+class AffinityResultCache:
+    key_prefix = "affinity_result"
+    cache_alias = "affinity"
+
+    @classmethod
+    def get_cache(cls):
+        return caches[cls.cache_alias]
+
+    @classmethod
+    def get_key(cls, source_version: str, target_version: str) -> str:
+        # Mapped answers depend on the structure tree, so results are scoped
+        # to the current structure version as well.
+        structure_version = IdeologyVectorCache.get_structure_version()
+        return f"{cls.key_prefix}:{structure_version}:{source_version}:{target_version}"
+
+    @classmethod
+    def get_or_calculate(
+        cls,
+        source_version: Optional[str],
+        target_version: Optional[str],
+        calculate: Callable[[], Dict[str, Any]],
+    ) -> Dict[str, Any]:
+        if not source_version or not target_version:
+            return calculate()
+
+        cache = cls.get_cache()
+        key = cls.get_key(source_version, target_version)
+        result = cache.get(key)
+        if result is None:
+            result = calculate()
+            cache.set(key, result)
+        return result
@@ -0,0 +1,34 @@
+import hashlib
+import json
+from typing import Any, Dict, List
+
+
+class AnswerDigest:
+    modulus = 1 << 256
+
+    def __init__(self, hexdigest: str = ""):
+        self.total = int(hexdigest, 16) if hexdigest else 0
+
+    @classmethod
+    def from_snapshot(cls, answers: Dict[str, List[Any]]) -> "AnswerDigest":
+        digest = cls()
+        for kind, key in (("axis", "axis"), ("conditioner", "conditioners")):
+            for item in answers.get(key, []):
+                digest.add(kind, item)
+        return digest
+
+    @staticmethod
+    def hash_item(kind: str, item: Any) -> int:
+        payload = json.dumps([kind, item], sort_keys=True, separators=(",", ":"))
+        return int.from_bytes(hashlib.sha256(payload.encode("utf-8")).digest(), "big")
+
+    # Item hashes are summed modulo 2^256, so the digest does not depend on the
+    # order answers were given in and a change only needs the previous item.
+    def add(self, kind: str, item: Any) -> None:
+        self.total = (self.total + self.hash_item(kind, item)) % self.modulus
+
+    def remove(self, kind: str, item: Any) -> None:
+        self.total = (self.total - self.hash_item(kind, item)) % self.modulus
+
+    def hexdigest(self) -> str:
+        return f"{self.total:064x}"
@@ -0,0 +1,304 @@
+import json
+import os
+import threading
+import uuid
+from pathlib import Path
+from typing import Dict, List, Optional
+
+import numpy as np
+from django.apps import apps
+from django.conf import settings
+from django.core.cache import cache
+from django.db import connection, transaction
+from django.utils import timezone
+from ideology.services.calculation_dto import CalculationItem
+from ideology.services.structure_index import StructureIndex
+
+
+class AnswerSimilarityIndex:
+    meta_filename = "meta.json"
+    vectors_prefix = "vectors-"
+    load_batch_size = 500
+    scan_chunk_size = 4096
+    lock_name = "answer_similarity_index"
+    rebuild_requested_key = "answer_similarity_index:rebuild_requested"
+    rebuild_request_timeout = 60 * 5
+
+    _current: Optional["AnswerSimilarityIndex"] = None
+    _lock = threading.Lock()
+
+    def __init__(self, directory: Path, meta: Dict, stamp=None):
+        self.directory = directory
+        self.stamp = stamp
+        self.build_id: str = meta["build_id"]
+        self.built_at: str = meta["built_at"]
+        self.axis_uuids: List[str] = meta["axis_uuids"]
+        self.answer_uuids: List[str] = meta["answer_uuids"]
+        self.user_ids = np.array(meta["user_ids"], dtype=np.int64)
+        self.axis_positions = {
+            axis_uuid: position for position, axis_uuid in enumerate(self.axis_uuids)
+        }
+        self.answer_rows = {
+            answer_uuid: row for row, answer_uuid in enumerate(self.answer_uuids)
+        }
+
+        if self.answer_uuids:
+            self.vectors = np.load(directory / meta["vectors"], mmap_mode="r")
+        else:
+            self.vectors = np.empty((0, len(self.axis_uuids)), dtype=np.float32)
+
+    @staticmethod
+    def get_directory() -> Path:
+        return Path(settings.SIMILARITY_INDEX_DIR)
+
+    @staticmethod
+    def get_latest_public_answers():
+        CompletedAnswer = apps.get_model("ideology", "CompletedAnswer")
+        return (
+            CompletedAnswer.objects.filter(
+                completed_by__is_public=True, completed_by__is_active=True
+            )
+            .order_by("completed_by_id", "-created")
+            .distinct("completed_by_id")
+        )
+
+    @staticmethod
+    def vectorize(
+        data: Dict[str, CalculationItem], axis_positions: Dict[str, int]
+    ) -> np.ndarray:
+        vector = np.full(len(axis_positions), np.nan, dtype=np.float32)
+        for key, item in data.items():
+            position = axis_positions.get(key)
+            if (
+                position is None
+                or item.type != "axis"
+                or item.is_indifferent
+                or item.value is None
+            ):
+                continue
+            vector[position] = float(item.value)
+        return vector
+
+    @classmethod
+    def empty(cls) -> "AnswerSimilarityIndex":
+        return cls(
+            cls.get_directory(),
+            {
+                "build_id": "",
+                "built_at": "",
+                "axis_uuids": [],
+                "answer_uuids": [],
+                "user_ids": [],
+            },
+        )
+
+    @classmethod
+    def _read_meta(cls, directory: Path) -> Optional[Dict]:
+        try:
+            with open(directory / cls.meta_filename) as meta_file:
+                return json.load(meta_file)
+        except (FileNotFoundError, ValueError):
+            return None
+
+    # A rebuild in another process may replace the files between the stat,
+    # the meta read and the matrix load; any of them failing is a miss.
+    @classmethod
+    def _read(cls, directory: Path) -> Optional["AnswerSimilarityIndex"]:
+        try:
+            stat = (directory / cls.meta_filename).stat()
+            meta = cls._read_meta(directory)
+            if meta is None:
+                return None
+            return cls(directory, meta, stamp=(stat.st_mtime_ns, stat.st_size))
+        except (OSError, ValueError, KeyError):
+            return None
+
+    @classmethod
+    def _load_vectors(
+        cls,
+        answer_pks: List[int],
+        axis_positions: Dict[str, int],
+        structure: StructureIndex,
+    ):
+        CompletedAnswer = apps.get_model("ideology", "CompletedAnswer")
+        vectors = {}
+        for start in range(0, len(answer_pks), cls.load_batch_size):
+            batch = answer_pks[start : start + cls.load_batch_size]
+            for answer in CompletedAnswer.objects.filter(pk__in=batch).only(
+                "pk", "raw_answers", "payload"
+            ):
+                mapped = (
+                    answer.get_mapped_for_calculation(structure)
+                    if isinstance(answer.answers, dict)
+                    else {}
+                )
+                vectors[answer.pk] = cls.vectorize(mapped, axis_positions)
+        return vectors
+
+    @classmethod
+    def rebuild(cls, full: bool = False) -> "AnswerSimilarityIndex":
+        # Beat and on-demand rebuilds may run in different processes; the
+        # advisory lock serializes them so each one starts from the last
+        # published matrix and cleans up after it.
+        with transaction.atomic():
+            with connection.cursor() as cursor:
+                cursor.execute(
+                    "SELECT pg_advisory_xact_lock(hashtext(%s))", [cls.lock_name]
+                )
+            cls._rebuild(full)
+
+        cls._current = None
+        cache.delete(cls.rebuild_requested_key)
+        return cls.get()
+
+    @classmethod
+    def _rebuild(cls, full: bool) -> None:
+        directory = cls.get_directory()
+        directory.mkdir(parents=True, exist_ok=True)
+
+        structure = StructureIndex.get()
+        axis_uuids = sorted(structure.axes)
+        axis_positions = {
+            axis_uuid: position for position, axis_uuid in enumerate(axis_uuids)
+        }
+
+        previous_meta = cls._read_meta(directory)
+        previous = None if full else cls._read(directory)
+        if previous is not None and previous.axis_uuids != axis_uuids:
+            previous = None
+        previous_rows = previous.answer_rows if previous else {}
+
+        latest = [
+            (pk, answer_uuid.hex, user_id)
+            for pk, answer_uuid, user_id in cls.get_latest_public_answers().values_list(
+                "pk", "uuid", "completed_by_id"
+            )
+        ]
+        # Only snapshots that were not indexed yet need their JSON parsed; the
+        # rest are copied over from the previous matrix.
+        fresh_vectors = cls._load_vectors(
+            [pk for pk, answer_uuid, _ in latest if answer_uuid not in previous_rows],
+            axis_positions,
+            structure,
+        )
+
+        build_id = uuid.uuid4().hex
+        vectors_filename = f"{cls.vectors_prefix}{build_id}.npy"
+        shape = (len(latest), len(axis_uuids))
+        if latest:
+            vectors = np.lib.format.open_memmap(
+                directory / vectors_filename, mode="w+", dtype=np.float32, shape=shape
+            )
+            kept = [
+                (row, previous_rows[answer_uuid])
+                for row, (_, answer_uuid, _) in enumerate(latest)
+                if answer_uuid in previous_rows
+            ]
+            if kept:
+                rows, previous_indexes = zip(*kept)
+                vectors[list(rows)] = previous.vectors[list(previous_indexes)]
+            for row, (pk, answer_uuid, _) in enumerate(latest):
+                if answer_uuid not in previous_rows:
+                    vectors[row] = fresh_vectors[pk]
+            vectors.flush()
+            del vectors
+
+        meta = {
+            "build_id": build_id,
+            "built_at": timezone.now().isoformat(),
+            "vectors": vectors_filename,
+            "axis_uuids": axis_uuids,
+            "answer_uuids": [answer_uuid for _, answer_uuid, _ in latest],
+            "user_ids": [user_id for _, _, user_id in latest],
+        }
+        temporary_meta_path = directory / f"{cls.meta_filename}.{build_id}"
+        with open(temporary_meta_path, "w") as meta_file:
+            json.dump(meta, meta_file)
+        os.replace(temporary_meta_path, directory / cls.meta_filename)
+
+        # The previous matrix stays around for one more build, so readers that
+        # loaded the old meta just before the replace can still map it.
+        referenced = {vectors_filename}
+        if previous_meta and previous_meta.get("vectors"):
+            referenced.add(previous_meta["vectors"])
+        for path in directory.glob(f"{cls.vectors_prefix}*.npy"):
+            if path.name not in referenced:
+                path.unlink(missing_ok=True)
+
+    # Rebuilding scans every public snapshot, so the request path never does
+    # it: a missing index is requested from the worker and an empty one is
+    # served until it is published.
+    @classmethod
+    def request_rebuild(cls) -> None:
+        from core.tasks import rebuild_answer_similarity_index
+
+        if cache.add(cls.rebuild_requested_key, True, cls.rebuild_request_timeout):
+            transaction.on_commit(rebuild_answer_similarity_index.delay)
+
+    @classmethod
+    def get(cls) -> "AnswerSimilarityIndex":
+        directory = cls.get_directory()
+        current = cls._current
+        try:
+            stat = (directory / cls.meta_filename).stat()
+            stamp = (stat.st_mtime_ns, stat.st_size)
+        except FileNotFoundError:
+            stamp = None
+
+        if (
+            current is not None
+            and current.directory == directory
+            and current.stamp == stamp
+        ):
+            return current
+
+        if stamp is not None:
+            with cls._lock:
+                loaded = cls._read(directory)
+                if loaded is not None:
+                    cls._current = loaded
+                    return loaded
+
+        if current is not None and current.directory == directory:
+            return current
+        cls.request_rebuild()
+        return cls.empty()
+
+    def find_candidates(
+        self,
+        source_data: Dict[str, CalculationItem],
+        count: int,
+        exclude_user_ids: Optional[List[int]] = None,
+        exclude_answer_uuids: Optional[List[str]] = None,
+    ) -> List[str]:
+        total_rows = len(self.answer_uuids)
+        if not total_rows or count < 1:
+            return []
+
+        source_vector = self.vectorize(source_data, self.axis_positions)
+        distances = np.full(total_rows, np.inf)
+
+        for start in range(0, total_rows, self.scan_chunk_size):
+            block = self.vectors[start : start + self.scan_chunk_size]
+            difference = np.abs(block - source_vector)
+            overlap = (~np.isnan(difference)).sum(axis=1)
+            with np.errstate(divide="ignore", invalid="ignore"):
+                mean_distance = np.nansum(difference, axis=1) / overlap
+            distances[start : start + len(block)] = np.where(
+                overlap > 0, mean_distance, np.inf
+            )
+
+        if exclude_user_ids:
+            distances[np.isin(self.user_ids, exclude_user_ids)] = np.inf
+        for answer_uuid in exclude_answer_uuids or []:
+            row = self.answer_rows.get(answer_uuid)
+            if row is not None:
+                distances[row] = np.inf
+
+        count = min(count, int(np.isfinite(distances).sum()))
+        if not count:
+            return []
+
+        nearest = np.argpartition(distances, count - 1)[:count]
+        nearest = nearest[np.argsort(distances[nearest], kind="stable")]
+        return [self.answer_uuids[row] for row in nearest.tolist()]
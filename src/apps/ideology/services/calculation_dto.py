@@ -1,9 +1,21 @@
-from typing import Any, Literal, Optional
+from dataclasses import dataclass
+from typing import Any, Dict, Literal, Optional
 
-from pydantic import BaseModel
+CALCULATION_ITEM_FIELDS = (
+    "type",
+    "value",
+    "is_indifferent",
+    "complexity_uuid",
+    "section_uuid",
+    "margin_left",
+    "margin_right",
+)
+TRUE_VALUES = {"1", "on", "t", "true", "y", "yes"}
+FALSE_VALUES = {"0", "off", "f", "false", "n", "no"}
 
 
-class CalculationItem(BaseModel):
+@dataclass(slots=True)
+class CalculationItem:
     type: Literal["axis", "conditioner"]
     value: Any
     is_indifferent: bool = False
@@ -11,3 +23,48 @@ class CalculationItem(BaseModel):
     section_uuid: Optional[str] = None
     margin_left: int = 0
     margin_right: int = 0
+
+    # Coerces like the pydantic model it replaces did in lax mode.
+    def __post_init__(self):
+        if self.type not in ("axis", "conditioner"):
+            raise ValueError(f"Invalid calculation item type: {self.type!r}")
+        self.is_indifferent = self.validate_flag(self.is_indifferent)
+        self.complexity_uuid = self.validate_uuid(self.complexity_uuid)
+        self.section_uuid = self.validate_uuid(self.section_uuid)
+        self.margin_left = self.validate_margin(self.margin_left)
+        self.margin_right = self.validate_margin(self.margin_right)
+
+    @staticmethod
+    def validate_flag(flag: Any) -> bool:
+        if isinstance(flag, bool):
+            return flag
+        if isinstance(flag, (int, float)) and flag in (0, 1):
+            return bool(flag)
+        if isinstance(flag, str):
+            if flag.strip().lower() in TRUE_VALUES:
+                return True
+            if flag.strip().lower() in FALSE_VALUES:
+                return False
+        raise ValueError(f"Invalid indifference flag: {flag!r}")
+
+    @staticmethod
+    def validate_uuid(value: Any) -> Optional[str]:
+        if value is not None and not isinstance(value, str):
+            raise ValueError(f"Invalid uuid: {value!r}")
+        return value
+
+    @staticmethod
+    def validate_margin(margin: Any) -> int:
+        if isinstance(margin, int):
+            return int(margin)
+        if isinstance(margin, str):
+            try:
+                margin = float(margin.strip())
+            except ValueError:
+                raise ValueError(f"Invalid margin: {margin!r}") from None
+        if isinstance(margin, float) and margin.is_integer():
+            return int(margin)
+        raise ValueError(f"Invalid margin: {margin!r}")
+
+    def as_dict(self) -> Dict[str, Any]:
+        return {field: getattr(self, field) for field in CALCULATION_ITEM_FIELDS}
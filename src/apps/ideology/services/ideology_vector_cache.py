@@ -0,0 +1,81 @@
+import uuid
+from typing import Dict, Iterable, List, Optional
+
+from django.apps import apps
+from django.conf import settings
+from django.core.cache import cache
+from django.db import transaction
+from ideology.services.calculation_dto import CalculationItem
+from ideology.services.structure_index import StructureIndex
+
+
+class IdeologyVectorCache:
+    key_prefix = "ideology_vector"
+
+    @classmethod
+    def get_structure_version(cls) -> str:
+        return StructureIndex.get_version()
+
+    @classmethod
+    def get_key(cls, ideology, structure_version: Optional[str] = None) -> str:
+        # The vector depends on the ideology definitions (vector_version) and
+        # on the hierarchy of the axes and conditioners (structure version).
+        if structure_version is None:
+            structure_version = cls.get_structure_version()
+        return (
+            f"{cls.key_prefix}:{ideology.pk}:{ideology.vector_version.hex}:"
+            f"{structure_version}"
+        )
+
+    @classmethod
+    def get_many(cls, ideologies: Iterable) -> Dict[int, Dict[str, CalculationItem]]:
+        Ideology = apps.get_model("ideology", "Ideology")
+
+        ideologies = list(ideologies)
+        if not ideologies:
+            return {}
+
+        structure_version = cls.get_structure_version()
+        keys = {
+            cls.get_key(ideology, structure_version): ideology
+            for ideology in ideologies
+        }
+
+        cached = cache.get_many(list(keys.keys()))
+        mapped = {keys[key].pk: items for key, items in cached.items()}
+
+        missing = {key: ideology for key, ideology in keys.items() if key not in cached}
+        if missing:
+            built = Ideology.objects.get_mapped_for_calculation(missing.values())
+            cache.set_many(
+                {key: built[ideology.pk] for key, ideology in missing.items()},
+                timeout=settings.IDEOLOGY_VECTOR_CACHE_TIMEOUT,
+            )
+            mapped.update(built)
+
+        return mapped
+
+    @classmethod
+    def get(cls, ideology) -> Dict[str, CalculationItem]:
+        return cls.get_many([ideology])[ideology.pk]
+
+    @classmethod
+    def warm(cls, ideology_pks: List[int]) -> None:
+        Ideology = apps.get_model("ideology", "Ideology")
+        cls.get_many(Ideology.objects.filter(pk__in=ideology_pks))
+
+    @classmethod
+    def touch(cls, ideology_pks: List[int], warm: bool = True) -> uuid.UUID:
+        Ideology = apps.get_model("ideology", "Ideology")
+
+        vector_version = uuid.uuid4()
+        Ideology.objects.filter(pk__in=ideology_pks).update(
+            vector_version=vector_version
+        )
+        if warm:
+            transaction.on_commit(lambda: cls.warm(ideology_pks))
+        return vector_version
+
+    @classmethod
+    def invalidate_structure(cls) -> None:
+        StructureIndex.invalidate()
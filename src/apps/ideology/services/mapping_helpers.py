@@ -1,19 +1,20 @@
-from django.db import models
-from django.db.models import F
-from django.db.models.functions import Coalesce
-from ideology.services.calculation_dto import CalculationItem
-
+import uuid
+from typing import Any, Dict, Optional
 
-def get_conditioner_complexity_annotation(prefix="conditioner"):
-    p = f"{prefix}__" if prefix else ""
-    return Coalesce(
-        F(f"{p}conditioned_sections__abstraction_complexity__uuid"),
-        F(f"{p}conditioned_axes__section__abstraction_complexity__uuid"),
-        output_field=models.UUIDField(),
-    )
+from ideology.services.calculation_dto import CalculationItem
 
 
 def format_mapped_item(**kwargs) -> CalculationItem:
     if "item_type" in kwargs:
         kwargs["type"] = kwargs.pop("item_type")
     return CalculationItem(**kwargs)
+
+
+def extract_uuid(item: Dict[str, Any]) -> Optional[str]:
+    try:
+        raw_uuid = item.get("uuid")
+        if isinstance(raw_uuid, str):
+            return uuid.UUID(raw_uuid).hex
+    except (AttributeError, ValueError, TypeError):
+        pass
+    return None
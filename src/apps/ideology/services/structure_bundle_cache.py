@@ -0,0 +1,46 @@
+import hashlib
+from typing import Callable, Tuple
+
+from django.apps import apps
+from django.conf import settings
+from django.core.cache import cache
+from django.utils.translation import get_language
+
+
+class StructureBundleCache:
+    key_prefix = "structure_bundle"
+    version_name = "structure_bundle"
+
+    # The version lives in the database so every worker sees an invalidation,
+    # whatever cache backend each of them runs.
+    @classmethod
+    def get_version(cls) -> str:
+        CacheVersion = apps.get_model("core", "CacheVersion")
+        return CacheVersion.objects.get_version(cls.version_name)
+
+    @classmethod
+    def get_key(cls, complexity_uuid: str) -> str:
+        return (
+            f"{cls.key_prefix}:{cls.get_version()}:{get_language()}:{complexity_uuid}"
+        )
+
+    @staticmethod
+    def calculate_etag(content: bytes) -> str:
+        return f'"{hashlib.sha256(content).hexdigest()}"'
+
+    @classmethod
+    def get_or_build(
+        cls, complexity_uuid: str, build: Callable[[], bytes]
+    ) -> Tuple[bytes, str]:
+        key = cls.get_key(complexity_uuid)
+        cached = cache.get(key)
+        if cached is None:
+            content = build()
+            cached = (content, cls.calculate_etag(content))
+            cache.set(key, cached, timeout=settings.STRUCTURE_BUNDLE_CACHE_TIMEOUT)
+        return cached
+
+    @classmethod
+    def invalidate(cls) -> None:
+        CacheVersion = apps.get_model("core", "CacheVersion")
+        CacheVersion.objects.bump([cls.version_name])
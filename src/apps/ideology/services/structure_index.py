@@ -0,0 +1,106 @@
+import threading
+import time
+from typing import Dict, Optional
+
+from django.apps import apps
+from django.conf import settings
+
+
+class StructureIndex:
+    version_name = "ideology_structure"
+
+    _current: Optional["StructureIndex"] = None
+    _lock = threading.Lock()
+
+    def __init__(self, version: str):
+        IdeologyAbstractionComplexity = apps.get_model(
+            "ideology", "IdeologyAbstractionComplexity"
+        )
+        IdeologySection = apps.get_model("ideology", "IdeologySection")
+        IdeologyAxis = apps.get_model("ideology", "IdeologyAxis")
+        IdeologySectionConditioner = apps.get_model(
+            "ideology", "IdeologySectionConditioner"
+        )
+        IdeologyAxisConditioner = apps.get_model("ideology", "IdeologyAxisConditioner")
+
+        self.version = version
+        self.loaded_at = time.monotonic()
+
+        self.complexities = {
+            complexity.uuid.hex: complexity
+            for complexity in IdeologyAbstractionComplexity.objects.all()
+        }
+        self.sections = {
+            section.uuid.hex: section
+            for section in IdeologySection.objects.select_related(
+                "abstraction_complexity"
+            )
+        }
+        self.axes = {
+            axis.uuid.hex: axis
+            for axis in IdeologyAxis.objects.select_related(
+                "section", "section__abstraction_complexity"
+            )
+        }
+        self.axis_hierarchy = {
+            axis_uuid: {
+                "section_uuid": axis.section.uuid.hex,
+                "complexity_uuid": axis.section.abstraction_complexity.uuid.hex,
+            }
+            for axis_uuid, axis in self.axes.items()
+        }
+
+        # Section rules take precedence over axis rules, mirroring the Coalesce
+        # previously used to infer the complexity of a conditioner.
+        self.conditioner_complexities: Dict[str, str] = {}
+        for rules, complexity_lookup in (
+            (IdeologyAxisConditioner.objects, "axis__section__abstraction_complexity"),
+            (IdeologySectionConditioner.objects, "section__abstraction_complexity"),
+        ):
+            for conditioner_uuid, complexity_uuid in rules.order_by("-pk").values_list(
+                "conditioner__uuid", f"{complexity_lookup}__uuid"
+            ):
+                self.conditioner_complexities[conditioner_uuid.hex] = (
+                    complexity_uuid.hex
+                )
+
+    def get_axis_hierarchy(self, axis_uuid: str) -> Optional[Dict[str, str]]:
+        return self.axis_hierarchy.get(axis_uuid)
+
+    def resolve_axis_hierarchy(self, axis) -> Dict[str, str]:
+        return self.axis_hierarchy.get(axis.uuid.hex) or {
+            "section_uuid": axis.section.uuid.hex,
+            "complexity_uuid": axis.section.abstraction_complexity.uuid.hex,
+        }
+
+    def get_conditioner_complexity(self, conditioner_uuid: str) -> Optional[str]:
+        return self.conditioner_complexities.get(conditioner_uuid)
+
+    def is_stale(self, version: str) -> bool:
+        age = time.monotonic() - self.loaded_at
+        return self.version != version or age > settings.STRUCTURE_INDEX_TTL
+
+    # The version lives in the database so an invalidation reaches every
+    # worker, and the vectors cached under it are built from the same index.
+    @classmethod
+    def get_version(cls) -> str:
+        CacheVersion = apps.get_model("core", "CacheVersion")
+        return CacheVersion.objects.get_version(cls.version_name)
+
+    @classmethod
+    def get(cls) -> "StructureIndex":
+        version = cls.get_version()
+        current = cls._current
+        if current is not None and not current.is_stale(version):
+            return current
+
+        with cls._lock:
+            if cls._current is None or cls._current.is_stale(version):
+                cls._current = cls(version)
+            return cls._current
+
+    @classmethod
+    def invalidate(cls) -> None:
+        CacheVersion = apps.get_model("core", "CacheVersion")
+        CacheVersion.objects.bump([cls.version_name])
+        cls._current = None
@@ -0,0 +1,100 @@
+from core.models import Country, Region
+from core.signals import connect_catalog
+from django.db import transaction
+from django.db.models.signals import post_delete, post_save
+from ideology.models import (
+    Ideology,
+    IdeologyAbstractionComplexity,
+    IdeologyAssociation,
+    IdeologyAxis,
+    IdeologyAxisConditioner,
+    IdeologyAxisDefinition,
+    IdeologyConditioner,
+    IdeologyConditionerConditioner,
+    IdeologyConditionerDefinition,
+    IdeologySection,
+    IdeologySectionConditioner,
+    IdeologyTag,
+    Religion,
+    Tag,
+    UserAnswerVector,
+)
+from ideology.services.ideology_vector_cache import IdeologyVectorCache
+from ideology.services.structure_bundle_cache import StructureBundleCache
+from ideology.services.structure_index import StructureIndex
+
+DEFINITION_MODELS = (IdeologyAxisDefinition, IdeologyConditionerDefinition)
+STRUCTURE_MODELS = (
+    IdeologyAbstractionComplexity,
+    IdeologySection,
+    IdeologyAxis,
+    IdeologySectionConditioner,
+    IdeologyAxisConditioner,
+)
+BUNDLE_MODELS = STRUCTURE_MODELS + (IdeologyConditioner, IdeologyConditionerConditioner)
+
+
+def refresh_ideology_vector(sender, instance, raw=False, **kwargs):
+    vector_version = IdeologyVectorCache.touch([instance.ideology_id], warm=not raw)
+    if sender.ideology.is_cached(instance):
+        instance.ideology.vector_version = vector_version
+
+
+def refresh_definitions_count(sender, instance, **kwargs):
+    Ideology.objects.refresh_definitions_count([instance.ideology_id])
+
+
+def refresh_structure(sender, instance, raw=False, **kwargs):
+    if raw:
+        return
+    StructureIndex.invalidate()
+
+
+def refresh_structure_bundle(sender, instance, **kwargs):
+    StructureBundleCache.invalidate()
+
+
+def refresh_answer_vectors(sender, instance, **kwargs):
+    kind = "axis" if sender is IdeologyAxis else "conditioner"
+    answer_uuid = instance.uuid.hex
+    UserAnswerVector.objects.invalidate_answered(kind, answer_uuid)
+    # A vector rebuilt concurrently from the not yet committed state would
+    # still list the deleted answers.
+    transaction.on_commit(
+        lambda: UserAnswerVector.objects.invalidate_answered(kind, answer_uuid)
+    )
+
+
+for model in DEFINITION_MODELS:
+    post_save.connect(refresh_ideology_vector, sender=model)
+    post_delete.connect(refresh_ideology_vector, sender=model)
+
+post_save.connect(refresh_definitions_count, sender=IdeologyAxisDefinition)
+post_delete.connect(refresh_definitions_count, sender=IdeologyAxisDefinition)
+
+for model in STRUCTURE_MODELS:
+    post_save.connect(refresh_structure, sender=model)
+    post_delete.connect(refresh_structure, sender=model)
+
+for model in BUNDLE_MODELS:
+    post_save.connect(refresh_structure_bundle, sender=model)
+    post_delete.connect(refresh_structure_bundle, sender=model)
+
+for model in (IdeologyAxis, IdeologyConditioner):
+    post_delete.connect(refresh_answer_vectors, sender=model)
+
+# The ideology list embeds its tags, places and religions and only shows
+# ideologies with enough axis definitions, so all of them bust its cache.
+connect_catalog(
+    {
+        Ideology: ("ideologies",),
+        IdeologyAxisDefinition: ("ideologies",),
+        IdeologyAssociation: ("ideologies",),
+        IdeologyTag: ("ideologies",),
+        Tag: ("tags", "ideologies"),
+        Religion: ("religions", "ideologies"),
+        Country: ("ideologies",),
+        Region: ("ideologies",),
+    },
+    through_models=(IdeologyAssociation, IdeologyTag),
+)
@@ -9,4 +9,8 @@ schedule = {
         "task": "core.tasks.maintenance.delete_unverified_users",
         "schedule": crontab(hour=3, minute=0),
     },
+    "rebuild_answer_similarity_index": {
+        "task": "core.tasks.similarity.rebuild_answer_similarity_index",
+        "schedule": crontab(minute="*/15"),
+    },
 }
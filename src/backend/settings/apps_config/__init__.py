@@ -5,3 +5,5 @@ from .drf import *
 from .notifications import *
 from .axes import *
 from .social import *
+from .cache import *
+from .similarity import *
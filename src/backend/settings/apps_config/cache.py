@@ -0,0 +1,40 @@
+from ..base import env
+
+CACHES = {
+    "default": {
+        "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
+        "LOCATION": "ideological-atlas",
+        "TIMEOUT": env.int("CACHE_DEFAULT_TIMEOUT", default=300),
+        "OPTIONS": {"MAX_ENTRIES": env.int("CACHE_MAX_ENTRIES", default=5000)},
+    },
+    # Detailed affinity results are large, so they get their own bound and
+    # never evict the small vector and structure entries of the default cache.
+    "affinity": {
+        "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
+        "LOCATION": "ideological-atlas-affinity",
+        "TIMEOUT": env.int("AFFINITY_RESULT_CACHE_TIMEOUT", default=60 * 60 * 24),
+        "OPTIONS": {
+            "MAX_ENTRIES": env.int("AFFINITY_RESULT_CACHE_MAX_ENTRIES", default=500)
+        },
+    },
+    # Anonymous catalog responses are keyed by their search terms, so they are
+    # bounded separately as well.
+    "catalog": {
+        "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
+        "LOCATION": "ideological-atlas-catalog",
+        "TIMEOUT": env.int("CATALOG_RESPONSE_CACHE_TIMEOUT", default=60 * 60 * 24),
+        "OPTIONS": {
+            "MAX_ENTRIES": env.int("CATALOG_RESPONSE_CACHE_MAX_ENTRIES", default=1000)
+        },
+    },
+}
+
+IDEOLOGY_VECTOR_CACHE_TIMEOUT = env.int(
+    "IDEOLOGY_VECTOR_CACHE_TIMEOUT", default=60 * 60 * 24
+)
+
+STRUCTURE_INDEX_TTL = env.int("STRUCTURE_INDEX_TTL", default=60 * 10)
+
+STRUCTURE_BUNDLE_CACHE_TIMEOUT = env.int(
+    "STRUCTURE_BUNDLE_CACHE_TIMEOUT", default=60 * 60 * 24
+)
@@ -2,3 +2,6 @@ from ..base import env
 
 NOTIFICATIONS_SERVICE_URL = env("NOTIFICATIONS_SERVICE_URL", default="")
 NOTIFICATIONS_API_KEY = env("NOTIFICATIONS_API_KEY", default="")
+NOTIFICATIONS_BATCH_SIZE = env.int("NOTIFICATIONS_BATCH_SIZE", default=200)
+NOTIFICATIONS_MAX_CONCURRENCY = env.int("NOTIFICATIONS_MAX_CONCURRENCY", default=8)
+NOTIFICATIONS_RATE_LIMIT = env.float("NOTIFICATIONS_RATE_LIMIT", default=20.0)
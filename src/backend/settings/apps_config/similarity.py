@@ -0,0 +1,13 @@
+import sys
+
+from ..base import BASE_DIR, env, join
+
+SIMILARITY_INDEX_DIR = env(
+    "SIMILARITY_INDEX_DIR", default=join(BASE_DIR, "../var/similarity_index")
+)
+
+if "test" in sys.argv:
+    SIMILARITY_INDEX_DIR = "/tmp/test_similarity_index"  # nosec
+
+SIMILARITY_INDEX_OVERSAMPLING = env.int("SIMILARITY_INDEX_OVERSAMPLING", default=5)
+SIMILARITY_INDEX_MIN_CANDIDATES = env.int("SIMILARITY_INDEX_MIN_CANDIDATES", default=50)
@@ -1,3 +1,12 @@
 from ..base import env
 
 GOOGLE_CLIENT_ID = env("GOOGLE_CLIENT_ID", default="")
+GOOGLE_JWKS_URL = env(
+    "GOOGLE_JWKS_URL", default="https://www.googleapis.com/oauth2/v3/certs"
+)
+GOOGLE_USERINFO_URL = env(
+    "GOOGLE_USERINFO_URL", default="https://www.googleapis.com/oauth2/v3/userinfo"
+)
+GOOGLE_HTTP_TIMEOUT = env.float("GOOGLE_HTTP_TIMEOUT", default=5.0)
+GOOGLE_HTTP_MAX_CONNECTIONS = env.int("GOOGLE_HTTP_MAX_CONNECTIONS", default=20)
+GOOGLE_USERINFO_CACHE_TIMEOUT = env.int("GOOGLE_USERINFO_CACHE_TIMEOUT", default=60)
@@ -46,3 +46,16 @@ class RegionListViewTestCase(APITestBase):
         self.assertEqual(len(results), 1)
         self.assertEqual(results[0]["name"], "Madrid")
         self.assertEqual(results[0]["country"], self.country_spain.id)
+
+    def test_anonymous_filters_are_cached_separately(self):
+        self.client.credentials()
+
+        spain = self.client.get(self.url, {"country_id": self.country_spain.pk})
+        france = self.client.get(self.url, {"country_id": self.country_france.pk})
+
+        self.assertEqual(
+            [region["name"] for region in spain.json()["results"]], ["Madrid"]
+        )
+        self.assertEqual(
+            [region["name"] for region in france.json()["results"]], ["Paris"]
+        )
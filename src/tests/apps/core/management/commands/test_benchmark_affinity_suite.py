@@ -0,0 +1,73 @@
+import json
+import tempfile
+from io import StringIO
+from pathlib import Path
+
+from django.core.management import call_command
+from django.core.management.base import CommandError
+from django.test import TestCase
+from ideology.models import IdeologyAxis
+
+SMALL_TREE = {
+    "complexities": 2,
+    "sections": 2,
+    "axes": 3,
+    "conditioners": 1,
+    "targets": 3,
+    "repeat": 1,
+}
+
+
+class BenchmarkAffinitySuiteCommandTestCase(TestCase):
+    def setUp(self):
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.baseline = Path(directory.name) / "affinity.json"
+
+    def _call(self, **options):
+        standard_output = StringIO()
+        call_command(
+            "benchmark_affinity_suite",
+            stdout=standard_output,
+            **SMALL_TREE,
+            **options,
+        )
+        return standard_output.getvalue()
+
+    def test_reports_every_stage_and_rolls_back_the_tree(self):
+        output = self._call()
+
+        self.assertIn("Synthetic tree 2x2x3x1", output)
+        for name in (
+            "structure_index_load",
+            "build_calculation_items",
+            "map_completed_answer",
+            "map_user_answers",
+            "calculate_detailed",
+            "matrix_totals",
+            "serialize_detailed",
+            "mapped_answers_retained",
+        ):
+            self.assertIn(name, output)
+        self.assertFalse(IdeologyAxis.objects.exists())
+
+    def test_saves_and_compares_baseline(self):
+        self._call(baseline=str(self.baseline), save_baseline=True)
+        stored = json.loads(self.baseline.read_text())
+        self.assertIn("2x2x3x1:3", stored)
+
+        output = self._call(baseline=str(self.baseline), threshold=1000)
+        self.assertIn("of baseline", output)
+
+    def test_missing_baseline_skips_comparison(self):
+        output = self._call(baseline=str(self.baseline))
+        self.assertIn("No baseline stored", output)
+
+    def test_regression_above_threshold_fails(self):
+        self._call(baseline=str(self.baseline), save_baseline=True)
+        stored = json.loads(self.baseline.read_text())
+        stored["2x2x3x1:3"] = {name: 1e-9 for name in stored["2x2x3x1:3"]}
+        self.baseline.write_text(json.dumps(stored))
+
+        with self.assertRaisesMessage(CommandError, "Regressions above 20%"):
+            self._call(baseline=str(self.baseline))
@@ -0,0 +1,19 @@
+from core.models import CacheVersion
+from django.test import TestCase
+
+
+class CacheVersionManagerTestCase(TestCase):
+    def test_missing_version_is_empty(self):
+        self.assertEqual(CacheVersion.objects.get_version("missing"), "")
+
+    def test_bump_creates_and_changes_versions(self):
+        CacheVersion.objects.bump(["tags", "religions"])
+        first = CacheVersion.objects.get_versions(["tags", "religions"])
+
+        with self.assertNumQueries(1):
+            CacheVersion.objects.bump(["tags", "tags"])
+
+        second = CacheVersion.objects.get_versions(["tags", "religions"])
+        self.assertTrue(first["tags"])
+        self.assertNotEqual(second["tags"], first["tags"])
+        self.assertEqual(second["religions"], first["religions"])
@@ -1,9 +1,11 @@
 import uuid
-from unittest.mock import Mock, patch
+from unittest.mock import AsyncMock, Mock, patch
 
+import httpx
 from core.exceptions.user_exceptions import UserDisabledException
 from core.factories import VerifiedUserFactory
 from core.models import User
+from django.db import IntegrityError
 from django.test import TestCase
 from django.utils import translation
 from django.utils.translation import gettext_lazy as _
@@ -56,13 +58,38 @@ class UserManagerBasicTestCase(TestCase):
         collision_uuid = uuid.UUID("11111111-1111-1111-1111-111111111111")
         success_uuid = uuid.UUID("22222222-2222-2222-2222-222222222222")
         verification_token = uuid.UUID("00000000-0000-0000-0000-000000000000")
-        mock_uuid.side_effect = [collision_uuid, success_uuid, verification_token]
+        mock_uuid.side_effect = [verification_token, collision_uuid, success_uuid]
         user = User.objects.create_user(
             email="new@test.com", password="pwd", username=None
         )
         self.assertEqual(user.username, success_uuid.hex[:10])
         self.assertEqual(user.verification_uuid, verification_token)
 
+    @patch("core.models.managers.user_managers.uuid.uuid4")
+    def test_get_or_create_retries_username_collision(self, mock_uuid):
+        User.objects.create(email="old@test.com", username="1111111111")
+        mock_uuid.side_effect = [
+            uuid.UUID("11111111-1111-1111-1111-111111111111"),
+            uuid.UUID("22222222-2222-2222-2222-222222222222"),
+        ]
+        user, created = User.objects.get_or_create(email="new@test.com")
+        self.assertTrue(created)
+        self.assertEqual(user.username, "2222222222")
+
+    def test_create_user_generated_username_uses_constant_queries(self):
+        User.objects.create_user("first@test.com", "pwd")
+        with self.assertNumQueries(5):
+            User.objects.create_user("second@test.com", "pwd")
+
+    def test_create_user_duplicate_email_is_not_retried(self):
+        User.objects.create_user("taken@test.com", "pwd")
+        with patch.object(
+            User.objects, "_generate_username", wraps=User.objects._generate_username
+        ) as mock_generate:
+            with self.assertRaises(IntegrityError):
+                User.objects.create_user("taken@test.com", "pwd")
+        mock_generate.assert_called_once()
+
     def test_get_or_create_generates_username_if_missing(self):
         user_one, _ = User.objects.get_or_create(
             email="u1@test.com", username="explicit_user"
@@ -114,7 +141,10 @@ class UserManagerBasicTestCase(TestCase):
 
 class GoogleAuthManagerTestCase(TestCase):
     @patch("core.tasks.send_email_notification.delay")
-    @patch("core.models.managers.user_managers.id_token.verify_oauth2_token")
+    @patch(
+        "core.models.managers.user_managers.GoogleTokenVerifier.verify_id_token",
+        new_callable=AsyncMock,
+    )
     def test_google_token_strategy_id_token_success(self, mock_verify_jwt, mock_send):
         mock_verify_jwt.return_value = {
             "email": "jwt@test.com",
@@ -133,50 +163,65 @@ class GoogleAuthManagerTestCase(TestCase):
         self.assertEqual(mock_send.call_args.kwargs["template_name"], "register_google")
 
     @patch("core.tasks.send_email_notification.delay")
-    @patch("core.models.managers.user_managers.requests.get")
-    @patch("core.models.managers.user_managers.id_token.verify_oauth2_token")
+    @patch(
+        "core.models.managers.user_managers.GoogleTokenVerifier.fetch_userinfo",
+        new_callable=AsyncMock,
+    )
+    @patch(
+        "core.models.managers.user_managers.GoogleTokenVerifier.verify_id_token",
+        new_callable=AsyncMock,
+    )
     def test_google_token_strategy_fallback_to_access_token(
-        self, mock_verify_jwt, mock_requests, mock_send
+        self, mock_verify_jwt, mock_userinfo, mock_send
     ):
         mock_verify_jwt.side_effect = ValueError("Wrong number of segments")
-        mock_response = Mock()
-        mock_response.ok = True
-        mock_response.json.return_value = {
+        mock_userinfo.return_value = {
             "email": "access@test.com",
             "given_name": "Access",
             "family_name": "Token",
         }
-        mock_requests.return_value = mock_response
         with self.captureOnCommitCallbacks(execute=True):
             user, created = User.objects.get_or_create_from_google_token(
                 "valid_access_token"
             )
         self.assertTrue(created)
         self.assertEqual(user.email, "access@test.com")
-        mock_verify_jwt.assert_called_once()
-        mock_requests.assert_called_once()
+        mock_verify_jwt.assert_awaited_once()
+        mock_userinfo.assert_awaited_once()
 
-    @patch("core.models.managers.user_managers.requests.get")
-    @patch("core.models.managers.user_managers.id_token.verify_oauth2_token")
-    def test_google_token_both_strategies_fail(self, mock_verify_jwt, mock_requests):
+    @patch(
+        "core.models.managers.user_managers.GoogleTokenVerifier.fetch_userinfo",
+        new_callable=AsyncMock,
+    )
+    @patch(
+        "core.models.managers.user_managers.GoogleTokenVerifier.verify_id_token",
+        new_callable=AsyncMock,
+    )
+    def test_google_token_both_strategies_fail(self, mock_verify_jwt, mock_userinfo):
         mock_verify_jwt.side_effect = ValueError("Not a JWT")
-        mock_response = Mock()
-        mock_response.ok = False
-        mock_response.text = "Bad Token"
-        mock_requests.return_value = mock_response
+        mock_userinfo.side_effect = ValueError("Invalid Google Token.")
         with self.assertRaisesMessage(ValueError, "Invalid Google Token"):
             User.objects.get_or_create_from_google_token("invalid_token")
 
-    @patch("core.models.managers.user_managers.requests.get")
-    @patch("core.models.managers.user_managers.id_token.verify_oauth2_token")
-    def test_google_token_network_error(self, mock_verify_jwt, mock_requests):
+    @patch(
+        "httpx.AsyncClient.get",
+        new_callable=AsyncMock,
+        side_effect=httpx.ConnectTimeout("Connection Timeout"),
+    )
+    @patch(
+        "core.models.managers.user_managers.GoogleTokenVerifier.verify_id_token",
+        new_callable=AsyncMock,
+    )
+    def test_google_token_network_error(self, mock_verify_jwt, mock_get):
         mock_verify_jwt.side_effect = ValueError("Not a JWT")
-        mock_requests.side_effect = Exception("Connection Timeout")
 
         with self.assertRaisesMessage(ValueError, "Invalid Google Token"):
             User.objects.get_or_create_from_google_token("timeout_token")
 
-    @patch("core.models.managers.user_managers.id_token.verify_oauth2_token")
+    @patch(
+        "core.models.managers.user_managers.GoogleTokenVerifier.verify_id_token",
+        new_callable=AsyncMock,
+    )
     def test_google_token_no_email_in_payload(self, mock_verify_jwt):
         mock_verify_jwt.return_value = {"sub": "12345", "given_name": "NoEmail"}
 
@@ -185,7 +230,10 @@ class GoogleAuthManagerTestCase(TestCase):
                 User.objects.get_or_create_from_google_token("token_no_email")
 
     @patch("core.tasks.send_email_notification.delay")
-    @patch("core.models.managers.user_managers.id_token.verify_oauth2_token")
+    @patch(
+        "core.models.managers.user_managers.GoogleTokenVerifier.verify_id_token",
+        new_callable=AsyncMock,
+    )
     def test_google_provisioning_existing_user_skips_email(
         self, mock_verify_jwt, mock_send
     ):
@@ -241,3 +241,26 @@ class AffinityCalculatorTestCase(TestCase):
         expected_modifier = 5.0 - 5.0 + 2.5
         self.assertEqual(modifier, expected_modifier)
         self.assertEqual(result["total"], 51.0 + expected_modifier)
+
+    def test_detail_levels_stop_at_requested_depth(self):
+        UserAxisAnswerFactory(user=self.user_a, axis=self.axis_1, value=10)
+        UserAxisAnswerFactory(user=self.user_b, axis=self.axis_1, value=30)
+        calculator = AffinityCalculator(
+            self._get_data(self.user_a), self._get_data(self.user_b)
+        )
+
+        full = calculator.calculate_detailed()
+        sections = calculator.calculate_detailed(AffinityCalculator.DETAIL_SECTIONS)
+        summary = calculator.calculate_detailed(AffinityCalculator.DETAIL_SUMMARY)
+
+        self.assertEqual(summary["total"], full["total"])
+        self.assertEqual(sections["total"], full["total"])
+        self.assertNotIn("sections", summary["complexities"][0])
+        self.assertEqual(
+            summary["complexities"][0]["affinity"], full["complexities"][0]["affinity"]
+        )
+        self.assertNotIn("axes", sections["complexities"][0]["sections"][0])
+        self.assertEqual(
+            sections["complexities"][0]["sections"][0]["affinity"],
+            full["complexities"][0]["sections"][0]["affinity"],
+        )
@@ -0,0 +1,92 @@
+import random
+
+from core.services.affinity_calculator import AffinityCalculator
+from core.services.affinity_matrix_calculator import AffinityMatrixCalculator
+from django.test import TestCase
+from ideology.services.calculation_dto import CalculationItem
+
+
+class AffinityMatrixCalculatorTestCase(TestCase):
+    @staticmethod
+    def _random_side(rng, keys, skip_ratio):
+        data = {}
+        for key, (complexity_uuid, section_uuid) in keys.items():
+            if rng.random() < skip_ratio:
+                continue
+            if section_uuid is None:
+                data[key] = CalculationItem(
+                    type="conditioner",
+                    value=rng.choice(["yes", " Yes ", "no", "indifferent"]),
+                    is_indifferent=rng.random() < 0.2,
+                    complexity_uuid=complexity_uuid,
+                )
+                continue
+            is_indifferent = rng.random() < 0.1
+            data[key] = CalculationItem(
+                type="axis",
+                value=None if is_indifferent else rng.randint(-100, 100),
+                is_indifferent=is_indifferent,
+                complexity_uuid=complexity_uuid,
+                section_uuid=section_uuid,
+                margin_left=rng.randint(0, 60),
+                margin_right=rng.randint(0, 60),
+            )
+        return data
+
+    def test_totals_match_pairwise_calculator(self):
+        rng = random.Random(42)
+        for _ in range(10):
+            keys = {}
+            for index in range(rng.randint(1, 200)):
+                complexity_uuid = f"c{rng.randint(0, 3)}"
+                keys[f"axis{index}"] = (
+                    complexity_uuid,
+                    f"{complexity_uuid}-s{rng.randint(0, 4)}",
+                )
+            for index in range(rng.randint(0, 20)):
+                keys[f"cond{index}"] = (f"c{rng.randint(0, 3)}", None)
+
+            source = self._random_side(rng, keys, 0.3)
+            targets = {
+                index: self._random_side(rng, keys, rng.random()) for index in range(15)
+            }
+
+            totals = AffinityMatrixCalculator(source).calculate_totals(targets)
+
+            for index, target in targets.items():
+                expected = AffinityCalculator(source, target).calculate_detailed()
+                self.assertEqual(totals[index], expected["total"])
+
+    def test_summaries_include_complexity_scores(self):
+        source = {
+            "axis": CalculationItem(
+                type="axis", value=10, complexity_uuid="c1", section_uuid="s1"
+            ),
+            "cond": CalculationItem(
+                type="conditioner", value="yes", complexity_uuid="c1"
+            ),
+        }
+        targets = {
+            "match": {
+                "axis": CalculationItem(
+                    type="axis", value=10, complexity_uuid="c1", section_uuid="s1"
+                ),
+                "cond": CalculationItem(
+                    type="conditioner", value="no", complexity_uuid="c1"
+                ),
+            },
+            "empty": {},
+        }
+
+        summaries = AffinityMatrixCalculator(source).calculate_summaries(targets)
+
+        self.assertEqual(summaries["match"]["total"], 95.0)
+        self.assertEqual(
+            summaries["match"]["complexities"],
+            [{"complexity_uuid": "c1", "affinity": 95.0}],
+        )
+        self.assertIsNone(summaries["empty"]["total"])
+        self.assertIsNone(summaries["empty"]["complexities"][0]["affinity"])
+
+    def test_no_targets(self):
+        self.assertEqual(AffinityMatrixCalculator({}).calculate_totals({}), {})
@@ -0,0 +1,63 @@
+from core.models import Country, Region
+from core.services.catalog_response_cache import CatalogResponseCache
+from django.core.cache import caches
+from django.test import TestCase
+from django.utils import translation
+from rest_framework.request import Request
+from rest_framework.test import APIRequestFactory
+
+
+class CatalogResponseCacheTestCase(TestCase):
+    def setUp(self):
+        caches["catalog"].clear()
+
+    def get_request(self, path: str) -> Request:
+        return Request(APIRequestFactory().get(path))
+
+    def get_key(self, path: str) -> str:
+        return CatalogResponseCache.get_key("tags", self.get_request(path), ["a", "b"])
+
+    def test_key_ignores_query_parameter_order(self):
+        self.assertEqual(self.get_key("/tags/?a=1&b=2"), self.get_key("/tags/?b=2&a=1"))
+        self.assertNotEqual(self.get_key("/tags/?a=1"), self.get_key("/tags/?a=2"))
+
+    def test_key_ignores_parameters_the_view_does_not_read(self):
+        self.assertEqual(
+            self.get_key("/tags/?a=1"), self.get_key("/tags/?a=1&utm_source=x&c=2")
+        )
+
+    def test_key_depends_on_language(self):
+        with translation.override("es"):
+            spanish = self.get_key("/tags/")
+        with translation.override("en"):
+            english = self.get_key("/tags/")
+
+        self.assertNotEqual(spanish, english)
+
+    def test_invalidate_only_drops_the_given_namespaces(self):
+        request = self.get_request("/tags/")
+        CatalogResponseCache.get_or_build("tags", request, [], lambda: b"tags")
+        CatalogResponseCache.get_or_build(
+            "religions", request, [], lambda: b"religions"
+        )
+
+        CatalogResponseCache.invalidate(["tags"])
+
+        self.assertEqual(
+            CatalogResponseCache.get_or_build("tags", request, [], lambda: b"rebuilt"),
+            b"rebuilt",
+        )
+        self.assertEqual(
+            CatalogResponseCache.get_or_build(
+                "religions", request, [], lambda: b"rebuilt"
+            ),
+            b"religions",
+        )
+
+    def test_registry_merges_namespaces_of_every_app(self):
+        self.assertEqual(
+            CatalogResponseCache.namespaces[Country], ("countries", "ideologies")
+        )
+        self.assertEqual(
+            CatalogResponseCache.namespaces[Region], ("regions", "ideologies")
+        )
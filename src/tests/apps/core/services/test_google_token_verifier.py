@@ -0,0 +1,211 @@
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from unittest.mock import patch
+
+import jwt
+from asgiref.sync import async_to_sync
+from core.services.google_token_verifier import GoogleTokenVerifier
+from cryptography.hazmat.primitives.asymmetric import rsa
+from django.core.cache import cache
+from django.core.handlers.asgi import ASGIHandler
+from django.core.signals import request_started
+from django.test import SimpleTestCase, override_settings
+from jwt.algorithms import RSAAlgorithm
+
+CLIENT_ID = "atlas-client-id"
+
+
+class GoogleStub(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def do_GET(self):
+        server = self.server
+        with server.lock:
+            server.hits[self.path] = server.hits.get(self.path, 0) + 1
+
+        if self.path == "/certs":
+            status = 200
+            body = {"keys": server.jwks}
+            headers = {"Cache-Control": server.cache_control}
+        elif self.headers.get("Authorization") == "Bearer access-token":
+            status = 200
+            body = {"email": "access@test.com", "given_name": "Access"}
+            headers = {}
+        else:
+            status = 401
+            body = {"error": "invalid_token"}
+            headers = {}
+
+        content = json.dumps(body).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(content)))
+        for name, value in headers.items():
+            self.send_header(name, value)
+        self.end_headers()
+        self.wfile.write(content)
+
+    def log_message(self, format, *args):
+        pass
+
+
+class GoogleTokenVerifierTestCase(SimpleTestCase):
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        cls.server = ThreadingHTTPServer(("127.0.0.1", 0), GoogleStub)
+        cls.server.lock = threading.Lock()
+        cls.server.daemon_threads = True
+        threading.Thread(target=cls.server.serve_forever, daemon=True).start()
+        base_url = f"http://127.0.0.1:{cls.server.server_address[1]}"
+        cls.settings_override = override_settings(
+            GOOGLE_CLIENT_ID=CLIENT_ID,
+            GOOGLE_JWKS_URL=f"{base_url}/certs",
+            GOOGLE_USERINFO_URL=f"{base_url}/userinfo",
+        )
+        cls.settings_override.enable()
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.settings_override.disable()
+        cls.server.shutdown()
+        cls.server.server_close()
+        super().tearDownClass()
+
+    def setUp(self):
+        cache.clear()
+        GoogleTokenVerifier.reset()
+        self.addCleanup(GoogleTokenVerifier.reset)
+        self.private_key = rsa.generate_private_key(
+            public_exponent=65537, key_size=2048
+        )
+        self.server.jwks = [self.build_jwk(self.private_key, "key-1")]
+        self.server.cache_control = "public, max-age=3600, must-revalidate"
+        self.server.hits = {}
+
+    @staticmethod
+    def build_jwk(private_key, key_id):
+        jwk = RSAAlgorithm.to_jwk(private_key.public_key(), as_dict=True)
+        return {**jwk, "kid": key_id, "use": "sig", "alg": "RS256"}
+
+    def build_token(self, key_id="key-1", private_key=None, **claims):
+        now = int(time.time())
+        payload = {
+            "iss": "https://accounts.google.com",
+            "aud": CLIENT_ID,
+            "iat": now,
+            "exp": now + 3600,
+            "email": "jwt@test.com",
+            "given_name": "JWT",
+            "family_name": "User",
+            **claims,
+        }
+        return jwt.encode(
+            payload,
+            private_key or self.private_key,
+            algorithm="RS256",
+            headers={"kid": key_id},
+        )
+
+    def verify(self, token):
+        return async_to_sync(GoogleTokenVerifier.verify)(token)
+
+    def test_id_token_reuses_cached_keys(self):
+        for _ in range(3):
+            self.assertEqual(
+                self.verify(self.build_token()),
+                {"email": "jwt@test.com", "given_name": "JWT", "family_name": "User"},
+            )
+
+        self.assertEqual(self.server.hits, {"/certs": 1})
+
+    def test_keys_are_refetched_when_not_cacheable(self):
+        self.server.cache_control = "no-cache, no-store, max-age=0"
+
+        self.verify(self.build_token())
+        self.verify(self.build_token())
+
+        self.assertEqual(self.server.hits, {"/certs": 2})
+
+    def test_rotated_key_triggers_one_refetch(self):
+        self.verify(self.build_token())
+
+        rotated_key = rsa.generate_private_key(public_exponent=65537, key_size=2048)
+        self.server.jwks.append(self.build_jwk(rotated_key, "key-2"))
+        GoogleTokenVerifier._keys_fetched_at -= GoogleTokenVerifier.refresh_interval
+
+        result = self.verify(self.build_token("key-2", rotated_key))
+        self.verify(self.build_token("key-2", rotated_key))
+
+        self.assertEqual(result["email"], "jwt@test.com")
+        self.assertEqual(self.server.hits, {"/certs": 2})
+
+    def test_unknown_key_refetch_is_rate_limited(self):
+        self.verify(self.build_token())
+        forged_key = rsa.generate_private_key(public_exponent=65537, key_size=2048)
+
+        for _ in range(3):
+            with self.assertRaises(ValueError):
+                async_to_sync(GoogleTokenVerifier.verify_id_token)(
+                    self.build_token("forged", forged_key)
+                )
+
+        self.assertEqual(self.server.hits, {"/certs": 1})
+
+    def test_id_token_rejects_foreign_audience_and_issuer(self):
+        for claims in ({"aud": "someone-else"}, {"iss": "https://evil.example"}):
+            with self.subTest(claims=claims):
+                with self.assertRaises(ValueError):
+                    async_to_sync(GoogleTokenVerifier.verify_id_token)(
+                        self.build_token(**claims)
+                    )
+
+    def test_access_token_userinfo_is_cached(self):
+        for _ in range(2):
+            self.assertEqual(
+                self.verify("access-token"),
+                {"email": "access@test.com", "given_name": "Access", "family_name": ""},
+            )
+
+        self.assertEqual(self.server.hits, {"/userinfo": 1})
+
+    def test_invalid_access_token_is_not_cached(self):
+        for _ in range(2):
+            with self.assertRaisesMessage(ValueError, "Invalid Google Token"):
+                self.verify("revoked-token")
+
+        self.assertEqual(self.server.hits, {"/userinfo": 2})
+
+    def count_clients(self, bind_server_loop):
+        async def verify_twice():
+            if bind_server_loop:
+                await request_started.asend(sender=ASGIHandler, scope={})
+            for _ in range(2):
+                with self.assertRaises(ValueError):
+                    await GoogleTokenVerifier.verify("revoked-token")
+            client = GoogleTokenVerifier._client
+            if client is not None:
+                await client.aclose()
+            return client
+
+        with patch.object(
+            GoogleTokenVerifier,
+            "build_client",
+            wraps=GoogleTokenVerifier.build_client,
+        ) as mock_build:
+            client = async_to_sync(verify_twice)()
+        return mock_build.call_count, client
+
+    def test_client_is_shared_on_the_server_loop(self):
+        count, client = self.count_clients(bind_server_loop=True)
+
+        self.assertEqual(count, 1)
+        self.assertIsNotNone(client)
+
+    def test_client_is_per_call_off_the_server_loop(self):
+        count, client = self.count_clients(bind_server_loop=False)
+
+        self.assertEqual(count, 2)
+        self.assertIsNone(client)
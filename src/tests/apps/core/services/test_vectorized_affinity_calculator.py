@@ -0,0 +1,106 @@
+import math
+import random
+from typing import cast
+
+from core.services.affinity_calculator import AffinityCalculator
+from core.services.vectorized_affinity_calculator import (
+    AxisArrays,
+    VectorizedAffinityCalculator,
+)
+from django.test import TestCase
+from ideology.services.calculation_dto import CalculationItem
+
+
+class VectorizedAffinityCalculatorTestCase(TestCase):
+    @staticmethod
+    def _axis(value, margin_left=0, margin_right=0, is_indifferent=False, **kwargs):
+        return CalculationItem(
+            type="axis",
+            value=value,
+            margin_left=margin_left,
+            margin_right=margin_right,
+            is_indifferent=is_indifferent,
+            complexity_uuid=kwargs.get("complexity_uuid", "c1"),
+            section_uuid=kwargs.get("section_uuid", "s1"),
+        )
+
+    @staticmethod
+    def _random_side(rng, keys):
+        data = {}
+        for key, (complexity_uuid, section_uuid) in keys.items():
+            if rng.random() < 0.2:
+                continue
+            if section_uuid is None:
+                data[key] = CalculationItem(
+                    type="conditioner",
+                    value=rng.choice(["yes", "no", "indifferent"]),
+                    is_indifferent=rng.random() < 0.2,
+                    complexity_uuid=complexity_uuid,
+                )
+                continue
+            is_indifferent = rng.random() < 0.1
+            data[key] = CalculationItem(
+                type="axis",
+                value=None if is_indifferent else rng.randint(-100, 100),
+                is_indifferent=is_indifferent,
+                complexity_uuid=complexity_uuid,
+                section_uuid=section_uuid,
+                margin_left=rng.choice([0, rng.randint(0, 200)]),
+                margin_right=rng.choice([0, rng.randint(0, 200)]),
+            )
+        return data
+
+    def _assert_same_output(self, data_a, data_b):
+        expected = AffinityCalculator(data_a, data_b).calculate_detailed()
+        result = VectorizedAffinityCalculator(data_a, data_b).calculate_detailed()
+        self.assertEqual(result, expected)
+
+    def test_matches_reference_on_random_trees(self):
+        rng = random.Random(1234)
+        for _ in range(25):
+            keys = {}
+            for index in range(rng.randint(1, 400)):
+                complexity_uuid = f"c{rng.randint(0, 3)}"
+                keys[f"axis{index}"] = (
+                    complexity_uuid,
+                    f"{complexity_uuid}-s{rng.randint(0, 5)}",
+                )
+            for index in range(rng.randint(0, 10)):
+                keys[f"cond{index}"] = (f"c{rng.randint(0, 3)}", None)
+
+            self._assert_same_output(
+                self._random_side(rng, keys), self._random_side(rng, keys)
+            )
+
+    def test_matches_reference_on_edge_cases(self):
+        cases = [
+            (self._axis(10), self._axis(40)),
+            (self._axis(40), self._axis(10)),
+            (self._axis(10, 5, 5), self._axis(14, 5, 5)),
+            (self._axis(20, 5, 5), self._axis(15, 5, 5)),
+            (self._axis(-100), self._axis(100)),
+            (self._axis(50), self._axis(50)),
+            (self._axis(None, is_indifferent=True), self._axis(30)),
+            (self._axis(None), self._axis(None)),
+        ]
+        for item_a, item_b in cases:
+            with self.subTest(a=item_a.value, b=item_b.value):
+                self._assert_same_output({"axis": item_a}, {"axis": item_b})
+
+    def test_defensive_missing_items(self):
+        data_a = cast(dict[str, CalculationItem], {"bad_key": None})
+        data_b = {"orphan": self._axis(50, complexity_uuid=None)}
+        self._assert_same_output(data_a, data_b)
+        self._assert_same_output({}, {})
+
+    def test_score_arrays_marks_unmatched_axes_as_nan(self):
+        keys = ["shared", "only_a"]
+        side_a = AxisArrays.pack(
+            {"shared": self._axis(0), "only_a": self._axis(0)}, keys
+        )
+        side_b = AxisArrays.pack({"shared": self._axis(0)}, keys)
+
+        scores = VectorizedAffinityCalculator.score_arrays(side_a, side_b)
+
+        self.assertEqual(scores[0], 100.0)
+        self.assertTrue(math.isnan(scores[1]))
@@ -6,16 +6,31 @@ from core.models import User
 from core.tasks.maintenance import delete_unverified_users
 from django.test import TestCase
 from django.utils import timezone
+from ideology.factories import (
+    CompletedAnswerFactory,
+    UserAxisAnswerFactory,
+    UserConditionerAnswerFactory,
+)
+from ideology.models import (
+    CompletedAnswer,
+    UserAnswerVector,
+    UserAxisAnswer,
+    UserConditionerAnswer,
+)
 
 
 class MaintenanceTasksTestCase(TestCase):
-    @patch("core.tasks.maintenance.send_email_notification.delay")
+    def create_expired_user(self, **kwargs) -> User:
+        user = UserFactory(is_verified=False, **kwargs)
+        User.objects.filter(pk=user.pk).update(
+            created=timezone.now() - timedelta(days=32)
+        )
+        return user
+
+    @patch("core.tasks.notifications.send_email_notifications.delay")
     def test_delete_unverified_users_logic(self, mock_send):
         now = timezone.now()
-        user_to_delete = UserFactory(is_verified=False, email="del@test.com")
-        User.objects.filter(pk=user_to_delete.pk).update(
-            created=now - timedelta(days=32)
-        )
+        user_to_delete = self.create_expired_user(email="del@test.com")
         user_safe_verified = UserFactory(is_verified=True, email="safe1@test.com")
         User.objects.filter(pk=user_safe_verified.pk).update(
             created=now - timedelta(days=40)
@@ -27,11 +42,64 @@ class MaintenanceTasksTestCase(TestCase):
         with self.captureOnCommitCallbacks(execute=True):
             delete_unverified_users()
         mock_send.assert_called_once()
-        self.assertEqual(mock_send.call_args.kwargs["to_email"], "del@test.com")
+        (notifications,) = mock_send.call_args.args
+        self.assertEqual(len(notifications), 1)
+        self.assertEqual(notifications[0]["to_email"], "del@test.com")
+        self.assertEqual(
+            notifications[0]["template_name"], "user_deleted_due_no_verification"
+        )
         self.assertEqual(
-            mock_send.call_args.kwargs["template_name"],
-            "user_deleted_due_no_verification",
+            notifications[0]["context"], {"username": user_to_delete.username}
         )
         self.assertFalse(User.objects.filter(pk=user_to_delete.pk).exists())
         self.assertTrue(User.objects.filter(pk=user_safe_verified.pk).exists())
         self.assertTrue(User.objects.filter(pk=user_safe_recent.pk).exists())
+
+    @patch("core.tasks.notifications.send_email_notifications.delay")
+    def test_delete_unverified_users_in_batches(self, mock_send):
+        users = [
+            self.create_expired_user(email=f"user{index}@test.com")
+            for index in range(5)
+        ]
+        for user in users:
+            UserAxisAnswerFactory(user=user)
+            UserConditionerAnswerFactory(user=user)
+            CompletedAnswerFactory(completed_by=user)
+        user_ids = [user.pk for user in users]
+
+        with self.captureOnCommitCallbacks(execute=True):
+            self.assertEqual(delete_unverified_users(batch_size=2), 5)
+
+        self.assertEqual(
+            [len(call.args[0]) for call in mock_send.call_args_list], [2, 2, 1]
+        )
+        self.assertEqual(
+            sorted(
+                notification["to_email"]
+                for call in mock_send.call_args_list
+                for notification in call.args[0]
+            ),
+            sorted(user.email for user in users),
+        )
+        self.assertFalse(User.objects.filter(pk__in=user_ids).exists())
+        for model, field in (
+            (UserAxisAnswer, "user_id"),
+            (UserConditionerAnswer, "user_id"),
+            (UserAnswerVector, "user_id"),
+            (CompletedAnswer, "completed_by_id"),
+        ):
+            self.assertFalse(
+                model.objects.filter(**{f"{field}__in": user_ids}).exists()
+            )
+
+    @patch("core.tasks.notifications.send_email_notifications.delay")
+    def test_each_batch_runs_a_fixed_number_of_queries(self, mock_send):
+        for index in range(4):
+            user = self.create_expired_user(email=f"user{index}@test.com")
+            UserAxisAnswerFactory(user=user)
+            CompletedAnswerFactory(completed_by=user)
+
+        # Lock and select the batch, load the users, one DELETE per related
+        # table and the users themselves, then an empty lookup that ends the loop.
+        with self.assertNumQueries(15):
+            delete_unverified_users(batch_size=10)
@@ -1,20 +1,33 @@
-from unittest.mock import patch
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from unittest.mock import Mock, patch
 
-from core.tasks import send_email_notification
-from django.test import TestCase
+from celery.exceptions import Retry
+from core.tasks import send_email_notification, send_email_notifications
+from core.tasks.notifications import (
+    NotificationRateLimiter,
+    get_rate_limit,
+    reset_session,
+)
+from django.conf import settings
+from django.test import SimpleTestCase, TestCase, override_settings
 from requests.exceptions import RequestException
 
 
 class NotificationsTestCase(TestCase):
-    @patch("core.tasks.notifications.requests.post")
-    def test_send_email_success(self, mock_post):
+    @patch("core.tasks.notifications.get_session")
+    def test_send_email_success(self, mock_session):
+        mock_post = mock_session.return_value.post
         mock_post.return_value.ok = True
         mock_post.return_value.json.return_value = {"ok": True}
         res = send_email_notification(to_email="a@b.com", template_name="t")
         self.assertTrue(res["ok"])
 
-    @patch("core.tasks.notifications.requests.post")
-    def test_send_email_retry_logic(self, mock_post):
+    @patch("core.tasks.notifications.get_session")
+    def test_send_email_retry_logic(self, mock_session):
+        mock_post = mock_session.return_value.post
         mock_post.side_effect = RequestException("Net")
         with self.assertRaises(RequestException):
             send_email_notification(to_email="a@b.com", template_name="t")
@@ -23,3 +36,134 @@ class NotificationsTestCase(TestCase):
         mock_post.return_value.raise_for_status.side_effect = RequestException("500")
         with self.assertRaises(RequestException):
             send_email_notification(to_email="a@b.com", template_name="t")
+
+    @patch("core.tasks.notifications.get_session")
+    def test_send_email_notifications_posts_every_recipient(self, mock_session):
+        mock_post = mock_session.return_value.post
+        mock_post.return_value.ok = True
+        notifications = [
+            {"to_email": f"user{index}@b.com", "template_name": "t"}
+            for index in range(3)
+        ]
+
+        self.assertEqual(send_email_notifications(notifications), 3)
+        self.assertEqual(
+            sorted(
+                call.kwargs["json"]["to_email"] for call in mock_post.call_args_list
+            ),
+            ["user0@b.com", "user1@b.com", "user2@b.com"],
+        )
+
+    @patch("core.tasks.notifications.send_email_notifications.retry")
+    @patch("core.tasks.notifications.get_session")
+    def test_send_email_notifications_retries_only_failures(
+        self, mock_session, mock_retry
+    ):
+        def post(url, json, **kwargs):
+            if json["to_email"] == "failed@b.com":
+                raise RequestException("Net")
+            return Mock(ok=True)
+
+        mock_session.return_value.post.side_effect = post
+        mock_retry.side_effect = Retry()
+        notifications = [
+            {"to_email": "ok@b.com", "template_name": "t"},
+            {"to_email": "failed@b.com", "template_name": "t"},
+        ]
+
+        with self.assertRaises(Retry):
+            send_email_notifications(notifications)
+        self.assertEqual(mock_retry.call_args.kwargs["args"], ([notifications[1]],))
+
+
+class NotificationServiceStub(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def do_POST(self):
+        server = self.server
+        with server.lock:
+            server.in_flight += 1
+            server.max_in_flight = max(server.max_in_flight, server.in_flight)
+            server.client_ports.add(self.client_address[1])
+        payload = json.loads(self.rfile.read(int(self.headers["Content-Length"])))
+        time.sleep(0.01)
+        with server.lock:
+            server.in_flight -= 1
+            server.recipients.append(payload["to_email"])
+
+        body = b'{"ok": true}'
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+class BatchNotificationServiceTestCase(SimpleTestCase):
+    def setUp(self):
+        self.server = ThreadingHTTPServer(("127.0.0.1", 0), NotificationServiceStub)
+        self.server.lock = threading.Lock()
+        self.server.in_flight = 0
+        self.server.max_in_flight = 0
+        self.server.client_ports = set()
+        self.server.recipients = []
+        threading.Thread(target=self.server.serve_forever, daemon=True).start()
+        reset_session()
+
+    def tearDown(self):
+        reset_session()
+        self.server.shutdown()
+        self.server.server_close()
+
+    def test_batches_reuse_connections_within_the_concurrency_cap(self):
+        notifications = [
+            {"to_email": f"user{index}@b.com", "template_name": "t"}
+            for index in range(12)
+        ]
+
+        with override_settings(
+            NOTIFICATIONS_SERVICE_URL=f"http://127.0.0.1:{self.server.server_port}",
+            NOTIFICATIONS_MAX_CONCURRENCY=3,
+            NOTIFICATIONS_RATE_LIMIT=0,
+        ):
+            self.assertEqual(send_email_notifications(notifications), 12)
+            self.assertEqual(send_email_notifications(notifications[:3]), 3)
+
+        self.assertEqual(len(self.server.recipients), 15)
+        self.assertLessEqual(self.server.max_in_flight, 3)
+        self.assertLessEqual(len(self.server.client_ports), 3)
+
+
+class NotificationRateLimiterTestCase(SimpleTestCase):
+    def test_wait_spaces_out_requests(self):
+        rate_limiter = NotificationRateLimiter(50)
+        start = time.monotonic()
+        for _ in range(5):
+            rate_limiter.wait()
+        self.assertGreaterEqual(time.monotonic() - start, 0.08)
+
+    def test_zero_rate_disables_the_limit(self):
+        rate_limiter = NotificationRateLimiter(0)
+        start = time.monotonic()
+        for _ in range(100):
+            rate_limiter.wait()
+        self.assertLess(time.monotonic() - start, 0.05)
+
+    @override_settings(NOTIFICATIONS_RATE_LIMIT=20.0)
+    def test_task_rate_limit_spreads_the_rate_over_each_batch(self):
+        self.assertEqual(get_rate_limit(1), "20.0/s")
+        self.assertEqual(get_rate_limit(200), "0.1/s")
+
+    @override_settings(NOTIFICATIONS_RATE_LIMIT=0)
+    def test_zero_rate_leaves_tasks_unlimited(self):
+        self.assertIsNone(get_rate_limit(200))
+
+    def test_notification_tasks_are_rate_limited(self):
+        self.assertEqual(send_email_notification.rate_limit, get_rate_limit(1))
+        self.assertEqual(
+            send_email_notifications.rate_limit,
+            get_rate_limit(settings.NOTIFICATIONS_BATCH_SIZE),
+        )
@@ -3,12 +3,13 @@ from unittest.mock import patch
 
 from core.factories import UserFactory
 from core.models import User
-from core.tasks.reminders import send_verification_reminders
-from django.test import TestCase
+from core.tasks.reminders import iter_unverified_users, send_verification_reminders
+from django.test import TestCase, override_settings
+from django.utils import timezone as django_timezone
 
 
 class VerificationRemindersTestCase(TestCase):
-    @patch("core.tasks.reminders.send_email_notification.delay")
+    @patch("core.tasks.notifications.send_email_notifications.delay")
     @patch("django.utils.timezone.now")
     def test_send_verification_reminders_logic(self, mock_now, mock_send):
         fixed_now = datetime(2025, 1, 15, 12, 0, 0, tzinfo=timezone.utc)
@@ -30,12 +31,74 @@ class VerificationRemindersTestCase(TestCase):
         create_target_user(3, is_verified=True, email_prefix="verified")
         send_verification_reminders()
         self.assertEqual(mock_send.call_count, 3)
-        calls = mock_send.call_args_list
-        sent_emails = [call.kwargs["to_email"] for call in calls]
-        sent_templates = [call.kwargs["template_name"] for call in calls]
+        notifications = [
+            notification
+            for call in mock_send.call_args_list
+            for notification in call.args[0]
+        ]
+        sent_emails = [notification["to_email"] for notification in notifications]
+        sent_templates = [
+            notification["template_name"] for notification in notifications
+        ]
+        self.assertEqual(len(notifications), 3)
         self.assertIn(u3.email, sent_emails)
         self.assertIn(u7.email, sent_emails)
         self.assertIn(u30.email, sent_emails)
         self.assertIn("registration_reminder_3_days", sent_templates)
         self.assertIn("registration_reminder_7_days", sent_templates)
         self.assertIn("registration_reminder_30_days", sent_templates)
+
+    @override_settings(NOTIFICATIONS_BATCH_SIZE=2)
+    @patch("core.tasks.notifications.send_email_notifications.delay")
+    @patch("django.utils.timezone.now")
+    def test_reminders_are_enqueued_in_batches(self, mock_now, mock_send):
+        fixed_now = datetime(2025, 1, 15, 12, 0, 0, tzinfo=timezone.utc)
+        mock_now.return_value = fixed_now
+        for index in range(5):
+            user = UserFactory(is_verified=False, email=f"user{index}@test.com")
+            User.objects.filter(pk=user.pk).update(
+                created=fixed_now - timedelta(days=3)
+            )
+
+        send_verification_reminders()
+
+        self.assertEqual(
+            [len(call.args[0]) for call in mock_send.call_args_list], [2, 2, 1]
+        )
+
+    @patch("core.tasks.notifications.send_email_notifications.delay")
+    @patch("django.utils.timezone.now")
+    def test_reminders_use_half_open_local_days(self, mock_now, mock_send):
+        fixed_now = datetime(2025, 1, 15, 12, 0, 0, tzinfo=timezone.utc)
+        mock_now.return_value = fixed_now
+        day_start = django_timezone.make_aware(datetime(2025, 1, 12))
+        created_at = {
+            "first@test.com": day_start,
+            "last@test.com": day_start + timedelta(days=1, microseconds=-1),
+            "next@test.com": day_start + timedelta(days=1),
+        }
+        for email, created in created_at.items():
+            user = UserFactory(is_verified=False, email=email)
+            User.objects.filter(pk=user.pk).update(created=created)
+
+        send_verification_reminders(chunk_size=1)
+
+        self.assertEqual(
+            sorted(
+                notification["to_email"]
+                for call in mock_send.call_args_list
+                for notification in call.args[0]
+            ),
+            ["first@test.com", "last@test.com"],
+        )
+
+    def test_chunks_do_not_skip_users_sharing_a_timestamp(self):
+        created = datetime(2025, 1, 10, 12, 0, 0, tzinfo=timezone.utc)
+        users = [UserFactory(is_verified=False) for _ in range(5)]
+        User.objects.filter(pk__in=[user.pk for user in users]).update(created=created)
+
+        result = list(
+            iter_unverified_users(created, created + timedelta(seconds=1), chunk_size=2)
+        )
+
+        self.assertEqual(result, [(user.email, str(user.uuid)) for user in users])
@@ -0,0 +1,19 @@
+import tempfile
+
+from core.factories import UserFactory
+from core.tasks.similarity import rebuild_answer_similarity_index
+from django.test import TestCase, override_settings
+from ideology.factories import CompletedAnswerFactory
+from ideology.services.answer_similarity_index import AnswerSimilarityIndex
+
+
+class SimilarityTasksTestCase(TestCase):
+    def test_rebuild_answer_similarity_index(self):
+        CompletedAnswerFactory(completed_by=UserFactory(is_public=True))
+        CompletedAnswerFactory(completed_by=UserFactory(is_public=False))
+
+        with tempfile.TemporaryDirectory() as directory:
+            with override_settings(SIMILARITY_INDEX_DIR=directory):
+                self.assertEqual(rebuild_answer_similarity_index(), 1)
+                self.assertEqual(rebuild_answer_similarity_index(full=True), 1)
+                self.assertEqual(len(AnswerSimilarityIndex.get().answer_uuids), 1)
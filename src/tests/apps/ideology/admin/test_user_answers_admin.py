@@ -1,9 +1,9 @@
 from core.factories import UserFactory
 from django.contrib.admin.sites import AdminSite
-from django.test import TestCase
+from django.test import RequestFactory, TestCase
 from ideology.admin import UserAxisAnswerAdmin, UserConditionerAnswerAdmin
 from ideology.factories import UserAxisAnswerFactory, UserConditionerAnswerFactory
-from ideology.models import UserAxisAnswer, UserConditionerAnswer
+from ideology.models import UserAnswerVector, UserAxisAnswer, UserConditionerAnswer
 
 
 class UserAxisAnswerAdminTestCase(TestCase):
@@ -16,6 +16,19 @@ class UserAxisAnswerAdminTestCase(TestCase):
         answer = UserAxisAnswerFactory(user=user)
         self.assertIn("testuser", str(answer))
 
+    def test_changes_invalidate_answer_vector(self):
+        answer = UserAxisAnswerFactory()
+        request = RequestFactory().post("/")
+        form = self.admin.get_form(request, answer)(instance=answer)
+
+        UserAnswerVector.objects.rebuild(answer.user)
+        self.admin.save_model(request, answer, form, change=True)
+        self.assertFalse(UserAnswerVector.objects.exists())
+
+        UserAnswerVector.objects.rebuild(answer.user)
+        self.admin.delete_queryset(request, UserAxisAnswer.objects.all())
+        self.assertFalse(UserAnswerVector.objects.exists())
+
 
 class UserConditionerAnswerAdminTestCase(TestCase):
     def setUp(self):
@@ -26,3 +39,11 @@ class UserConditionerAnswerAdminTestCase(TestCase):
         user = UserFactory(username="testuser")
         answer = UserConditionerAnswerFactory(user=user)
         self.assertIn("testuser", str(answer))
+
+    def test_delete_invalidates_answer_vector(self):
+        answer = UserConditionerAnswerFactory()
+        UserAnswerVector.objects.rebuild(answer.user)
+
+        self.admin.delete_model(RequestFactory().post("/"), answer)
+
+        self.assertFalse(UserAnswerVector.objects.exists())
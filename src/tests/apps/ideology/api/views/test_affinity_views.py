@@ -1,5 +1,13 @@
+import tempfile
+from unittest.mock import patch
+
 from core.api.api_test_helpers import APITestBase
 from core.factories import UserFactory
+from core.services.vectorized_affinity_calculator import VectorizedAffinityCalculator
+from django.core.cache import caches
+from django.db import connection
+from django.test import override_settings
+from django.test.utils import CaptureQueriesContext
 from django.urls import reverse
 from ideology.factories import (
     CompletedAnswerFactory,
@@ -10,6 +18,7 @@ from ideology.factories import (
     IdeologySectionFactory,
     UserAxisAnswerFactory,
 )
+from ideology.services.answer_similarity_index import AnswerSimilarityIndex
 from rest_framework import status
 
 
@@ -123,3 +132,434 @@ class UserIdeologyAffinityViewTestCase(APITestBase):
         response = self.client.get(self.url)
         self.assertEqual(response.status_code, status.HTTP_200_OK)
         self.assertEqual(response.data["total_affinity"], 100.0)
+
+
+class IdeologyAffinityRankingViewTestCase(APITestBase):
+    def setUp(self):
+        super().setUp()
+        self.ideology_abstraction_complexity = IdeologyAbstractionComplexityFactory(
+            name="Level 1"
+        )
+        self.ideology_section = IdeologySectionFactory(
+            name="Econ", abstraction_complexity=self.ideology_abstraction_complexity
+        )
+        self.ideology_axis = IdeologyAxisFactory(
+            name="TestAxis", section=self.ideology_section
+        )
+
+        self.ideologies = {}
+        for name, value in (("Close", 90), ("Exact", 100), ("Far", -100)):
+            ideology = IdeologyFactory(
+                name=name, add_tags__total=0, add_associations__total=0
+            )
+            IdeologyAxisDefinitionFactory(
+                ideology=ideology,
+                axis=self.ideology_axis,
+                value=value,
+                margin_left=0,
+                margin_right=0,
+            )
+            self.ideologies[name] = ideology
+
+        IdeologyFactory(name="Undefined", add_tags__total=0, add_associations__total=0)
+        hidden = IdeologyFactory(
+            name="Hidden", visible=False, add_tags__total=0, add_associations__total=0
+        )
+        IdeologyAxisDefinitionFactory(
+            ideology=hidden,
+            axis=self.ideology_axis,
+            value=100,
+            margin_left=0,
+            margin_right=0,
+        )
+
+        UserAxisAnswerFactory(
+            user=self.user,
+            axis=self.ideology_axis,
+            value=100,
+            margin_left=0,
+            margin_right=0,
+        )
+        self.url = reverse("ideology:ideology-affinity-ranking")
+
+    def test_anonymous_request_missing_source_uuid_returns_400(self):
+        self.client.credentials()
+        response = self.client.get(self.url)
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+    def test_ranking_sorted_and_excludes_hidden_and_undefined(self):
+        response = self.client.get(self.url)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(
+            [entry["target_ideology"]["name"] for entry in response.data],
+            ["Exact", "Close", "Far"],
+        )
+        self.assertEqual(response.data[0]["total_affinity"], 100.0)
+
+    def test_totals_match_single_ideology_endpoint(self):
+        response = self.client.get(self.url)
+        for entry in response.data:
+            ideology = self.ideologies[entry["target_ideology"]["name"]]
+            single = self.client.get(
+                reverse(
+                    "ideology:ideology-affinity",
+                    kwargs={"ideology_uuid": ideology.uuid.hex},
+                )
+            )
+            self.assertEqual(entry["total_affinity"], single.data["total_affinity"])
+
+    def test_limit(self):
+        response = self.client.get(self.url, {"limit": 1})
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(len(response.data), 1)
+
+    def test_invalid_limit_returns_400(self):
+        for limit in ("abc", "0", "101"):
+            with self.subTest(limit=limit):
+                response = self.client.get(self.url, {"limit": limit})
+                self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+
+class AffinityResultCacheViewTestCase(APITestBase):
+    def setUp(self):
+        super().setUp()
+        caches["affinity"].clear()
+        self.client.credentials()
+        self.ideology_axis = IdeologyAxisFactory(name="CachedAxis")
+        answers = {
+            "axis": [
+                {
+                    "uuid": self.ideology_axis.uuid.hex,
+                    "value": 50,
+                    "margin_left": 0,
+                    "margin_right": 0,
+                }
+            ]
+        }
+        self.source_answer = CompletedAnswerFactory(
+            completed_by=None, answers=answers, answer_hash="a" * 64
+        )
+        self.target_answer = CompletedAnswerFactory(
+            answers=answers, answer_hash="b" * 64
+        )
+        self.ideology = IdeologyFactory(
+            name="CachedIdeology", add_tags__total=0, add_associations__total=0
+        )
+        self.definition = IdeologyAxisDefinitionFactory(
+            ideology=self.ideology,
+            axis=self.ideology_axis,
+            value=50,
+            margin_left=0,
+            margin_right=0,
+        )
+        self.params = {"source_answer_uuid": self.source_answer.uuid.hex}
+
+    def _count_calculations(self, *urls):
+        with patch.object(
+            VectorizedAffinityCalculator,
+            "calculate_detailed",
+            autospec=True,
+            side_effect=VectorizedAffinityCalculator.calculate_detailed,
+        ) as calculate_detailed:
+            responses = [self.client.get(url, self.params) for url in urls]
+        return calculate_detailed.call_count, responses
+
+    def test_completed_answer_affinity_is_memoized(self):
+        url = reverse(
+            "ideology:completed-answer-affinity",
+            kwargs={"target_answer_uuid": self.target_answer.uuid.hex},
+        )
+
+        calls, responses = self._count_calculations(url, url)
+
+        self.assertEqual(calls, 1)
+        self.assertEqual(responses[0].data, responses[1].data)
+        self.assertEqual(responses[1].data["total_affinity"], 100.0)
+
+    def test_ideology_affinity_is_recalculated_after_definition_change(self):
+        url = reverse(
+            "ideology:ideology-affinity",
+            kwargs={"ideology_uuid": self.ideology.uuid.hex},
+        )
+        calls, responses = self._count_calculations(url, url)
+        self.assertEqual(calls, 1)
+        self.assertEqual(responses[1].data["total_affinity"], 100.0)
+
+        self.definition.value = -50
+        self.definition.save()
+
+        calls, responses = self._count_calculations(url)
+        self.assertEqual(calls, 1)
+        self.assertLess(responses[0].data["total_affinity"], 100.0)
+
+
+class CompletedAnswerBatchAffinityViewTestCase(APITestBase):
+    def setUp(self):
+        super().setUp()
+        self.client.credentials()
+        self.ideology_axis = IdeologyAxisFactory(name="BatchAxis")
+        self.source_answer = CompletedAnswerFactory(
+            completed_by=None, answers=self._answers(50)
+        )
+        self.targets = [
+            CompletedAnswerFactory(answers=self._answers(value))
+            for value in (50, 0, -100)
+        ]
+        self.url = reverse("ideology:completed-answer-affinity-batch")
+        self.params = f"?source_answer_uuid={self.source_answer.uuid.hex}"
+
+    def _answers(self, value):
+        return {
+            "axis": [
+                {
+                    "uuid": self.ideology_axis.uuid.hex,
+                    "value": value,
+                    "margin_left": 0,
+                    "margin_right": 0,
+                }
+            ]
+        }
+
+    def _post(self, data):
+        return self.client.post(self.url + self.params, data, format="json")
+
+    def test_anonymous_request_missing_source_uuid_returns_400(self):
+        response = self.client.post(
+            self.url,
+            {"target_answer_uuids": [self.targets[0].uuid.hex]},
+            format="json",
+        )
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+    def test_totals_match_single_endpoint_in_request_order(self):
+        unknown_uuid = "00000000000000000000000000000000"
+        requested = [target.uuid.hex for target in reversed(self.targets)]
+
+        response = self._post(
+            {"target_answer_uuids": requested + [unknown_uuid, requested[0]]}
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(
+            [entry["target_answer_uuid"] for entry in response.data], requested
+        )
+        for entry in response.data:
+            single = self.client.get(
+                reverse(
+                    "ideology:completed-answer-affinity",
+                    kwargs={"target_answer_uuid": entry["target_answer_uuid"]},
+                ),
+                {"source_answer_uuid": self.source_answer.uuid.hex},
+            )
+            self.assertEqual(entry["total_affinity"], single.data["total_affinity"])
+            self.assertNotIn("complexities", entry)
+
+    def test_include_complexities(self):
+        response = self._post(
+            {
+                "target_answer_uuids": [self.targets[0].uuid.hex],
+                "include_complexities": True,
+            }
+        )
+
+        complexities = response.data[0]["complexities"]
+        self.assertEqual(len(complexities), 1)
+        self.assertEqual(
+            complexities[0]["complexity"]["uuid"],
+            self.ideology_axis.section.abstraction_complexity.uuid.hex,
+        )
+        self.assertEqual(complexities[0]["affinity"], 100.0)
+
+    def test_query_count_does_not_grow_with_targets(self):
+        self._post({"target_answer_uuids": [self.targets[0].uuid.hex]})
+
+        with CaptureQueriesContext(connection) as single_target:
+            self._post({"target_answer_uuids": [self.targets[0].uuid.hex]})
+        with CaptureQueriesContext(connection) as all_targets:
+            self._post(
+                {"target_answer_uuids": [target.uuid.hex for target in self.targets]}
+            )
+
+        self.assertEqual(len(single_target), len(all_targets))
+
+    def test_invalid_target_lists_return_400(self):
+        for target_answer_uuids in ([], ["not-a-uuid"], ["0" * 32] * 501):
+            with self.subTest(size=len(target_answer_uuids)):
+                response = self._post({"target_answer_uuids": target_answer_uuids})
+                self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+
+class AffinityDetailLevelViewTestCase(APITestBase):
+    def setUp(self):
+        super().setUp()
+        self.ideology_axis = IdeologyAxisFactory(name="DetailAxis")
+        self.ideology = IdeologyFactory(
+            name="DetailIdeology", add_tags__total=0, add_associations__total=0
+        )
+        IdeologyAxisDefinitionFactory(
+            ideology=self.ideology,
+            axis=self.ideology_axis,
+            value=100,
+            margin_left=0,
+            margin_right=0,
+        )
+        UserAxisAnswerFactory(
+            user=self.user,
+            axis=self.ideology_axis,
+            value=100,
+            margin_left=0,
+            margin_right=0,
+        )
+        self.url = reverse(
+            "ideology:ideology-affinity",
+            kwargs={"ideology_uuid": self.ideology.uuid.hex},
+        )
+
+    def test_summary_omits_sections(self):
+        response = self.client.get(self.url, {"detail": "summary"})
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data["total_affinity"], 100.0)
+        complexity = response.data["complexities"][0]
+        self.assertEqual(complexity["affinity"], 100.0)
+        self.assertEqual(
+            complexity["complexity"]["uuid"],
+            self.ideology_axis.section.abstraction_complexity.uuid.hex,
+        )
+        self.assertNotIn("sections", complexity)
+
+    def test_sections_omits_axes(self):
+        response = self.client.get(self.url, {"detail": "sections"})
+
+        section = response.data["complexities"][0]["sections"][0]
+        self.assertEqual(
+            section["section"]["uuid"], self.ideology_axis.section.uuid.hex
+        )
+        self.assertNotIn("axes", section)
+
+    def test_full_is_default(self):
+        response = self.client.get(self.url)
+
+        section = response.data["complexities"][0]["sections"][0]
+        self.assertEqual(
+            section["axes"][0]["axis"]["uuid"], self.ideology_axis.uuid.hex
+        )
+
+    def test_invalid_detail_returns_400(self):
+        response = self.client.get(self.url, {"detail": "everything"})
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+
+class SimilarCompletedAnswersViewTestCase(APITestBase):
+    def setUp(self):
+        super().setUp()
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        settings_override = override_settings(SIMILARITY_INDEX_DIR=directory.name)
+        settings_override.enable()
+        self.addCleanup(settings_override.disable)
+
+        self.ideology_axis = IdeologyAxisFactory(name="SimilarAxis")
+        self.url = reverse("ideology:completed-answer-similar")
+        self.source_answer = CompletedAnswerFactory(
+            completed_by=None, answers=self._answers(50)
+        )
+        self.targets = {
+            value: CompletedAnswerFactory(
+                completed_by=UserFactory(is_public=True), answers=self._answers(value)
+            )
+            for value in (-100, 50, 0)
+        }
+        CompletedAnswerFactory(
+            completed_by=UserFactory(is_public=False), answers=self._answers(50)
+        )
+
+    def _answers(self, value):
+        return {
+            "axis": [
+                {
+                    "uuid": self.ideology_axis.uuid.hex,
+                    "value": value,
+                    "margin_left": 0,
+                    "margin_right": 0,
+                }
+            ]
+        }
+
+    def test_anonymous_request_missing_source_uuid_returns_400(self):
+        self.client.credentials()
+        response = self.client.get(self.url)
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+    def test_returns_public_users_ranked_by_exact_affinity(self):
+        AnswerSimilarityIndex.rebuild()
+        self.client.credentials()
+        response = self.client.get(
+            self.url, {"source_answer_uuid": self.source_answer.uuid.hex, "limit": 2}
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(
+            [entry["target_answer_uuid"] for entry in response.data],
+            [self.targets[50].uuid.hex, self.targets[0].uuid.hex],
+        )
+        self.assertEqual(response.data[0]["total_affinity"], 100.0)
+        self.assertEqual(
+            response.data[0]["target_user"]["uuid"],
+            self.targets[50].completed_by.uuid.hex,
+        )
+
+    def test_excludes_authenticated_user(self):
+        self.user.is_public = True
+        self.user.save()
+        CompletedAnswerFactory(completed_by=self.user, answers=self._answers(50))
+        UserAxisAnswerFactory(
+            user=self.user,
+            axis=self.ideology_axis,
+            value=50,
+            margin_left=0,
+            margin_right=0,
+        )
+        AnswerSimilarityIndex.rebuild()
+        response = self.client.get(self.url)
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertNotIn(
+            self.user.uuid.hex,
+            [entry["target_user"]["uuid"] for entry in response.data],
+        )
+        self.assertEqual(len(response.data), 3)
+
+    def test_skips_answers_made_private_after_indexing(self):
+        AnswerSimilarityIndex.rebuild()
+        hidden_user = self.targets[50].completed_by
+        hidden_user.is_public = False
+        hidden_user.save()
+
+        self.client.credentials()
+        response = self.client.get(
+            self.url, {"source_answer_uuid": self.source_answer.uuid.hex}
+        )
+
+        self.assertNotIn(
+            self.targets[50].uuid.hex,
+            [entry["target_answer_uuid"] for entry in response.data],
+        )
+
+    @patch("core.tasks.rebuild_answer_similarity_index.delay")
+    def test_missing_index_is_requested_instead_of_built(self, mock_delay):
+        caches["default"].delete(AnswerSimilarityIndex.rebuild_requested_key)
+        self.client.credentials()
+
+        with self.captureOnCommitCallbacks(execute=True):
+            response = self.client.get(
+                self.url, {"source_answer_uuid": self.source_answer.uuid.hex}
+            )
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data, [])
+        mock_delay.assert_called_once()
+
+    def test_invalid_limit_returns_400(self):
+        response = self.client.get(self.url, {"limit": 0})
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
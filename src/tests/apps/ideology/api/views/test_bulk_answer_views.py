@@ -0,0 +1,95 @@
+from core.api.api_test_helpers import APITestBaseNeedAuthorized
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from ideology.factories import IdeologyAxisFactory, IdeologyConditionerFactory
+from ideology.models import UserAxisAnswer, UserConditionerAnswer
+from rest_framework import status
+
+
+class BulkUpsertAnswersViewTestCase(APITestBaseNeedAuthorized):
+    url = reverse("ideology:bulk-upsert-answers")
+
+    def setUp(self):
+        super().setUp()
+        self.axes = [IdeologyAxisFactory() for _ in range(3)]
+        self.conditioner = IdeologyConditionerFactory()
+
+    def _post(self, data):
+        return self.client.post(self.url, data=data, format="json")
+
+    def test_upserts_whole_section_in_one_request(self):
+        payload = {
+            "axis": [
+                {"uuid": axis.uuid.hex, "value": index * 10, "margin_left": 5}
+                for index, axis in enumerate(self.axes)
+            ],
+            "conditioners": [{"uuid": self.conditioner.uuid.hex, "answer": "Yes"}],
+        }
+
+        response = self._post(payload)
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(
+            response.data,
+            {
+                "axis": {"inserted": 3, "updated": 0, "skipped": 0},
+                "conditioners": {"inserted": 1, "updated": 0, "skipped": 0},
+            },
+        )
+        self.assertEqual(
+            sorted(
+                UserAxisAnswer.objects.filter(user=self.user).values_list(
+                    "value", flat=True
+                )
+            ),
+            [0, 10, 20],
+        )
+
+        payload["axis"][0]["value"] = -50
+        response = self._post(payload)
+        self.assertEqual(response.data["axis"]["updated"], 3)
+        self.assertEqual(
+            UserAxisAnswer.objects.get(user=self.user, axis=self.axes[0]).value, -50
+        )
+        self.assertEqual(UserConditionerAnswer.objects.count(), 1)
+
+    def test_query_count_does_not_grow_with_answers(self):
+        self._post({"axis": [{"uuid": self.axes[0].uuid.hex, "value": 1}]})
+        extra_axes = [IdeologyAxisFactory() for _ in range(20)]
+
+        with CaptureQueriesContext(connection) as single_answer:
+            self._post({"axis": [{"uuid": self.axes[1].uuid.hex, "value": 1}]})
+        with CaptureQueriesContext(connection) as many_answers:
+            response = self._post(
+                {
+                    "axis": [
+                        {"uuid": axis.uuid.hex, "value": 1}
+                        for axis in self.axes + extra_axes
+                    ]
+                }
+            )
+
+        self.assertEqual(
+            response.data["axis"], {"inserted": 21, "updated": 2, "skipped": 0}
+        )
+        self.assertEqual(len(single_answer), len(many_answers))
+
+    def test_invalid_payloads_return_400(self):
+        axis_uuid = self.axes[0].uuid.hex
+        for payload in (
+            {},
+            {"axis": [{"uuid": axis_uuid}]},
+            {"axis": [{"uuid": axis_uuid, "value": 101}]},
+            {
+                "axis": [
+                    {"uuid": axis_uuid, "value": 1},
+                    {"uuid": axis_uuid, "value": 2},
+                ]
+            },
+            {"conditioners": [{"uuid": "not-a-uuid", "answer": "Yes"}]},
+        ):
+            with self.subTest(payload=payload):
+                response = self._post(payload)
+                self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertFalse(UserAxisAnswer.objects.exists())
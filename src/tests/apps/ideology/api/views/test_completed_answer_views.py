@@ -1,4 +1,6 @@
 from core.api.api_test_helpers import APITestBase, APITestBaseNeedAuthorized
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
 from django.urls import reverse
 from ideology.factories import (
     CompletedAnswerFactory,
@@ -131,3 +133,50 @@ class CopyCompletedAnswerViewTestCase(APITestBaseNeedAuthorized):
             user=self.user, conditioner=self.conditioner
         )
         self.assertEqual(cond_ans.answer, "Yes")
+        self.assertEqual(
+            response.data,
+            {
+                "axis": {"inserted": 1, "updated": 0, "skipped": 0},
+                "conditioners": {"inserted": 1, "updated": 0, "skipped": 0},
+            },
+        )
+
+    def test_copy_reports_updated_and_skipped_counts(self):
+        UserAxisAnswerFactory(user=self.user, axis=self.axis, value=-10)
+        self.completed_answer.answers["axis"] += [
+            {"uuid": IdeologyAxisFactory.build().uuid.hex, "value": 10},
+            {"value": 20},
+            {"uuid": self.axis.uuid.hex, "value": 75},
+        ]
+        self.completed_answer.save()
+
+        response = self.client.post(self.url)
+
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        self.assertEqual(
+            response.data["axis"], {"inserted": 0, "updated": 1, "skipped": 3}
+        )
+        self.assertEqual(
+            UserAxisAnswer.objects.get(user=self.user, axis=self.axis).value, 75
+        )
+
+    def test_copy_query_count_does_not_grow_with_answers(self):
+        def count_queries():
+            with CaptureQueriesContext(connection) as context:
+                self.client.post(self.url)
+            return len(context.captured_queries)
+
+        # The first copy also builds the user's answer vector.
+        self.client.post(self.url)
+        baseline = count_queries()
+        self.completed_answer.answers["axis"] += [
+            {"uuid": IdeologyAxisFactory().uuid.hex, "value": value}
+            for value in range(10)
+        ]
+        self.completed_answer.answers["conditioners"] += [
+            {"uuid": IdeologyConditionerFactory().uuid.hex, "value": "Yes"}
+            for _ in range(5)
+        ]
+        self.completed_answer.save()
+
+        self.assertEqual(count_queries(), baseline)
@@ -1,4 +1,6 @@
 from core.api.api_test_helpers import APITestBase
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
 from django.urls import reverse
 from ideology.api.views import ConditionerListAggregatedByComplexityView
 from ideology.factories import (
@@ -79,3 +81,36 @@ class IdeologyConditionerViewTestCase(APITestBase):
         view.swagger_fake_view = True
         view.kwargs = {}
         view.get_queryset()
+
+    def test_nested_rules_are_serialized_from_the_prefetched_map(self):
+        response = self.client.get(self.url)
+
+        results = {item["uuid"]: item for item in response.data["results"]}
+        rule = results[self.conditioner_1.uuid.hex]["condition_rules"][0]
+        self.assertEqual(rule["name"], "C1 depends on C2")
+        self.assertEqual(rule["conditioner"]["uuid"], self.conditioner_2.uuid.hex)
+        self.assertEqual(
+            rule["conditioner"]["condition_rules"][0]["conditioner"]["uuid"],
+            self.conditioner_3.uuid.hex,
+        )
+        self.assertEqual(results[self.conditioner_3.uuid.hex]["condition_rules"], [])
+
+    def test_query_count_does_not_grow_with_the_dependency_chain(self):
+        def count_queries():
+            with CaptureQueriesContext(connection) as context:
+                response = self.client.get(self.url)
+            self.assertEqual(response.status_code, status.HTTP_200_OK)
+            return len(context.captured_queries)
+
+        baseline = count_queries()
+        previous = self.conditioner_3
+        for index in range(4):
+            conditioner = IdeologyConditionerFactory(name=f"Chain {index}")
+            IdeologyConditionerConditionerFactory(
+                target_conditioner=previous,
+                conditioner=conditioner,
+                name=f"Chain rule {index}",
+            )
+            previous = conditioner
+
+        self.assertEqual(count_queries(), baseline)
@@ -60,3 +60,102 @@ class IdeologyListViewTestCase(APITestBase):
         response = self.client.get(self.url, {"search": "Target"})
         self.assertEqual(response.status_code, status.HTTP_200_OK)
         self.assertEqual(len(response.data["results"]), 1)
+
+    def test_search_tolerates_typos_in_names(self):
+        response = self.client.get(self.url, {"search": "Targt"})  # codespell:ignore
+        self.assertEqual(
+            [ideology["name"] for ideology in response.data["results"]],
+            ["Target Ideology"],
+        )
+
+    def test_search_results_are_ordered_by_relevance(self):
+        self.target_ideology.description_neutral_es = "Una doctrina anarquista."
+        self.target_ideology.save()
+        self.other_ideology.name_es = "Anarquismo"
+        self.other_ideology.save()
+
+        response = self.client.get(
+            self.url, {"search": "anarquismo"}, HTTP_ACCEPT_LANGUAGE="es"
+        )
+        self.assertEqual(
+            [ideology["name"] for ideology in response.data["results"]],
+            ["Anarquismo", "Target Ideology"],
+        )
+
+    def test_search_uses_the_request_language(self):
+        self.target_ideology.description_supporter_en = "Workers running factories."
+        self.target_ideology.save()
+
+        english = self.client.get(
+            self.url, {"search": "factory"}, HTTP_ACCEPT_LANGUAGE="en"
+        )
+        spanish = self.client.get(
+            self.url, {"search": "factory"}, HTTP_ACCEPT_LANGUAGE="es"
+        )
+
+        self.assertEqual(len(english.data["results"]), 1)
+        self.assertEqual(len(spanish.data["results"]), 0)
+
+    def test_filter_by_country_returns_each_ideology_once(self):
+        IdeologyAssociationFactory(
+            ideology=self.target_ideology, country=self.country, religion=None
+        )
+
+        response = self.client.get(self.url, {"country": self.country.pk})
+        self.assertEqual(
+            [ideology["name"] for ideology in response.data["results"]],
+            ["Target Ideology"],
+        )
+
+    def test_ideologies_below_the_definition_threshold_are_hidden(self):
+        self.target_ideology.axis_definitions.first().delete()
+
+        response = self.client.get(self.url)
+        self.assertEqual(
+            [ideology["name"] for ideology in response.data["results"]],
+            ["Other Ideology"],
+        )
+
+    def test_list_is_cursor_paginated_by_name(self):
+        response = self.client.get(self.url, {"limit": 1})
+        self.assertNotIn("count", response.data)
+        self.assertEqual(response.data["results"][0]["name"], "Other Ideology")
+
+        response = self.client.get(response.data["next"])
+        self.assertEqual(response.data["results"][0]["name"], "Target Ideology")
+        self.assertIsNone(response.data["next"])
+
+    def test_cursor_pages_over_missing_translations(self):
+        untranslated = IdeologyFactory(
+            name_es="Mid Ideology",
+            name_en=None,
+            add_associations__total=0,
+            add_tags__total=0,
+        )
+        for _ in range(15):
+            IdeologyAxisDefinitionFactory(ideology=untranslated)
+
+        names = []
+        response = self.client.get(self.url, {"limit": 1}, HTTP_ACCEPT_LANGUAGE="en")
+        while True:
+            names.extend(ideology["name"] for ideology in response.data["results"])
+            if not response.data["next"]:
+                break
+            response = self.client.get(response.data["next"], HTTP_ACCEPT_LANGUAGE="en")
+
+        self.assertEqual(names, ["Mid Ideology", "Other Ideology", "Target Ideology"])
+
+    def test_tag_changes_refresh_the_cached_anonymous_list(self):
+        self.client.credentials()
+        other_tag = TagFactory()
+
+        response = self.client.get(self.url, {"tag": other_tag.uuid})
+        self.assertEqual(len(response.json()["results"]), 0)
+
+        self.other_ideology.tags.add(other_tag)
+
+        response = self.client.get(self.url, {"tag": other_tag.uuid})
+        self.assertEqual(
+            [ideology["name"] for ideology in response.json()["results"]],
+            ["Other Ideology"],
+        )
@@ -0,0 +1,130 @@
+from core.api.api_test_helpers import APITestBase
+from core.models import CacheVersion
+from django.urls import reverse
+from ideology.factories import (
+    IdeologyAbstractionComplexityFactory,
+    IdeologyAxisConditionerFactory,
+    IdeologyAxisFactory,
+    IdeologyConditionerConditionerFactory,
+    IdeologyConditionerFactory,
+    IdeologySectionFactory,
+)
+from ideology.services.structure_bundle_cache import StructureBundleCache
+from rest_framework import status
+
+
+class StructureBundleViewTestCase(APITestBase):
+    def setUp(self):
+        super().setUp()
+        self.complexity = IdeologyAbstractionComplexityFactory()
+        self.section = IdeologySectionFactory(abstraction_complexity=self.complexity)
+        self.axis = IdeologyAxisFactory(section=self.section)
+        self.conditioner = IdeologyConditionerFactory(name_en="Parent", name_es="Padre")
+        IdeologyAxisConditionerFactory(axis=self.axis, conditioner=self.conditioner)
+        self.dependency = IdeologyConditionerFactory()
+        IdeologyConditionerConditionerFactory(
+            target_conditioner=self.conditioner, conditioner=self.dependency
+        )
+        IdeologyConditionerFactory()
+        self.url = reverse(
+            "ideology:structure-bundle",
+            kwargs={"complexity_uuid": self.complexity.uuid.hex},
+        )
+
+    def test_returns_the_whole_tree_with_an_etag(self):
+        response = self.client.get(self.url)
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertTrue(response["ETag"].startswith('"'))
+        self.assertIn("Accept-Language", response["Vary"])
+        data = response.json()
+        self.assertEqual(data["complexity"]["uuid"], self.complexity.uuid.hex)
+        self.assertEqual(
+            [section["uuid"] for section in data["sections"]], [self.section.uuid.hex]
+        )
+        axis = next(
+            axis
+            for axis in data["sections"][0]["axes"]
+            if axis["uuid"] == self.axis.uuid.hex
+        )
+        self.assertEqual(
+            axis["condition_rules"][0]["conditioner"]["uuid"],
+            self.conditioner.uuid.hex,
+        )
+        self.assertEqual(
+            {conditioner["uuid"] for conditioner in data["conditioners"]},
+            {self.conditioner.uuid.hex, self.dependency.uuid.hex},
+        )
+
+    def test_matching_if_none_match_returns_304_from_cache(self):
+        etag = self.client.get(self.url)["ETag"]
+
+        # Authenticating the user, resolving the complexity and reading the
+        # bundle version.
+        with self.assertNumQueries(3):
+            response = self.client.get(self.url, HTTP_IF_NONE_MATCH=etag)
+
+        self.assertEqual(response.status_code, status.HTTP_304_NOT_MODIFIED)
+        self.assertEqual(response["ETag"], etag)
+        self.assertEqual(response.content, b"")
+
+        stale = self.client.get(self.url, HTTP_IF_NONE_MATCH='"stale"')
+        self.assertEqual(stale.status_code, status.HTTP_200_OK)
+
+    def test_structure_changes_invalidate_the_bundle(self):
+        etag = self.client.get(self.url)["ETag"]
+
+        self.dependency.name = "Renamed dependency"
+        self.dependency.save()
+
+        response = self.client.get(self.url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertNotEqual(response["ETag"], etag)
+        self.assertIn(b"Renamed dependency", response.content)
+
+    def test_invalidation_is_shared_through_the_database(self):
+        etag = self.client.get(self.url)["ETag"]
+        version = StructureBundleCache.get_version()
+
+        IdeologyConditionerFactory()
+
+        self.assertNotEqual(StructureBundleCache.get_version(), version)
+        self.assertTrue(
+            CacheVersion.objects.filter(name=StructureBundleCache.version_name).exists()
+        )
+        self.assertEqual(self.client.get(self.url)["ETag"], etag)
+
+    def test_bundles_are_cached_per_language(self):
+        spanish = self.client.get(self.url, HTTP_ACCEPT_LANGUAGE="es")
+        english = self.client.get(self.url, HTTP_ACCEPT_LANGUAGE="en")
+
+        self.assertNotEqual(spanish["ETag"], english["ETag"])
+        self.assertIn(b"Padre", spanish.content)
+        self.assertIn(b"Parent", english.content)
+
+    def test_hidden_or_unknown_complexities_return_404(self):
+        hidden = IdeologyAbstractionComplexityFactory(visible=False)
+        self.client.credentials()
+
+        for complexity_uuid in (hidden.uuid.hex, "not-a-uuid"):
+            with self.subTest(complexity_uuid=complexity_uuid):
+                response = self.client.get(
+                    reverse(
+                        "ideology:structure-bundle",
+                        kwargs={"complexity_uuid": complexity_uuid},
+                    )
+                )
+                self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+
+    def test_staff_can_fetch_hidden_complexities(self):
+        hidden = IdeologyAbstractionComplexityFactory(visible=False)
+        self.user.is_staff = True
+        self.user.save()
+
+        response = self.client.get(
+            reverse(
+                "ideology:structure-bundle", kwargs={"complexity_uuid": hidden.uuid.hex}
+            )
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
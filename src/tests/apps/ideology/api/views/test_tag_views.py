@@ -21,3 +21,48 @@ class TagListViewTestCase(APITestBase):
         self.assertEqual(response.status_code, status.HTTP_200_OK)
         self.assertEqual(len(response.data["results"]), 1)
         self.assertEqual(response.data["results"][0]["name"], "UniqueName")
+
+    def test_anonymous_lists_are_served_from_cache(self):
+        TagFactory(name_es="Cached Tag", name_en="Cached Tag")
+        self.client.credentials()
+
+        first = self.client.get(self.url)
+        # Only the catalog version is read.
+        with self.assertNumQueries(1):
+            second = self.client.get(self.url)
+
+        self.assertEqual(second.status_code, status.HTTP_200_OK)
+        self.assertEqual(first.content, second.content)
+        self.assertEqual(second.json()["results"][0]["name"], "Cached Tag")
+        self.assertIn("Accept-Language", second["Vary"])
+
+    def test_saving_a_tag_refreshes_the_cached_list(self):
+        tag = TagFactory(name_es="Before", name_en="Before")
+        self.client.credentials()
+        self.client.get(self.url)
+
+        tag.name_es = tag.name_en = "After"
+        tag.save()
+
+        response = self.client.get(self.url)
+        self.assertEqual(response.json()["results"][0]["name"], "After")
+
+    def test_unread_query_parameters_share_the_cached_list(self):
+        TagFactory(name_es="Shared", name_en="Shared")
+        self.client.credentials()
+
+        first = self.client.get(self.url, {"utm_source": "mail"})
+        with self.assertNumQueries(1):
+            second = self.client.get(self.url, {"utm_source": "ads"})
+
+        self.assertEqual(first.content, second.content)
+
+    def test_anonymous_lists_are_cached_per_language(self):
+        TagFactory(name_es="Etiqueta", name_en="Label")
+        self.client.credentials()
+
+        spanish = self.client.get(self.url, HTTP_ACCEPT_LANGUAGE="es")
+        english = self.client.get(self.url, HTTP_ACCEPT_LANGUAGE="en")
+
+        self.assertEqual(spanish.json()["results"][0]["name"], "Etiqueta")
+        self.assertEqual(english.json()["results"][0]["name"], "Label")
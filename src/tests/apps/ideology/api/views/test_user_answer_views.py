@@ -8,7 +8,7 @@ from ideology.factories import (
     IdeologySectionFactory,
     UserAxisAnswerFactory,
 )
-from ideology.models import UserAxisAnswer, UserConditionerAnswer
+from ideology.models import UserAnswerVector, UserAxisAnswer, UserConditionerAnswer
 from rest_framework import status
 
 
@@ -49,6 +49,15 @@ class UserAxisAnswerViewTestCase(APITestBaseNeedAuthorized):
         self.assertEqual(response.status_code, status.HTTP_204_NO_CONTENT)
         self.assertFalse(UserAxisAnswer.objects.exists())
 
+    def test_upsert_and_delete_keep_answer_vector_in_sync(self):
+        self.client.post(self.url, data={"value": 50}, format="json")
+        vector = UserAnswerVector.objects.get(pk=self.user.pk)
+        self.assertEqual(vector.axes[self.axis.uuid.hex][0], 50)
+
+        self.client.delete(self.delete_url)
+        vector.refresh_from_db()
+        self.assertNotIn(self.axis.uuid.hex, vector.axes)
+
     def test_delete_not_found(self):
         response = self.client.delete(self.delete_url)
         self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
@@ -107,6 +116,15 @@ class UserConditionerAnswerViewTestCase(APITestBaseNeedAuthorized):
         self.assertEqual(response.status_code, status.HTTP_204_NO_CONTENT)
         self.assertFalse(UserConditionerAnswer.objects.exists())
 
+    def test_upsert_and_delete_keep_answer_vector_in_sync(self):
+        self.client.post(self.url, data={"answer": "Option A"}, format="json")
+        vector = UserAnswerVector.objects.get(pk=self.user.pk)
+        self.assertEqual(vector.conditioners, {self.conditioner.uuid.hex: "Option A"})
+
+        self.client.delete(self.delete_url)
+        vector.refresh_from_db()
+        self.assertEqual(vector.conditioners, {})
+
     def test_delete_not_found(self):
         response = self.client.delete(self.delete_url)
         self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
@@ -0,0 +1,47 @@
+from io import StringIO
+
+from django.core.management import call_command
+from django.test import TestCase
+from ideology.factories import CompletedAnswerFactory, IdeologyAxisFactory
+from ideology.models import CompletedAnswer, CompletedAnswerPayload
+
+
+class CompactCompletedAnswersCommandTestCase(TestCase):
+    def setUp(self):
+        self.answers = {
+            "axis": [
+                {
+                    "uuid": IdeologyAxisFactory().uuid.hex,
+                    "value": 10,
+                    "margin_left": 0,
+                    "margin_right": 0,
+                }
+            ],
+            "conditioners": [],
+        }
+
+    def test_compacts_legacy_rows_and_purges_orphans(self):
+        legacy = [CompletedAnswerFactory(answers={}) for _ in range(3)]
+        CompletedAnswer.objects.filter(pk__in=[item.pk for item in legacy]).update(
+            raw_answers=self.answers
+        )
+        unpackable = CompletedAnswerFactory(answers=[{"level": "Basic"}])
+        orphan = CompletedAnswerFactory(answers={**self.answers, "axis": []})
+        orphan.delete()
+        output = StringIO()
+
+        call_command(
+            "compact_completed_answers", batch_size=2, purge_orphans=True, stdout=output
+        )
+
+        for completed_answer in CompletedAnswer.objects.filter(
+            pk__in=[item.pk for item in legacy]
+        ):
+            self.assertIsNotNone(completed_answer.payload_id)
+            self.assertEqual(completed_answer.raw_answers, {})
+            self.assertEqual(completed_answer.answers, self.answers)
+        unpackable.refresh_from_db()
+        self.assertIsNone(unpackable.payload_id)
+        self.assertEqual(CompletedAnswerPayload.objects.count(), 1)
+        self.assertIn("Compacted 3 snapshots, 1 kept as plain JSON.", output.getvalue())
+        self.assertIn("Purged 1 orphan payloads.", output.getvalue())
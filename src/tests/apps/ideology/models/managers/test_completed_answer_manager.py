@@ -1,3 +1,5 @@
+import hashlib
+import json
 import uuid
 
 from core.factories import UserFactory
@@ -76,6 +78,89 @@ class CompletedAnswerManagerTestCase(TestCase):
             self.assertNotEqual(first_snapshot.answer_hash, third_snapshot.answer_hash)
             self.assertEqual(CompletedAnswer.objects.count(), 2)
 
+    def test_given_unchanged_user_answers_when_generate_snapshot_then_reuses_snapshot_without_rebuilding_it(
+        self,
+    ):
+        UserAxisAnswerFactory(user=self.user, value=50)
+        UserConditionerAnswerFactory(user=self.user, answer="Yes")
+        first_snapshot = CompletedAnswer.objects.generate_snapshot(user=self.user)
+
+        with self.assertNumQueries(2):
+            second_snapshot = CompletedAnswer.objects.generate_snapshot(user=self.user)
+
+        self.assertEqual(first_snapshot.pk, second_snapshot.pk)
+
+    def test_given_answer_reverted_when_generate_snapshot_then_returns_original_snapshot(
+        self,
+    ):
+        answer = UserAxisAnswerFactory(user=self.user, value=50)
+        first_snapshot = CompletedAnswer.objects.generate_snapshot(user=self.user)
+
+        answer.value = 20
+        answer.save()
+        changed_snapshot = CompletedAnswer.objects.generate_snapshot(user=self.user)
+        answer.value = 50
+        answer.save()
+        reverted_snapshot = CompletedAnswer.objects.generate_snapshot(user=self.user)
+
+        self.assertNotEqual(first_snapshot.pk, changed_snapshot.pk)
+        self.assertEqual(changed_snapshot.answers["axis"][0]["value"], 20)
+        self.assertEqual(first_snapshot.pk, reverted_snapshot.pk)
+
+    def test_given_same_answers_when_user_and_anonymous_snapshot_then_hashes_match(
+        self,
+    ):
+        axis = IdeologyAxisFactory()
+        conditioner = IdeologyConditionerFactory()
+        UserAxisAnswerFactory(
+            user=self.user, axis=axis, value=50, margin_left=5, margin_right=0
+        )
+        UserConditionerAnswerFactory(
+            user=self.user, conditioner=conditioner, answer="Yes"
+        )
+
+        user_snapshot = CompletedAnswer.objects.generate_snapshot(user=self.user)
+        anonymous_snapshot = CompletedAnswer.objects.generate_snapshot(
+            input_data={
+                "conditioners": [{"uuid": conditioner.uuid, "value": "Yes"}],
+                "axis": [
+                    {
+                        "uuid": axis.uuid,
+                        "value": 50,
+                        "margin_left": 5,
+                        "margin_right": 0,
+                    }
+                ],
+            }
+        )
+
+        self.assertEqual(user_snapshot.answers, anonymous_snapshot.answers)
+        self.assertEqual(user_snapshot.answer_hash, anonymous_snapshot.answer_hash)
+        self.assertEqual(
+            user_snapshot.answer_hash,
+            CompletedAnswer.objects.calculate_hash(user_snapshot.answers),
+        )
+
+    def test_given_anonymous_input_when_generate_snapshot_then_hash_is_sha256_of_canonical_json(
+        self,
+    ):
+        snapshot = CompletedAnswer.objects.generate_snapshot(
+            input_data={
+                "axis": [
+                    {"uuid": uuid.UUID("b" * 32), "value": 20},
+                    {"uuid": uuid.UUID("a" * 32), "value": 10},
+                ],
+                "conditioners": [],
+            }
+        )
+
+        self.assertEqual(
+            snapshot.answer_hash,
+            hashlib.sha256(
+                json.dumps(snapshot.answers, sort_keys=True).encode("utf-8")
+            ).hexdigest(),
+        )
+
     def test_given_anonymous_user_with_input_data_when_generate_snapshot_then_normalizes_and_saves_data(
         self,
     ):
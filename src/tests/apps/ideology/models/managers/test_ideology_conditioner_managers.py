@@ -106,3 +106,30 @@ class IdeologyConditionerManagerTestCase(TestCase):
             self.ideology_abstraction_complexity.uuid
         )
         self.assertEqual(queryset.count(), 2)
+
+    def test_get_by_complexity_resolves_the_closure_in_one_query(self):
+        ideology_section = IdeologySectionFactory(
+            abstraction_complexity=self.ideology_abstraction_complexity
+        )
+        previous = IdeologyConditionerFactory()
+        IdeologySectionConditionerFactory(
+            section=ideology_section, conditioner=previous
+        )
+        expected = [previous]
+        for _ in range(5):
+            conditioner = IdeologyConditionerFactory()
+            IdeologyConditionerConditionerFactory(
+                target_conditioner=previous, conditioner=conditioner
+            )
+            expected.append(conditioner)
+            previous = conditioner
+        IdeologyConditionerFactory()
+
+        with self.assertNumQueries(1):
+            conditioners = list(
+                IdeologyConditioner.objects.get_by_complexity(
+                    self.ideology_abstraction_complexity.uuid
+                )
+            )
+
+        self.assertEqual(conditioners, expected)
@@ -8,7 +8,7 @@ from ideology.factories import (
     IdeologyConditionerFactory,
     UserAxisAnswerFactory,
 )
-from ideology.models import UserAxisAnswer, UserConditionerAnswer
+from ideology.models import UserAnswerVector, UserAxisAnswer, UserConditionerAnswer
 
 
 class UserAnswersManagerTestCase(TestCase):
@@ -78,3 +78,91 @@ class UserAnswersManagerTestCase(TestCase):
         entry = result[str(axis_1.uuid.hex)]
         self.assertEqual(entry.value, 10)
         self.assertEqual(entry.margin_left, 5)
+
+    def test_bulk_upsert_axis_answers(self):
+        other_axis = IdeologyAxisFactory()
+        unanswered_axis = IdeologyAxisFactory()
+        UserAxisAnswerFactory(user=self.user, axis=self.axis, value=10)
+        UserAnswerVector.objects.rebuild(self.user)
+
+        with self.assertNumQueries(9):
+            counts = UserAxisAnswer.objects.bulk_upsert(
+                self.user,
+                {
+                    self.axis.uuid.hex: {"value": 40, "margin_left": 3},
+                    other_axis.uuid.hex: {"value": 99, "is_indifferent": True},
+                    uuid.uuid4().hex: {"value": 1},
+                    unanswered_axis.uuid.hex: {"value": None},
+                },
+            )
+
+        self.assertEqual(counts, {"inserted": 1, "updated": 1, "skipped": 2})
+        updated = UserAxisAnswer.objects.get(user=self.user, axis=self.axis)
+        self.assertEqual((updated.value, updated.margin_left), (40, 3))
+        indifferent = UserAxisAnswer.objects.get(user=self.user, axis=other_axis)
+        self.assertTrue(indifferent.is_indifferent)
+        self.assertIsNone(indifferent.value)
+        self.assertEqual(
+            set(UserAnswerVector.objects.get(pk=self.user.pk).axes),
+            {self.axis.uuid.hex, other_axis.uuid.hex},
+        )
+
+    def test_bulk_upsert_conditioner_answers(self):
+        UserConditionerAnswer.objects.create(
+            user=self.user, conditioner=self.conditioner, answer="No"
+        )
+        new_conditioner = IdeologyConditionerFactory()
+
+        counts = UserConditionerAnswer.objects.bulk_upsert(
+            self.user,
+            {
+                self.conditioner.uuid.hex: "Yes",
+                new_conditioner.uuid.hex: "Maybe",
+                uuid.uuid4().hex: "Ghost",
+            },
+        )
+
+        self.assertEqual(counts, {"inserted": 1, "updated": 1, "skipped": 1})
+        self.assertEqual(
+            dict(
+                UserConditionerAnswer.objects.filter(user=self.user).values_list(
+                    "conditioner__uuid", "answer"
+                )
+            ),
+            {self.conditioner.uuid: "Yes", new_conditioner.uuid: "Maybe"},
+        )
+
+    def test_bulk_upsert_skips_answers_failing_field_validation(self):
+        other_axis = IdeologyAxisFactory()
+        UserAxisAnswerFactory(user=self.user, axis=self.axis, value=10)
+
+        counts = UserAxisAnswer.objects.bulk_upsert(
+            self.user,
+            {
+                self.axis.uuid.hex: {"value": 500},
+                other_axis.uuid.hex: {"value": 20, "margin_right": 201},
+            },
+        )
+        conditioner_counts = UserConditionerAnswer.objects.bulk_upsert(
+            self.user, {self.conditioner.uuid.hex: "x" * 256}
+        )
+
+        self.assertEqual(counts, {"inserted": 0, "updated": 0, "skipped": 2})
+        self.assertEqual(
+            conditioner_counts, {"inserted": 0, "updated": 0, "skipped": 1}
+        )
+        self.assertEqual(
+            list(
+                UserAxisAnswer.objects.filter(user=self.user).values_list(
+                    "value", flat=True
+                )
+            ),
+            [10],
+        )
+        self.assertFalse(UserConditionerAnswer.objects.filter(user=self.user).exists())
+
+    def test_bulk_upsert_with_nothing_valid(self):
+        self.assertEqual(
+            UserAxisAnswer.objects.bulk_upsert(self.user, {uuid.uuid4().hex: {}}),
+            {"inserted": 0, "updated": 0, "skipped": 1},
+        )
@@ -48,3 +48,25 @@ class CompletedAnswerBranchCoverageTestCase(TestCase):
         self.assertNotIn("bad-uuid", mapped)
         self.assertIn(cond.uuid.hex, mapped)
         self.assertEqual(mapped[cond.uuid.hex].value, "B")
+
+    def test_map_axes_treats_null_margins_as_zero(self):
+        axis = IdeologyAxisFactory()
+
+        completed_answer = CompletedAnswerFactory(
+            answers={
+                "axis": [
+                    {
+                        "uuid": axis.uuid.hex,
+                        "value": None,
+                        "is_indifferent": True,
+                        "margin_left": None,
+                        "margin_right": None,
+                    }
+                ]
+            }
+        )
+
+        mapped = completed_answer.get_mapped_for_calculation()[axis.uuid.hex]
+
+        self.assertTrue(mapped.is_indifferent)
+        self.assertEqual((mapped.margin_left, mapped.margin_right), (0, 0))
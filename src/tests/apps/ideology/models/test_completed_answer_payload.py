@@ -0,0 +1,131 @@
+from unittest.mock import patch
+
+from core.factories import UserFactory
+from django.test import TestCase
+from ideology.factories import (
+    CompletedAnswerFactory,
+    IdeologyAxisFactory,
+    IdeologyConditionerFactory,
+)
+from ideology.models import AnswerKey, CompletedAnswer, CompletedAnswerPayload
+
+
+class CompletedAnswerPayloadTestCase(TestCase):
+    def setUp(self):
+        self.axes = [IdeologyAxisFactory() for _ in range(2)]
+        self.conditioner = IdeologyConditionerFactory()
+        self.answers = {
+            "conditioners": [{"uuid": self.conditioner.uuid.hex, "value": "Yes"}],
+            "axis": [
+                {
+                    "uuid": self.axes[0].uuid.hex,
+                    "value": 40,
+                    "margin_left": 5,
+                    "margin_right": 0,
+                },
+                {
+                    "uuid": self.axes[1].uuid.hex,
+                    "value": None,
+                    "margin_left": None,
+                    "margin_right": None,
+                },
+            ],
+        }
+
+    def test_snapshot_is_packed_and_decoded_unchanged(self):
+        completed_answer = CompletedAnswerFactory(
+            answers=self.answers, answer_hash="a" * 64
+        )
+
+        stored = CompletedAnswer.objects.get(pk=completed_answer.pk)
+
+        self.assertIsNotNone(stored.payload_id)
+        self.assertEqual(stored.raw_answers, {})
+        self.assertEqual(stored.answers, self.answers)
+        self.assertEqual(stored.payload.axes[1:4], [40, 5, 0])
+        self.assertEqual(AnswerKey.objects.count(), 3)
+
+    def test_payloads_are_shared_across_users(self):
+        first = CompletedAnswerFactory(answers=self.answers, answer_hash="a" * 64)
+        second = CompletedAnswerFactory(
+            completed_by=UserFactory(), answers=self.answers, answer_hash="a" * 64
+        )
+        anonymous = CompletedAnswer.objects.generate_snapshot(
+            input_data={
+                "axis": [
+                    {**item, "uuid": self.axes[0].uuid}
+                    for item in self.answers["axis"][:1]
+                ],
+                "conditioners": [],
+            }
+        )
+
+        self.assertEqual(first.payload_id, second.payload_id)
+        self.assertNotEqual(first.payload_id, anonymous.payload_id)
+        self.assertEqual(CompletedAnswerPayload.objects.count(), 2)
+
+    def test_payloads_are_keyed_by_their_content(self):
+        changed = {
+            **self.answers,
+            "conditioners": [{"uuid": self.conditioner.uuid.hex, "value": "No"}],
+        }
+        first = CompletedAnswerFactory(answers=self.answers, answer_hash="a" * 64)
+        second = CompletedAnswerFactory(answers=changed, answer_hash="a" * 64)
+
+        self.assertNotEqual(first.payload_id, second.payload_id)
+        self.assertEqual(
+            CompletedAnswer.objects.get(pk=second.pk).answers["conditioners"],
+            changed["conditioners"],
+        )
+        self.assertNotEqual(first.payload.answer_hash, "a" * 64)
+
+    def test_unpackable_answers_are_kept_as_json(self):
+        unknown_uuid = {
+            **self.answers,
+            "axis": [{**self.answers["axis"][0], "uuid": "f" * 32}],
+        }
+        for answers in (
+            [{"level": "Basic"}],
+            {**self.answers, "extra": []},
+            {**self.answers, "axis": [{"uuid": self.axes[0].uuid.hex, "value": 1}]},
+            {**self.answers, "axis": [{**self.answers["axis"][0], "value": True}]},
+            unknown_uuid,
+        ):
+            with self.subTest(answers=answers):
+                completed_answer = CompletedAnswerFactory(answers=answers)
+                stored = CompletedAnswer.objects.get(pk=completed_answer.pk)
+
+                self.assertIsNone(stored.payload_id)
+                self.assertEqual(stored.answers, answers)
+
+        self.assertFalse(AnswerKey.objects.filter(uuid="f" * 32).exists())
+
+    def test_changed_answers_are_repacked_on_save(self):
+        completed_answer = CompletedAnswerFactory(answers=self.answers)
+        original_payload = completed_answer.payload_id
+
+        completed_answer.answers["axis"].pop()
+        completed_answer.save()
+        completed_answer.refresh_from_db()
+
+        self.assertNotEqual(completed_answer.payload_id, original_payload)
+        self.assertEqual(len(completed_answer.answers["axis"]), 1)
+
+    def test_read_answers_are_not_repacked_on_save(self):
+        completed_answer = CompletedAnswer.objects.get(
+            pk=CompletedAnswerFactory(answers=self.answers).pk
+        )
+        self.assertEqual(completed_answer.answers, self.answers)
+
+        with patch.object(CompletedAnswerPayload.objects, "store") as store:
+            completed_answer.save()
+
+        store.assert_not_called()
+
+    def test_decoding_reuses_known_keys(self):
+        completed_answer = CompletedAnswerFactory(answers=self.answers)
+
+        with self.assertNumQueries(1):
+            answers = CompletedAnswer.objects.get(pk=completed_answer.pk).answers
+
+        self.assertEqual(answers, self.answers)
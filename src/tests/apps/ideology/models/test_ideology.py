@@ -2,8 +2,11 @@ from django.test import TestCase
 from ideology.factories import (
     IdeologyAxisDefinitionFactory,
     IdeologyAxisFactory,
+    IdeologyConditionerDefinitionFactory,
     IdeologyFactory,
 )
+from ideology.models import Ideology
+from ideology.services.structure_index import StructureIndex
 
 
 class IdeologyModelTestCase(TestCase):
@@ -30,3 +33,52 @@ class IdeologyModelTestCase(TestCase):
         self.assertEqual(axis_data.value, 50)
         self.assertEqual(axis_data.margin_left, 0)
         self.assertEqual(axis_data.margin_right, 0)
+
+    def test_manager_get_mapped_for_calculation_matches_instance_mapping(self):
+        ideologies = [IdeologyFactory(), IdeologyFactory()]
+        for ideology in ideologies:
+            IdeologyAxisDefinitionFactory.create_batch(3, ideology=ideology)
+            IdeologyConditionerDefinitionFactory(ideology=ideology)
+        empty_ideology = IdeologyFactory()
+        StructureIndex.get()
+
+        with self.assertNumQueries(3):
+            mapped = Ideology.objects.get_mapped_for_calculation(
+                ideologies + [empty_ideology]
+            )
+
+        for ideology in ideologies:
+            self.assertEqual(mapped[ideology.pk], ideology.get_mapped_for_calculation())
+        self.assertEqual(mapped[empty_ideology.pk], {})
+        self.assertEqual(Ideology.objects.get_mapped_for_calculation([]), {})
+
+    def test_definitions_count_follows_definition_changes(self):
+        ideology = IdeologyFactory()
+        definitions = IdeologyAxisDefinitionFactory.create_batch(3, ideology=ideology)
+        ideology.refresh_from_db()
+        self.assertEqual(ideology.definitions_count, 3)
+
+        definitions[0].delete()
+        ideology.refresh_from_db()
+        self.assertEqual(ideology.definitions_count, 2)
+
+    def test_saving_a_stale_instance_keeps_the_definitions_count(self):
+        ideology = IdeologyFactory()
+        IdeologyAxisDefinitionFactory.create_batch(2, ideology=ideology)
+
+        ideology.name = "Renamed"
+        ideology.save()
+
+        ideology.refresh_from_db()
+        self.assertEqual(ideology.name, "Renamed")
+        self.assertEqual(ideology.definitions_count, 2)
+
+    def test_publishable_requires_visibility_and_enough_definitions(self):
+        publishable = IdeologyFactory()
+        hidden = IdeologyFactory(visible=False)
+        incomplete = IdeologyFactory()
+        for ideology in (publishable, hidden):
+            IdeologyAxisDefinitionFactory.create_batch(15, ideology=ideology)
+        IdeologyAxisDefinitionFactory.create_batch(14, ideology=incomplete)
+
+        self.assertEqual(list(Ideology.objects.publishable), [publishable])
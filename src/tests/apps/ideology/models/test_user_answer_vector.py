@@ -0,0 +1,165 @@
+from core.factories import UserFactory
+from django.test import TestCase
+from ideology.factories import (
+    IdeologyAxisFactory,
+    IdeologyConditionerFactory,
+    IdeologySectionConditionerFactory,
+    UserAxisAnswerFactory,
+    UserConditionerAnswerFactory,
+)
+from ideology.models import UserAnswerVector, UserAxisAnswer, UserConditionerAnswer
+from ideology.services.structure_index import StructureIndex
+
+
+class UserAnswerVectorTestCase(TestCase):
+    def setUp(self):
+        self.user = UserFactory()
+        self.axis = IdeologyAxisFactory()
+        self.conditioner = IdeologyConditionerFactory()
+        IdeologySectionConditionerFactory(
+            section=self.axis.section, conditioner=self.conditioner
+        )
+
+    def _legacy_mapping(self):
+        return {
+            **UserAxisAnswer.objects.get_mapped_for_calculation(self.user),
+            **UserConditionerAnswer.objects.get_mapped_for_calculation(self.user),
+        }
+
+    def test_first_read_rebuilds_from_answer_tables(self):
+        UserAxisAnswerFactory(
+            user=self.user, axis=self.axis, value=40, margin_left=5, margin_right=0
+        )
+        UserAxisAnswerFactory(user=self.user, is_indifferent=True, value=None)
+        UserConditionerAnswerFactory(
+            user=self.user, conditioner=self.conditioner, answer="Indifferent"
+        )
+
+        mapped = UserAnswerVector.objects.get_mapped_for_calculation(self.user)
+
+        self.assertEqual(mapped, self._legacy_mapping())
+        self.assertTrue(mapped[self.conditioner.uuid.hex].is_indifferent)
+        self.assertTrue(UserAnswerVector.objects.filter(pk=self.user.pk).exists())
+
+    def test_read_only_adds_the_structure_version_once_materialized(self):
+        UserAxisAnswerFactory(user=self.user, axis=self.axis, value=40)
+        UserAnswerVector.objects.rebuild(self.user)
+        StructureIndex.get()
+
+        with self.assertNumQueries(2):
+            UserAnswerVector.objects.get_mapped_for_calculation(self.user)
+
+    def test_upserts_update_the_vector_incrementally(self):
+        UserAnswerVector.objects.rebuild(self.user)
+
+        UserAxisAnswer.objects.upsert(self.user, self.axis.uuid, {"value": 10})
+        UserAxisAnswer.objects.upsert(
+            self.user, self.axis.uuid, {"value": 30, "margin_right": 4}
+        )
+        UserConditionerAnswer.objects.upsert(
+            self.user, self.conditioner.uuid, {"answer": "Yes"}
+        )
+
+        vector = UserAnswerVector.objects.get(pk=self.user.pk)
+        self.assertEqual(vector.axes, {self.axis.uuid.hex: [30, False, None, 4]})
+        self.assertEqual(vector.conditioners, {self.conditioner.uuid.hex: "Yes"})
+        self.assertEqual(vector.get_mapped_for_calculation(), self._legacy_mapping())
+
+    def test_apply_changes_removes_entries(self):
+        UserAxisAnswerFactory(user=self.user, axis=self.axis, value=40)
+        UserConditionerAnswerFactory(user=self.user, conditioner=self.conditioner)
+        UserAnswerVector.objects.rebuild(self.user)
+
+        vector = UserAnswerVector.objects.apply_changes(
+            self.user,
+            removed_axes=[self.axis.uuid.hex],
+            removed_conditioners=[self.conditioner.uuid.hex],
+        )
+
+        self.assertEqual(vector.axes, {})
+        self.assertEqual(vector.conditioners, {})
+
+    def test_incremental_digest_matches_a_rebuild(self):
+        other_axis = IdeologyAxisFactory()
+        UserAxisAnswer.objects.upsert(self.user, self.axis.uuid, {"value": 10})
+        UserAxisAnswer.objects.upsert(self.user, other_axis.uuid, {"value": -20})
+        UserAxisAnswer.objects.upsert(
+            self.user, self.axis.uuid, {"value": 30, "margin_left": 2}
+        )
+        UserConditionerAnswer.objects.upsert(
+            self.user, self.conditioner.uuid, {"answer": "Yes"}
+        )
+        UserAxisAnswer.objects.get(user=self.user, axis=other_axis).delete()
+
+        incremental = UserAnswerVector.objects.get_vector(self.user).digest
+
+        self.assertEqual(
+            incremental, UserAnswerVector.objects.rebuild(self.user).digest
+        )
+
+    def test_direct_saves_and_deletes_keep_the_vector_in_sync(self):
+        answer = UserAxisAnswerFactory(user=self.user, axis=self.axis, value=40)
+        conditioner_answer = UserConditionerAnswerFactory(
+            user=self.user, conditioner=self.conditioner, answer="Yes"
+        )
+        answer.value = 50
+        answer.save()
+
+        vector = UserAnswerVector.objects.get(pk=self.user.pk)
+        self.assertEqual(vector.axes[self.axis.uuid.hex][0], 50)
+        self.assertEqual(vector.conditioners, {self.conditioner.uuid.hex: "Yes"})
+
+        conditioner_answer.delete()
+
+        vector.refresh_from_db()
+        self.assertEqual(vector.conditioners, {})
+        self.assertEqual(
+            vector.digest, UserAnswerVector.objects.rebuild(self.user).digest
+        )
+
+    def test_missing_digest_is_rebuilt(self):
+        UserAxisAnswerFactory(user=self.user, axis=self.axis, value=40)
+        UserAnswerVector.objects.filter(pk=self.user.pk).update(digest="")
+
+        digest = UserAnswerVector.objects.get_vector(self.user).digest
+
+        self.assertEqual(len(digest), 64)
+        self.assertEqual(UserAnswerVector.objects.get(pk=self.user.pk).digest, digest)
+
+    def test_cascade_deletes_drop_vectors_holding_the_answers(self):
+        other_user = UserFactory()
+        UserAxisAnswerFactory(user=self.user, axis=self.axis, value=40)
+        UserConditionerAnswerFactory(user=other_user, conditioner=self.conditioner)
+        unrelated = UserFactory()
+        UserAxisAnswerFactory(user=unrelated, value=10)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            self.axis.delete()
+            self.conditioner.delete()
+
+        self.assertEqual(
+            list(UserAnswerVector.objects.values_list("pk", flat=True)),
+            [unrelated.pk],
+        )
+        self.assertEqual(UserAnswerVector.objects.get_vector(self.user).axes, {})
+
+    def test_unanswered_and_unknown_axes_are_skipped(self):
+        UserAnswerVector.objects.create(
+            user=self.user,
+            axes={
+                self.axis.uuid.hex: [None, False, 0, 0],
+                "0" * 32: [10, False, 0, 0],
+            },
+        )
+
+        self.assertEqual(
+            UserAnswerVector.objects.get_mapped_for_calculation(self.user), {}
+        )
+
+    def test_invalidate_drops_the_vector(self):
+        UserAnswerVector.objects.rebuild(self.user)
+        UserAnswerVector.objects.invalidate([self.user.pk, None])
+        self.assertFalse(UserAnswerVector.objects.exists())
+        self.assertIn(
+            self.user.username, str(UserAnswerVector.objects.rebuild(self.user))
+        )
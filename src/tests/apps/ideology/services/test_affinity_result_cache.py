@@ -0,0 +1,42 @@
+from unittest.mock import Mock
+
+from django.core.cache import cache, caches
+from django.test import TestCase
+from ideology.services.affinity_result_cache import AffinityResultCache
+from ideology.services.ideology_vector_cache import IdeologyVectorCache
+
+
+class AffinityResultCacheTestCase(TestCase):
+    def setUp(self):
+        cache.clear()
+        caches["affinity"].clear()
+        self.calculate = Mock(return_value={"total": 42.0, "complexities": []})
+
+    def test_result_is_memoized_per_source_and_target(self):
+        first = AffinityResultCache.get_or_calculate("hash", "target", self.calculate)
+        second = AffinityResultCache.get_or_calculate("hash", "target", self.calculate)
+        AffinityResultCache.get_or_calculate("hash", "other", self.calculate)
+
+        self.assertEqual(first, second)
+        self.assertEqual(self.calculate.call_count, 2)
+
+    def test_missing_versions_bypass_cache(self):
+        AffinityResultCache.get_or_calculate(None, "target", self.calculate)
+        AffinityResultCache.get_or_calculate("hash", None, self.calculate)
+        AffinityResultCache.get_or_calculate("", "target", self.calculate)
+
+        self.assertEqual(self.calculate.call_count, 3)
+
+    def test_structure_change_invalidates_results(self):
+        AffinityResultCache.get_or_calculate("hash", "target", self.calculate)
+        IdeologyVectorCache.invalidate_structure()
+        AffinityResultCache.get_or_calculate("hash", "target", self.calculate)
+
+        self.assertEqual(self.calculate.call_count, 2)
+
+    def test_results_live_outside_the_default_cache(self):
+        AffinityResultCache.get_or_calculate("hash", "target", self.calculate)
+        cache.clear()
+        AffinityResultCache.get_or_calculate("hash", "target", self.calculate)
+
+        self.assertEqual(self.calculate.call_count, 1)
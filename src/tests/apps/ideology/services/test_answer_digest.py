@@ -0,0 +1,45 @@
+from django.test import SimpleTestCase
+from ideology.services.answer_digest import AnswerDigest
+
+
+class AnswerDigestTestCase(SimpleTestCase):
+    def test_digest_does_not_depend_on_answer_order(self):
+        first = AnswerDigest.from_snapshot(
+            {
+                "axis": [{"uuid": "a", "value": 10}, {"uuid": "b", "value": None}],
+                "conditioners": [{"uuid": "c", "value": "Yes"}],
+            }
+        )
+        second = AnswerDigest.from_snapshot(
+            {
+                "conditioners": [{"value": "Yes", "uuid": "c"}],
+                "axis": [{"uuid": "b", "value": None}, {"value": 10, "uuid": "a"}],
+            }
+        )
+
+        self.assertEqual(first.hexdigest(), second.hexdigest())
+        self.assertEqual(len(first.hexdigest()), 64)
+
+    def test_remove_reverts_add(self):
+        digest = AnswerDigest.from_snapshot({"axis": [{"uuid": "a", "value": 10}]})
+        initial = digest.hexdigest()
+
+        digest.add("axis", {"uuid": "b", "value": 20, "margin_left": 5})
+        self.assertNotEqual(digest.hexdigest(), initial)
+
+        digest.remove("axis", {"uuid": "b", "value": 20, "margin_left": 5})
+        self.assertEqual(AnswerDigest(digest.hexdigest()).hexdigest(), initial)
+
+    def test_digest_changes_with_kind_value_and_margins(self):
+        digests = {
+            AnswerDigest.from_snapshot(answers).hexdigest()
+            for answers in (
+                {"axis": [{"uuid": "a", "value": 10, "margin_left": 0}]},
+                {"axis": [{"uuid": "a", "value": 11, "margin_left": 0}]},
+                {"axis": [{"uuid": "a", "value": 10, "margin_left": 1}]},
+                {"conditioners": [{"uuid": "a", "value": 10, "margin_left": 0}]},
+                {},
+            )
+        }
+
+        self.assertEqual(len(digests), 5)
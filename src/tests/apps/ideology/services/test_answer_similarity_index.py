@@ -0,0 +1,141 @@
+import math
+import tempfile
+from unittest.mock import patch
+
+from core.factories import UserFactory
+from django.core.cache import cache
+from django.test import TestCase, override_settings
+from ideology.factories import CompletedAnswerFactory, IdeologyAxisFactory
+from ideology.services.answer_similarity_index import AnswerSimilarityIndex
+
+
+class AnswerSimilarityIndexTestCase(TestCase):
+    def setUp(self):
+        cache.delete(AnswerSimilarityIndex.rebuild_requested_key)
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        settings_override = override_settings(SIMILARITY_INDEX_DIR=directory.name)
+        settings_override.enable()
+        self.addCleanup(settings_override.disable)
+
+        self.axes = [IdeologyAxisFactory() for _ in range(3)]
+
+    def _answer(self, values, is_public=True, user=None):
+        return CompletedAnswerFactory(
+            completed_by=user or UserFactory(is_public=is_public),
+            answers={
+                "axis": [
+                    {"uuid": axis.uuid.hex, "value": value}
+                    for axis, value in zip(self.axes, values)
+                    if value is not None
+                ]
+            },
+        )
+
+    def test_rebuild_indexes_latest_public_answer_per_user(self):
+        user = UserFactory(is_public=True)
+        self._answer([0, 0, 0], user=user)
+        latest = self._answer([10, 20, None], user=user)
+        private = self._answer([10, 20, 30], is_public=False)
+
+        index = AnswerSimilarityIndex.rebuild()
+
+        self.assertEqual(index.answer_uuids, [latest.uuid.hex])
+        self.assertNotIn(private.uuid.hex, index.answer_rows)
+        row = index.vectors[0]
+        self.assertEqual(row[index.axis_positions[self.axes[0].uuid.hex]].item(), 10.0)
+        self.assertTrue(
+            math.isnan(row[index.axis_positions[self.axes[2].uuid.hex]].item())
+        )
+
+    def test_incremental_rebuild_only_parses_new_answers(self):
+        first = self._answer([10, 10, 10])
+        index = AnswerSimilarityIndex.rebuild()
+        second = self._answer([20, 20, 20])
+
+        with self.assertNumQueries(6):
+            rebuilt = AnswerSimilarityIndex.rebuild()
+
+        self.assertNotEqual(rebuilt.build_id, index.build_id)
+        self.assertEqual(
+            sorted(rebuilt.answer_uuids), sorted([first.uuid.hex, second.uuid.hex])
+        )
+        row = rebuilt.vectors[rebuilt.answer_rows[first.uuid.hex]]
+        self.assertEqual(
+            [row[rebuilt.axis_positions[axis.uuid.hex]].item() for axis in self.axes],
+            [10.0, 10.0, 10.0],
+        )
+
+    def test_rebuild_keeps_only_the_previous_matrix(self):
+        self._answer([10, 10, 10])
+        first = AnswerSimilarityIndex.rebuild()
+        second = AnswerSimilarityIndex.rebuild()
+        third = AnswerSimilarityIndex.rebuild()
+
+        self.assertEqual(
+            {
+                path.name
+                for path in third.directory.glob(
+                    f"{AnswerSimilarityIndex.vectors_prefix}*"
+                )
+            },
+            {
+                f"{AnswerSimilarityIndex.vectors_prefix}{index.build_id}.npy"
+                for index in (second, third)
+            },
+        )
+        self.assertNotEqual(first.build_id, second.build_id)
+
+    def test_get_reuses_index_until_rebuilt(self):
+        self._answer([10, 10, 10])
+        index = AnswerSimilarityIndex.rebuild()
+
+        self.assertIs(AnswerSimilarityIndex.get(), index)
+        self.assertIsNot(AnswerSimilarityIndex.rebuild(), index)
+
+    @patch("core.tasks.rebuild_answer_similarity_index.delay")
+    def test_get_without_index_requests_one_rebuild(self, mock_delay):
+        self._answer([10, 10, 10])
+
+        with self.captureOnCommitCallbacks(execute=True):
+            first = AnswerSimilarityIndex.get()
+            second = AnswerSimilarityIndex.get()
+
+        self.assertEqual(first.answer_uuids, [])
+        self.assertEqual(second.find_candidates({}, 10), [])
+        self.assertFalse(list(first.directory.glob("*")))
+        mock_delay.assert_called_once()
+
+    def test_get_survives_a_missing_matrix(self):
+        self._answer([10, 10, 10])
+        index = AnswerSimilarityIndex.rebuild()
+        AnswerSimilarityIndex._current = None
+        (
+            index.directory
+            / f"{AnswerSimilarityIndex.vectors_prefix}{index.build_id}.npy"
+        ).unlink()
+
+        with patch("core.tasks.rebuild_answer_similarity_index.delay"):
+            self.assertEqual(AnswerSimilarityIndex.get().answer_uuids, [])
+
+        AnswerSimilarityIndex._current = index
+        self.assertIs(AnswerSimilarityIndex.get(), index)
+
+    def test_find_candidates_orders_by_distance_and_excludes(self):
+        near = self._answer([12, 8, 10])
+        far = self._answer([-90, -90, -90])
+        partial = self._answer([None, None, 40])
+        excluded = self._answer([10, 10, 10])
+        index = AnswerSimilarityIndex.rebuild()
+        source = near.get_mapped_for_calculation()
+
+        candidates = index.find_candidates(
+            source,
+            10,
+            exclude_user_ids=[excluded.completed_by_id],
+            exclude_answer_uuids=[near.uuid.hex],
+        )
+
+        self.assertEqual(candidates, [partial.uuid.hex, far.uuid.hex])
+        self.assertEqual(len(index.find_candidates(source, 1)), 1)
+        self.assertEqual(index.find_candidates({}, 10), [])
@@ -0,0 +1,55 @@
+from django.test import SimpleTestCase
+from ideology.services.calculation_dto import CalculationItem
+
+
+class CalculationItemTestCase(SimpleTestCase):
+    def test_as_dict_includes_all_fields(self):
+        item = CalculationItem(type="axis", value=10, complexity_uuid="c1")
+
+        self.assertEqual(
+            item.as_dict(),
+            {
+                "type": "axis",
+                "value": 10,
+                "is_indifferent": False,
+                "complexity_uuid": "c1",
+                "section_uuid": None,
+                "margin_left": 0,
+                "margin_right": 0,
+            },
+        )
+
+    def test_coerces_like_the_pydantic_model(self):
+        for fields, field, expected in (
+            ({"is_indifferent": "false"}, "is_indifferent", False),
+            ({"is_indifferent": 1}, "is_indifferent", True),
+            ({"margin_left": 5.0}, "margin_left", 5),
+            ({"margin_left": " 5 "}, "margin_left", 5),
+            ({"margin_right": True}, "margin_right", 1),
+        ):
+            with self.subTest(fields=fields):
+                item = CalculationItem(type="axis", value=10, **fields)
+                self.assertEqual(getattr(item, field), expected)
+                self.assertIs(type(getattr(item, field)), type(expected))
+
+    def test_rejects_values_the_pydantic_model_rejected(self):
+        for fields in (
+            {"is_indifferent": None},
+            {"is_indifferent": 2},
+            {"margin_left": None},
+            {"margin_left": 2.5},
+            {"margin_left": "five"},
+            {"complexity_uuid": 5},
+        ):
+            with self.subTest(fields=fields):
+                with self.assertRaises(ValueError):
+                    CalculationItem(type="axis", value=10, **fields)
+
+    def test_rejects_unknown_type(self):
+        with self.assertRaises(ValueError):
+            CalculationItem(type="section", value=1)
+
+    def test_uses_slots(self):
+        item = CalculationItem(type="conditioner", value="A")
+
+        self.assertFalse(hasattr(item, "__dict__"))
@@ -0,0 +1,117 @@
+from django.core.cache import cache
+from django.db import connection
+from django.db.models.signals import post_save
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+from ideology.factories import (
+    IdeologyAxisDefinitionFactory,
+    IdeologyConditionerDefinitionFactory,
+    IdeologyFactory,
+    IdeologySectionFactory,
+)
+from ideology.models import Ideology, IdeologyAxis, IdeologyAxisDefinition
+from ideology.services.ideology_vector_cache import IdeologyVectorCache
+
+
+class IdeologyVectorCacheTestCase(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.ideology = IdeologyFactory(add_tags__total=0, add_associations__total=0)
+        self.axis_definition = IdeologyAxisDefinitionFactory(
+            ideology=self.ideology, value=10, margin_left=0, margin_right=0
+        )
+        self.conditioner_definition = IdeologyConditionerDefinitionFactory(
+            ideology=self.ideology
+        )
+
+    def _fresh_ideology(self):
+        return Ideology.objects.get(pk=self.ideology.pk)
+
+    def test_second_read_hits_cache(self):
+        ideology = self._fresh_ideology()
+        expected = Ideology.objects.get_mapped_for_calculation([ideology])[ideology.pk]
+        self.assertEqual(ideology.get_mapped_for_calculation(), expected)
+
+        same_version = Ideology(pk=ideology.pk, vector_version=ideology.vector_version)
+        with self.assertNumQueries(1):
+            self.assertEqual(same_version.get_mapped_for_calculation(), expected)
+
+    def test_upsert_invalidates_and_rebuilds_on_commit(self):
+        self._fresh_ideology().get_mapped_for_calculation()
+
+        with self.captureOnCommitCallbacks(execute=True):
+            IdeologyAxisDefinition.objects.upsert(
+                self.ideology.uuid,
+                self.axis_definition.axis.uuid,
+                {"value": -40, "margin_left": 5, "margin_right": 5},
+            )
+
+        ideology = self._fresh_ideology()
+        with self.assertNumQueries(1):
+            mapped = ideology.get_mapped_for_calculation()
+        item = mapped[self.axis_definition.axis.uuid.hex]
+        self.assertEqual(item.value, -40)
+        self.assertEqual(item.margin_left, 5)
+
+    def test_definition_delete_invalidates(self):
+        self._fresh_ideology().get_mapped_for_calculation()
+
+        self.conditioner_definition.delete()
+
+        mapped = self._fresh_ideology().get_mapped_for_calculation()
+        self.assertNotIn(self.conditioner_definition.conditioner.uuid.hex, mapped)
+        self.assertIn(self.axis_definition.axis.uuid.hex, mapped)
+
+    def test_in_memory_ideology_follows_definition_changes(self):
+        self.ideology.get_mapped_for_calculation()
+
+        self.axis_definition.value = 99
+        self.axis_definition.save()
+
+        mapped = self.ideology.get_mapped_for_calculation()
+        self.assertEqual(mapped[self.axis_definition.axis.uuid.hex].value, 99)
+
+    def test_structure_change_invalidates(self):
+        self._fresh_ideology().get_mapped_for_calculation()
+        axis = self.axis_definition.axis
+        new_section = IdeologySectionFactory()
+
+        axis.section = new_section
+        axis.save()
+
+        mapped = self._fresh_ideology().get_mapped_for_calculation()
+        self.assertEqual(mapped[axis.uuid.hex].section_uuid, new_section.uuid.hex)
+
+    def test_definition_change_keeps_ideology_modified(self):
+        previous = self._fresh_ideology()
+
+        self.axis_definition.value = 50
+        self.axis_definition.save()
+
+        ideology = self._fresh_ideology()
+        self.assertEqual(ideology.modified, previous.modified)
+        self.assertNotEqual(ideology.vector_version, previous.vector_version)
+
+    def test_structure_change_does_not_update_ideologies(self):
+        modified = self._fresh_ideology().modified
+        axis = self.axis_definition.axis
+        axis.section = IdeologySectionFactory()
+
+        with CaptureQueriesContext(connection) as queries:
+            axis.save()
+
+        self.assertFalse(
+            any('UPDATE "ideology_ideology"' in query["sql"] for query in queries)
+        )
+        self.assertEqual(self._fresh_ideology().modified, modified)
+
+    def test_raw_structure_save_skips_invalidation(self):
+        version = IdeologyVectorCache.get_structure_version()
+        axis = self.axis_definition.axis
+
+        post_save.send(IdeologyAxis, instance=axis, created=False, raw=True)
+
+        self.assertEqual(IdeologyVectorCache.get_structure_version(), version)
+
+    def test_get_many_empty(self):
+        self.assertEqual(IdeologyVectorCache.get_many([]), {})
@@ -0,0 +1,92 @@
+from django.core.cache import cache
+from django.test import TestCase, override_settings
+from ideology.factories import (
+    CompletedAnswerFactory,
+    IdeologyAxisConditionerFactory,
+    IdeologyAxisFactory,
+    IdeologyConditionerFactory,
+    IdeologySectionConditionerFactory,
+    IdeologySectionFactory,
+)
+from ideology.services.structure_index import StructureIndex
+
+
+class StructureIndexTestCase(TestCase):
+    def setUp(self):
+        self.axis = IdeologyAxisFactory()
+        self.conditioner = IdeologyConditionerFactory()
+
+    def test_index_is_reused_between_calls(self):
+        index = StructureIndex.get()
+        # Only the shared version is read; the hierarchy is not reloaded.
+        with self.assertNumQueries(1):
+            self.assertIs(StructureIndex.get(), index)
+
+        self.assertEqual(
+            index.get_axis_hierarchy(self.axis.uuid.hex),
+            {
+                "section_uuid": self.axis.section.uuid.hex,
+                "complexity_uuid": self.axis.section.abstraction_complexity.uuid.hex,
+            },
+        )
+        self.assertIn(self.axis.section.uuid.hex, index.sections)
+        self.assertIn(
+            self.axis.section.abstraction_complexity.uuid.hex, index.complexities
+        )
+
+    def test_structure_save_refreshes_index(self):
+        index = StructureIndex.get()
+        new_axis = IdeologyAxisFactory()
+
+        refreshed = StructureIndex.get()
+
+        self.assertIsNot(refreshed, index)
+        self.assertIsNone(index.get_axis_hierarchy(new_axis.uuid.hex))
+        self.assertIsNotNone(refreshed.get_axis_hierarchy(new_axis.uuid.hex))
+
+    def test_version_bump_from_other_process_refreshes_index(self):
+        index = StructureIndex.get()
+        StructureIndex.invalidate()
+        # The other worker neither shares this process' index nor its cache.
+        StructureIndex._current = index
+        cache.clear()
+
+        self.assertIsNot(StructureIndex.get(), index)
+
+    @override_settings(STRUCTURE_INDEX_TTL=-1)
+    def test_expired_index_is_reloaded(self):
+        index = StructureIndex.get()
+        self.assertIsNot(StructureIndex.get(), index)
+
+    def test_conditioner_complexity_prefers_section_rules(self):
+        axis_rule = IdeologyAxisConditionerFactory(conditioner=self.conditioner)
+        self.assertEqual(
+            StructureIndex.get().get_conditioner_complexity(self.conditioner.uuid.hex),
+            axis_rule.axis.section.abstraction_complexity.uuid.hex,
+        )
+
+        section_rule = IdeologySectionConditionerFactory(
+            conditioner=self.conditioner, section=IdeologySectionFactory()
+        )
+        self.assertEqual(
+            StructureIndex.get().get_conditioner_complexity(self.conditioner.uuid.hex),
+            section_rule.section.abstraction_complexity.uuid.hex,
+        )
+
+    def test_completed_answer_mapping_uses_no_queries(self):
+        IdeologySectionConditionerFactory(conditioner=self.conditioner)
+        completed_answer = CompletedAnswerFactory(
+            answers={
+                "axis": [{"uuid": self.axis.uuid.hex, "value": 10}],
+                "conditioners": [{"uuid": self.conditioner.uuid.hex, "value": "A"}],
+            }
+        )
+        structure = StructureIndex.get()
+
+        with self.assertNumQueries(0):
+            mapped = completed_answer.get_mapped_for_calculation(structure)
+
+        self.assertEqual(
+            mapped[self.axis.uuid.hex].section_uuid, self.axis.section.uuid.hex
+        )
+        self.assertIsNotNone(mapped[self.conditioner.uuid.hex].complexity_uuid)